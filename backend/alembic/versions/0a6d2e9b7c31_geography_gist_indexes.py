@@ -0,0 +1,46 @@
+"""geography gist indexes
+
+Revision ID: 0a6d2e9b7c31
+Revises: f7b3c9e04a12
+Create Date: 2026-10-16 13:41:26.118590
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a6d2e9b7c31'
+down_revision: Union[str, Sequence[str], None] = 'f7b3c9e04a12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, longitude column, latitude column); the expression must match
+# app.db.models.geography_point for the planner to use the index
+GEOGRAPHY_INDEXES = (
+    ('idx_destinations_location_gist', 'destinations', 'longitude', 'latitude'),
+    ('idx_activities_location_gist', 'activities', 'longitude', 'latitude'),
+    ('idx_accommodations_location_gist', 'accommodations', 'longitude', 'latitude'),
+    ('idx_transportations_departure_gist', 'transportations', 'departure_long', 'departure_lat'),
+    ('idx_transportations_arrival_gist', 'transportations', 'arrival_long', 'arrival_lat'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS postgis')
+    with op.get_context().autocommit_block():
+        for name, table, lon, lat in GEOGRAPHY_INDEXES:
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} '
+                f'USING gist ((geography(ST_SetSRID(ST_MakePoint({lon}, {lat}), 4326))))'
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, lon, lat in GEOGRAPHY_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,42 @@
+"""generated duration columns
+
+Revision ID: 1c8f5a3e9b27
+Revises: 0a6d2e9b7c31
+Create Date: 2026-10-16 14:02:37.504118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1c8f5a3e9b27'
+down_revision: Union[str, Sequence[str], None] = '0a6d2e9b7c31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Adding a stored generated column rewrites the table once to fill it in
+    op.add_column('itineraries', sa.Column(
+        'duration_days',
+        sa.Integer(),
+        sa.Computed('CAST(EXTRACT(DAY FROM end_date - start_date) AS integer)', persisted=True),
+    ))
+    op.add_column('transportations', sa.Column(
+        'duration_hours',
+        sa.Float(),
+        sa.Computed(
+            'CAST(EXTRACT(EPOCH FROM arrival_time - departure_time) / 3600 AS double precision)',
+            persisted=True
+        ),
+    ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('transportations', 'duration_hours')
+    op.drop_column('itineraries', 'duration_days')
@@ -0,0 +1,40 @@
+"""audit timestamp server defaults
+
+Revision ID: 2e4a7d9c1f53
+Revises: 1c8f5a3e9b27
+Create Date: 2026-10-16 14:31:09.672845
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2e4a7d9c1f53'
+down_revision: Union[str, Sequence[str], None] = '1c8f5a3e9b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables using AuditMixin
+TABLES = (
+    'users',
+    'itineraries',
+    'destinations',
+    'accommodations',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, 'created_at', server_default=sa.func.now())
+        op.alter_column(table, 'updated_at', server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, 'created_at', server_default=None)
+        op.alter_column(table, 'updated_at', server_default=None)
@@ -0,0 +1,56 @@
+"""username charset check
+
+Revision ID: 3b6d1f8a0e42
+Revises: 2e4a7d9c1f53
+Create Date: 2026-10-16 14:52:44.381067
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b6d1f8a0e42'
+down_revision: Union[str, Sequence[str], None] = '2e4a7d9c1f53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A CHECK applies to every UPDATE of a row, so usernames that break the rule
+    # are rewritten first or those users could not be updated at all. Each one is
+    # lowercased with other characters mapped to "_"; a short id suffix is added
+    # when that name is taken, repeated or too short. Not reversed on downgrade.
+    op.execute(r"""
+        WITH cleaned AS (
+            SELECT id, regexp_replace(lower(btrim(username)), '[^a-z0-9_]', '_', 'g') AS name
+            FROM users
+            WHERE username !~ '^[a-z0-9_]+$'
+        ), ranked AS (
+            SELECT id, name, count(*) OVER (PARTITION BY name) AS repeats FROM cleaned
+        )
+        UPDATE users u
+        SET username = CASE
+            WHEN r.repeats = 1 AND length(r.name) BETWEEN 3 AND 50
+                 AND NOT EXISTS (SELECT 1 FROM users o WHERE o.username = r.name)
+            THEN r.name
+            ELSE left(r.name, 41) || '_' || right(replace(u.id::text, '-', ''), 8)
+        END
+        FROM ranked r
+        WHERE u.id = r.id
+    """)
+    # NOT VALID adds the constraint without a long lock; VALIDATE then scans
+    # under a lock that still allows reads and writes
+    op.execute(
+        "ALTER TABLE users ADD CONSTRAINT check_username_charset "
+        "CHECK (username ~ '^[a-z0-9_]+$') NOT VALID"
+    )
+    op.execute("ALTER TABLE users VALIDATE CONSTRAINT check_username_charset")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('check_username_charset', 'users', type_='check')
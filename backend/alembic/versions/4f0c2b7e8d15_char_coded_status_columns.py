@@ -0,0 +1,65 @@
+"""char coded status columns
+
+Revision ID: 4f0c2b7e8d15
+Revises: 3b6d1f8a0e42
+Create Date: 2026-10-16 15:18:02.947531
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f0c2b7e8d15'
+down_revision: Union[str, Sequence[str], None] = '3b6d1f8a0e42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, enum type, check constraint, {enum label: code}); the codes
+# must match the *_CODES maps in app.db.models
+CODED_COLUMNS = (
+    ('users', 'status', 'userstatus', 'check_user_status',
+     {'ACTIVE': 'A', 'INACTIVE': 'I', 'SUSPENDED': 'S'}),
+    ('itineraries', 'status', 'itinerarystatus', 'check_itinerary_status',
+     {'DRAFT': 'D', 'GENERATED': 'G', 'BOOKED': 'B', 'CANCELLED': 'X', 'COMPLETED': 'C'}),
+    ('bookings', 'status', 'bookingstatus', 'check_booking_status',
+     {'PENDING': 'P', 'CONFIRMED': 'F', 'CANCELLED': 'X', 'COMPLETED': 'C'}),
+    ('bookings', 'item_type', 'bookingitemtype', 'check_booking_item_type',
+     {'DESTINATION': 'D', 'ACTIVITY': 'A', 'ACCOMMODATION': 'H', 'TRANSPORTATION': 'T'}),
+    ('reviews', 'item_type', 'itemtype', 'check_review_item_type',
+     {'DESTINATION': 'D', 'ACTIVITY': 'A', 'ACCOMMODATION': 'H', 'TRANSPORTATION': 'T'}),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, enum_name, check_name, codes in CODED_COLUMNS:
+        # upper() also maps rows written by value ('active') rather than label
+        whens = ' '.join(f"WHEN '{label}' THEN '{code}'" for label, code in codes.items())
+        op.alter_column(table, column, server_default=None)
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} TYPE char(1) '
+            f'USING CASE upper({column}::text) {whens} END'
+        )
+        allowed = ', '.join(f"'{code}'" for code in codes.values())
+        op.create_check_constraint(check_name, table, f'{column} IN ({allowed})')
+    op.alter_column('users', 'status', server_default='A')
+    for _, _, enum_name, _, _ in CODED_COLUMNS:
+        op.execute(f'DROP TYPE IF EXISTS {enum_name}')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('users', 'status', server_default=None)
+    for table, column, enum_name, check_name, codes in CODED_COLUMNS:
+        postgresql.ENUM(*codes, name=enum_name).create(op.get_bind(), checkfirst=True)
+        op.drop_constraint(check_name, table, type_='check')
+        whens = ' '.join(f"WHEN '{code}' THEN '{label}'" for label, code in codes.items())
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} TYPE {enum_name} '
+            f'USING (CASE {column} {whens} END)::{enum_name}'
+        )
+    op.alter_column('users', 'status', server_default=sa.text("'ACTIVE'::userstatus"))
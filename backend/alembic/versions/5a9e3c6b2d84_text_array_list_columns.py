@@ -0,0 +1,68 @@
+"""text array list columns
+
+Revision ID: 5a9e3c6b2d84
+Revises: 4f0c2b7e8d15
+Create Date: 2026-10-16 15:47:21.308926
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a9e3c6b2d84'
+down_revision: Union[str, Sequence[str], None] = '4f0c2b7e8d15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIST_COLUMNS = (
+    ('itineraries', 'tags'),
+    ('destinations', 'images'),
+    ('activities', 'images'),
+    ('accommodations', 'images'),
+    ('accommodations', 'amenities'),
+    ('reviews', 'images'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ALTER ... USING cannot take a subquery, so unnest through a session-local
+    # function; a bare JSON string becomes a one-element array
+    op.execute(
+        """
+        CREATE FUNCTION pg_temp.json_to_text_array(j json) RETURNS text[]
+        LANGUAGE sql IMMUTABLE AS $$
+            SELECT CASE json_typeof(j)
+                WHEN 'array' THEN ARRAY(SELECT json_array_elements_text(j))
+                WHEN 'string' THEN ARRAY[j #>> '{}']
+            END
+        $$
+        """
+    )
+    for table, column in LIST_COLUMNS:
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} TYPE text[] '
+            f'USING pg_temp.json_to_text_array({column}::json)'
+        )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_accommodations_amenities_gin', 'accommodations', ['amenities'],
+            postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_accommodations_amenities_gin', table_name='accommodations',
+            postgresql_concurrently=True, if_exists=True
+        )
+    for table, column in LIST_COLUMNS:
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} TYPE json '
+            f'USING to_json({column})'
+        )
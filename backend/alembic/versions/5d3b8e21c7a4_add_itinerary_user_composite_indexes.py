@@ -0,0 +1,40 @@
+"""add composite user indexes on itineraries
+
+Revision ID: 5d3b8e21c7a4
+Revises: 1cdc43eeba2d
+Create Date: 2026-10-16 10:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d3b8e21c7a4'
+down_revision: Union[str, Sequence[str], None] = '1cdc43eeba2d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Listing columns carried in the created_at index so the compact itinerary
+# listing is answered by an index-only scan
+LISTING_COLUMNS = ['id', 'name', 'start_date', 'end_date', 'status', 'budget']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction, and avoids locking writes
+    # to itineraries while the indexes build. Every per-user read filters
+    # is_deleted IS false, so soft-deleted rows are left out of both
+    with op.get_context().autocommit_block():
+        op.create_index('idx_itineraries_user_status', 'itineraries', ['user_id', 'status'], unique=False, postgresql_where=sa.text('is_deleted IS false'), postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_itineraries_user_created_at', 'itineraries', ['user_id', 'created_at'], unique=False, postgresql_include=LISTING_COLUMNS, postgresql_where=sa.text('is_deleted IS false'), postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_itineraries_user_created_at', table_name='itineraries', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_itineraries_user_status', table_name='itineraries', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,58 @@
+"""uuid v7 primary keys
+
+Revision ID: 8b5f2d7a4e91
+Revises: 5a9e3c6b2d84
+Create Date: 2026-10-16 17:02:15.480337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b5f2d7a4e91'
+down_revision: Union[str, Sequence[str], None] = '5a9e3c6b2d84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = (
+    'users',
+    'itineraries',
+    'destinations',
+    'activities',
+    'accommodations',
+    'transportations',
+    'bookings',
+    'reviews',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Same definition as app.db.models.UUID_V7_FUNCTION
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uuid_v7() RETURNS uuid
+        LANGUAGE sql VOLATILE AS $$
+            SELECT encode(
+                set_bit(set_bit(
+                    overlay(uuid_send(gen_random_uuid())
+                        placing substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                        FROM 1 FOR 6),
+                    52, 1), 53, 1),
+                'hex')::uuid
+        $$
+        """
+    )
+    # Existing v4 ids stay as they are; only new rows get time-ordered ids
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('uuid_v7()'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+    op.execute('DROP FUNCTION IF EXISTS uuid_v7()')
@@ -0,0 +1,46 @@
+"""drop redundant link itinerary indexes
+
+Revision ID: 9c3a6e1f5d28
+Revises: 8b5f2d7a4e91
+Create Date: 2026-10-16 17:40:58.213094
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3a6e1f5d28'
+down_revision: Union[str, Sequence[str], None] = '8b5f2d7a4e91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Each link table's primary key is (itinerary_id, <item>_id), which already
+# serves lookups by itinerary_id
+LINK_INDEXES = (
+    ('idx_itinerary_destinations_itinerary', 'itinerary_destinations'),
+    ('idx_itinerary_activities_itinerary', 'itinerary_activities'),
+    ('idx_itinerary_accommodations_itinerary', 'itinerary_accommodations'),
+    ('idx_itinerary_transportations_itinerary', 'itinerary_transportations'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table in LINK_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+        # Duplicates of the unique ix_users_username / ix_users_email indexes
+        op.drop_index('idx_users_username', table_name='users', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_users_email', table_name='users', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('idx_users_email', 'users', ['email'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_users_username', 'users', ['username'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        for name, table in LINK_INDEXES:
+            op.create_index(name, table, ['itinerary_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
@@ -0,0 +1,43 @@
+"""server side uuid primary keys
+
+Revision ID: b7c41f9a2d36
+Revises: 5d3b8e21c7a4
+Create Date: 2026-10-16 11:04:52.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c41f9a2d36'
+down_revision: Union[str, Sequence[str], None] = '5d3b8e21c7a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = (
+    'users',
+    'itineraries',
+    'destinations',
+    'activities',
+    'accommodations',
+    'transportations',
+    'bookings',
+    'reviews',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # gen_random_uuid() is built in from Postgres 13; pgcrypto provides it on older servers
+    op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
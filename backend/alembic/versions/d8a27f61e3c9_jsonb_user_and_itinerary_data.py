@@ -0,0 +1,48 @@
+"""jsonb user and itinerary data
+
+Revision ID: d8a27f61e3c9
+Revises: b7c41f9a2d36
+Create Date: 2026-10-16 12:20:38.904417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a27f61e3c9'
+down_revision: Union[str, Sequence[str], None] = 'b7c41f9a2d36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    ('users', 'preferences'),
+    ('users', 'travel_history'),
+    ('users', 'profile_data'),
+    ('itineraries', 'data'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_type=postgresql.JSON(astext_type=sa.Text()),
+            postgresql_using=f'{column}::jsonb',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSON(astext_type=sa.Text()),
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            postgresql_using=f'{column}::json',
+        )
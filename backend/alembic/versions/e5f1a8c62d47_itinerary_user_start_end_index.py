@@ -0,0 +1,38 @@
+"""itinerary user start end index
+
+Revision ID: e5f1a8c62d47
+Revises: d8a27f61e3c9
+Create Date: 2026-10-16 13:02:15.731846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f1a8c62d47'
+down_revision: Union[str, Sequence[str], None] = 'd8a27f61e3c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Build the replacement before dropping the indexes it covers; like the
+    # other per-user itinerary indexes it only covers live rows
+    with op.get_context().autocommit_block():
+        op.create_index('idx_itineraries_user_start_end', 'itineraries', ['user_id', 'start_date', 'end_date'], unique=False, postgresql_where=sa.text('is_deleted IS false'), postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('idx_itineraries_user_id', table_name='itineraries', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_itineraries_status', table_name='itineraries', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_itineraries_dates', table_name='itineraries', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('idx_itineraries_dates', 'itineraries', ['start_date', 'end_date'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_itineraries_status', 'itineraries', ['status'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_itineraries_user_id', 'itineraries', ['user_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('idx_itineraries_user_start_end', table_name='itineraries', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,37 @@
+"""booking user date status index
+
+Revision ID: f7b3c9e04a12
+Revises: e5f1a8c62d47
+Create Date: 2026-10-16 13:15:44.207193
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7b3c9e04a12'
+down_revision: Union[str, Sequence[str], None] = 'e5f1a8c62d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Build the replacement before dropping the indexes it covers
+    with op.get_context().autocommit_block():
+        op.create_index('idx_bookings_user_date_status', 'bookings', ['user_id', 'booking_date', 'status'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('idx_bookings_user_id', table_name='bookings', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_bookings_booking_date', table_name='bookings', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_bookings_status', table_name='bookings', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('idx_bookings_status', 'bookings', ['status'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_bookings_booking_date', 'bookings', ['booking_date'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('idx_bookings_user_id', 'bookings', ['user_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('idx_bookings_user_date_status', table_name='bookings', postgresql_concurrently=True, if_exists=True)
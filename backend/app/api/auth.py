@@ -2,7 +2,6 @@ from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
 import time
 from contextlib import asynccontextmanager
 from typing import Optional, Dict, Any
@@ -15,13 +14,17 @@ from app.core.security import (
     create_refresh_token,
     ACCESS_TOKEN_EXPIRE_MINUTES,
     REFRESH_TOKEN_EXPIRE_MINUTES,
+    SecurityService,
     get_current_user,
     get_password_hash,
+    oauth2_scheme,
+    run_password_hashing,
     verify_password,
 )
 from app.db.session import get_db_session
 from app.db.models import User
-from app.api.schemas import Token, UserRead
+from app.db.crud import create_user
+from app.api.schemas import Token, UserRead, normalize_username
 
 # Set up logging
 logger = structlog.get_logger(__name__)
@@ -59,9 +62,7 @@ class RegisterRequest(BaseModel):
     @field_validator('username')
     @classmethod
     def validate_username(cls, v):
-        if not v or not v.strip():
-            raise ValueError("Username cannot be empty")
-        return v.strip().lower()
+        return normalize_username(v)
     
     @field_validator('password')
     @classmethod
@@ -156,38 +157,15 @@ class AuthService:
     async def register_user(self, username: str, email: str, password: str) -> User:
         """Register a new user"""
         try:
-            # Check if username already exists
-            existing_user = await self.session.scalar(
-                select(User).where(User.username == username)
-            )
-            if existing_user:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Username already registered"
-                )
-            
-            # Check if email already exists
-            existing_email = await self.session.scalar(
-                select(User).where(User.email == email)
-            )
-            if existing_email:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already registered"
-                )
-            
-            # Create new user
-            hashed_password = get_password_hash(password)
-            new_user = User(
+            # Create new user; duplicates are rejected by the insert itself
+            hashed_password = await run_password_hashing(get_password_hash, password)
+            new_user = await create_user(
+                session=self.session,
                 username=username,
                 email=email,
                 password_hash=hashed_password
             )
             
-            self.session.add(new_user)
-            await self.session.commit()
-            await self.session.refresh(new_user)
-            
             logger.info(
                 "user_registered_in_service",
                 username=username,
@@ -393,17 +371,19 @@ async def refresh_token(
         401: {"description": "Invalid token"}
     },
     summary="User logout",
-    description="Logout user (invalidate token on client side)"
+    description="Logout user and revoke the access token"
 )
 async def logout(
     request: Request,
     current_user: User = Depends(get_current_user),
+    token: str = Depends(oauth2_scheme),
 ):
     """Logout user"""
     async with performance_timer("user_logout"):
         try:
-            # In a production system, you might want to blacklist the token
-            # For now, we just log the logout event
+            # Revoke the token so it is rejected until it expires
+            if not SecurityService.logout_user(token):
+                raise RuntimeError("token could not be revoked")
             logger.info(f"User {current_user.username} logged out", extra={
                 'user_id': str(current_user.id),
                 'ip_address': request.client.host if request.client else None
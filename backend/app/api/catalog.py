@@ -4,14 +4,15 @@ Catalog API endpoints for statistics and seeding status
 
 import logging
 from datetime import datetime
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db_session
+from app.db.session import get_readonly_db_session
+from app.db.crud import count_catalog_items, estimate_catalog_items, get_destination_list_compact
 from app.db.models import Destination, Activity, Accommodation, Transportation
-from app.api.schemas import CatalogStats, SeedingStatus
+from app.api.schemas import CatalogStats, SeedingStatus, DestinationListItem
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -23,34 +24,27 @@ router = APIRouter()
         500: {"description": "Database error"}
     },
     summary="Get catalog statistics",
-    description="Retrieve statistics about the travel catalog including counts for all categories"
+    description="Retrieve statistics about the travel catalog including counts for all categories. "
+                "Counts are planner estimates unless exact=true"
 )
 async def get_catalog_stats(
-    session: AsyncSession = Depends(get_db_session)
+    exact: bool = Query(False, description="Count every row instead of using planner estimates"),
+    session: AsyncSession = Depends(get_readonly_db_session)
 ):
     """Get comprehensive catalog statistics"""
     try:
-        # Count all categories
-        destinations_count = await session.scalar(
-            func.count(Destination.id)
-        )
-        activities_count = await session.scalar(
-            func.count(Activity.id)
-        )
-        accommodations_count = await session.scalar(
-            func.count(Accommodation.id)
-        )
-        transportations_count = await session.scalar(
-            func.count(Transportation.id)
-        )
-        
-        total_items = destinations_count + activities_count + accommodations_count + transportations_count
+        # Count all categories in one round-trip
+        if exact:
+            counts = await count_catalog_items(session)
+        else:
+            counts = await estimate_catalog_items(session)
+        total_items = sum(counts.values())
         
         stats = CatalogStats(
-            destinations_count=destinations_count or 0,
-            activities_count=activities_count or 0,
-            accommodations_count=accommodations_count or 0,
-            transportations_count=transportations_count or 0,
+            destinations_count=counts["destinations"],
+            activities_count=counts["activities"],
+            accommodations_count=counts["accommodations"],
+            transportations_count=counts["transportations"],
             total_items=total_items,
             last_updated=datetime.utcnow()
         )
@@ -75,36 +69,23 @@ async def get_catalog_stats(
     description="Check if the database has been seeded and get seeding statistics"
 )
 async def get_seeding_status(
-    session: AsyncSession = Depends(get_db_session)
+    session: AsyncSession = Depends(get_readonly_db_session)
 ):
     """Get database seeding status and statistics"""
     try:
-        # Count seeded items
-        destinations_seeded = await session.scalar(
-            func.count(Destination.id)
-        )
-        activities_seeded = await session.scalar(
-            func.count(Activity.id)
-        )
-        accommodations_seeded = await session.scalar(
-            func.count(Accommodation.id)
-        )
-        transportations_seeded = await session.scalar(
-            func.count(Transportation.id)
-        )
-        
-        total_seeded = (destinations_seeded or 0) + (activities_seeded or 0) + \
-                      (accommodations_seeded or 0) + (transportations_seeded or 0)
+        # Count seeded items in one round-trip
+        counts = await count_catalog_items(session)
+        total_seeded = sum(counts.values())
         
         # Check if database is seeded (has at least some data)
         is_seeded = total_seeded > 0
         
         status_info = SeedingStatus(
             is_seeded=is_seeded,
-            destinations_seeded=destinations_seeded or 0,
-            activities_seeded=activities_seeded or 0,
-            accommodations_seeded=accommodations_seeded or 0,
-            transportations_seeded=transportations_seeded or 0,
+            destinations_seeded=counts["destinations"],
+            activities_seeded=counts["activities"],
+            accommodations_seeded=counts["accommodations"],
+            transportations_seeded=counts["transportations"],
             seeding_errors=0,  # Would need to track this separately
             last_seeding_time=None,  # Would need to track this separately
             seeding_log_file="seed_catalog.log" if is_seeded else None
@@ -120,6 +101,33 @@ async def get_seeding_status(
             detail="Failed to retrieve seeding status"
         )
 
+@router.get("/destinations",
+    response_model=List[DestinationListItem],
+    responses={
+        200: {"description": "Destinations retrieved successfully"},
+        500: {"description": "Database error"}
+    },
+    summary="List destinations",
+    description="Get a paginated list of destinations with their id, name, location and rating"
+)
+async def list_destinations(
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    session: AsyncSession = Depends(get_readonly_db_session)
+):
+    """Get a paginated, column-projected destination list"""
+    try:
+        return [
+            DestinationListItem(**row._mapping)
+            async for row in get_destination_list_compact(session, skip=skip, limit=limit)
+        ]
+    except Exception as e:
+        logger.error(f"Error listing destinations: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve destinations"
+        )
+
 @router.get("/destinations/count",
     responses={
         200: {"description": "Destination count retrieved successfully"},
@@ -129,7 +137,7 @@ async def get_seeding_status(
     description="Get the total number of destinations in the catalog"
 )
 async def get_destinations_count(
-    session: AsyncSession = Depends(get_db_session)
+    session: AsyncSession = Depends(get_readonly_db_session)
 ):
     """Get destinations count"""
     try:
@@ -151,7 +159,7 @@ async def get_destinations_count(
     description="Get the total number of activities in the catalog"
 )
 async def get_activities_count(
-    session: AsyncSession = Depends(get_db_session)
+    session: AsyncSession = Depends(get_readonly_db_session)
 ):
     """Get activities count"""
     try:
@@ -173,7 +181,7 @@ async def get_activities_count(
     description="Get the total number of accommodations in the catalog"
 )
 async def get_accommodations_count(
-    session: AsyncSession = Depends(get_db_session)
+    session: AsyncSession = Depends(get_readonly_db_session)
 ):
     """Get accommodations count"""
     try:
@@ -195,7 +203,7 @@ async def get_accommodations_count(
     description="Get the total number of transportations in the catalog"
 )
 async def get_transportations_count(
-    session: AsyncSession = Depends(get_db_session)
+    session: AsyncSession = Depends(get_readonly_db_session)
 ):
     """Get transportations count"""
     try:
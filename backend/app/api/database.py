@@ -21,12 +21,12 @@ router = APIRouter()
         503: {"description": "Database is unhealthy"}
     },
     summary="Database health check",
-    description="Check database connectivity and connection pool status"
+    description="Check database connectivity, and connection pool status with include_pool_stats"
 )
-async def get_database_health():
+async def get_database_health(include_pool_stats: bool = False):
     """Get comprehensive database health information"""
     try:
-        health_info = await database_health_check()
+        health_info = await database_health_check(include_pool_stats=include_pool_stats)
         
         # Return appropriate HTTP status based on health
         if health_info["status"] == "healthy":
@@ -87,6 +87,33 @@ async def get_database_statistics():
         )
 
 
+@router.get("/pool-stats",
+    responses={
+        200: {"description": "Connection pool counters"},
+        500: {"description": "Failed to retrieve pool counters"}
+    },
+    summary="Connection pool counters",
+    description="Get the live connection pool counters (admin endpoint)"
+)
+async def get_pool_statistics():
+    """Get connection pool counters (admin endpoint)"""
+    try:
+        pool_stats = db_manager.get_pool_stats()
+        if pool_stats is None:
+            return {
+                "status": "unavailable",
+                "message": "No PostgreSQL connection pool"
+            }
+        return pool_stats
+        
+    except Exception as e:
+        logger.error(f"Failed to retrieve pool statistics: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve pool statistics"
+        )
+
+
 @router.post("/initialize",
     responses={
         200: {"description": "Database initialized successfully"},
@@ -7,39 +7,41 @@ import logging
 import json
 from contextlib import asynccontextmanager
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status, Request
 from fastapi.encoders import jsonable_encoder
 from fastapi.concurrency import run_in_threadpool
-from geoalchemy2 import Geography
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, or_
-from sqlalchemy.orm import selectinload
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-import pickle, scipy.sparse
-from sklearn.metrics.pairwise import cosine_similarity
-
 from app.db.models import (
    User, Itinerary, ItineraryDestination, Destination, Activity, 
    ItineraryActivity, Accommodation, ItineraryAccommodation, 
-   Transportation, ItineraryTransportation
+   Transportation, ItineraryTransportation, geography_point
+)
+from app.core.recommender.artifacts import (
+   load_id_map, load_item_matrices, load_vectorizer, similarity_scores
 )
 from app.core.itinerary_optimizer import DestCoord, POI, time_aware_greedy_route
 from app.api.schemas import (
-   ItineraryCreate, ItineraryUpdate, ItineraryRead,
+   ItineraryCreate, ItineraryUpdate, ItineraryRead, ItineraryListItem,
    ReorderPreviewRequest, ReorderPreviewResponse,
    ItineraryDestinationRead, ItineraryActivityRead, 
    ItineraryAccommodationRead, ItineraryTransportationRead,
    RegenerateDayRequest, ShareLinkCreateResponse,
 )
-from app.db.session import get_db_session
+from app.db.session import fetch_rows_concurrently, get_db_session, get_readonly_db_session
 from app.core.security import get_current_user
 from app.db.crud import (
+   ITIN_LOADER_OPTS,
    create_itinerary, 
    get_itinerary,
-   get_itineraries,
    get_user_itineraries,
+   get_itinerary_owner_id,
+   get_itinerary_bookings_json,
+   get_user_itinerary_list_compact,
+   soft_delete_itinerary,
    update_itinerary_status,
    update_itinerary
 )
@@ -89,30 +91,30 @@ def load_ml_models():
     """Load ML models with proper error handling"""
     try:
         # Destination TF-IDF artifacts
-        dest_vectorizer = pickle.load(open("/app/models/tfidf_vectorizer_dest.pkl", "rb"))
-        dest_matrix = scipy.sparse.load_npz("/app/models/tfidf_matrix_dest.npz")
-        dest_id_map = pickle.load(open("/app/models/item_index_map_dest.pkl", "rb"))
+        dest_vectorizer = load_vectorizer("/app/models/tfidf_vectorizer_dest.pkl")
+        dest_matrix, dest_matrix_t = load_item_matrices("/app/models/tfidf_matrix_dest.npz")
+        dest_id_map = load_id_map("/app/models/item_index_map_dest.pkl")
         
         # Activity TF-IDF artifacts
-        act_vectorizer = pickle.load(open("/app/models/tfidf_vectorizer_act.pkl", "rb"))
-        act_matrix = scipy.sparse.load_npz("/app/models/tfidf_matrix_act.npz")
-        act_id_map = pickle.load(open("/app/models/item_index_map_act.pkl", "rb"))
+        act_vectorizer = load_vectorizer("/app/models/tfidf_vectorizer_act.pkl")
+        act_matrix, act_matrix_t = load_item_matrices("/app/models/tfidf_matrix_act.npz")
+        act_id_map = load_id_map("/app/models/item_index_map_act.pkl")
         
         # Accommodation TF-IDF artifacts
-        acc_vectorizer = pickle.load(open("/app/models/tfidf_vectorizer_acc.pkl", "rb"))
-        acc_matrix = scipy.sparse.load_npz("/app/models/tfidf_matrix_acc.npz")
-        acc_id_map = pickle.load(open("/app/models/item_index_map_acc.pkl", "rb"))
+        acc_vectorizer = load_vectorizer("/app/models/tfidf_vectorizer_acc.pkl")
+        acc_matrix, acc_matrix_t = load_item_matrices("/app/models/tfidf_matrix_acc.npz")
+        acc_id_map = load_id_map("/app/models/item_index_map_acc.pkl")
         
         # Transportation TF-IDF artifacts
-        trans_vectorizer = pickle.load(open("/app/models/tfidf_vectorizer_trans.pkl", "rb"))
-        trans_matrix = scipy.sparse.load_npz("/app/models/tfidf_matrix_trans.npz")
-        trans_id_map = pickle.load(open("/app/models/item_index_map_trans.pkl", "rb"))
+        trans_vectorizer = load_vectorizer("/app/models/tfidf_vectorizer_trans.pkl")
+        trans_matrix, trans_matrix_t = load_item_matrices("/app/models/tfidf_matrix_trans.npz")
+        trans_id_map = load_id_map("/app/models/item_index_map_trans.pkl")
         
         return {
-            'dest': (dest_vectorizer, dest_matrix, dest_id_map),
-            'act': (act_vectorizer, act_matrix, act_id_map),
-            'acc': (acc_vectorizer, acc_matrix, acc_id_map),
-            'trans': (trans_vectorizer, trans_matrix, trans_id_map)
+            'dest': (dest_vectorizer, dest_matrix, dest_id_map, dest_matrix_t),
+            'act': (act_vectorizer, act_matrix, act_id_map, act_matrix_t),
+            'acc': (acc_vectorizer, acc_matrix, acc_id_map, acc_matrix_t),
+            'trans': (trans_vectorizer, trans_matrix, trans_id_map, trans_matrix_t)
         }
     except Exception as e:
         logger.error(f"Failed to load ML models: {e}")
@@ -131,10 +133,10 @@ async def get_destination_ids(interests: List[str], budget: Optional[float]):
         raise HTTPException(status_code=500, detail="ML models not available")
     
     try:
-        vectorizer, item_matrix, id_map = ML_MODELS['dest']
+        vectorizer, item_matrix, id_map, item_matrix_t = ML_MODELS['dest']
         q = " ".join(interests or []) + f" budget {budget or 0}"
         v = vectorizer.transform([q])
-        scores = cosine_similarity(v, item_matrix).flatten()
+        scores = similarity_scores(v, item_matrix, item_matrix_t)
         top = scores.argsort()[::-1][:10]
         
         topk = [
@@ -157,7 +159,7 @@ async def get_destination_ids(interests: List[str], budget: Optional[float]):
         }
         logger.info("destination rank_topk %s", json.dumps(log_line, ensure_ascii=False))
         
-        return [id_map[i] for i in top]
+        return [str(id_map[i]) for i in top]
     except Exception as e:
         logger.error(f"Error getting destination recommendations: {e}")
         raise HTTPException(status_code=500, detail="Failed to get destination recommendations")
@@ -168,10 +170,10 @@ async def get_activity_ids(interests: List[str], budget: Optional[float]):
         raise HTTPException(status_code=500, detail="ML models not available")
     
     try:
-        vectorizer, item_matrix, id_map = ML_MODELS['act']
+        vectorizer, item_matrix, id_map, item_matrix_t = ML_MODELS['act']
         q = " ".join(interests or []) + f" budget {budget or 0}"
         v = vectorizer.transform([q])
-        scores = cosine_similarity(v, item_matrix).flatten()
+        scores = similarity_scores(v, item_matrix, item_matrix_t)
         top = scores.argsort()[::-1][:10]
         
         topk = [
@@ -195,7 +197,7 @@ async def get_activity_ids(interests: List[str], budget: Optional[float]):
         logger.info("activity rank_topk %s", json.dumps(log_line, ensure_ascii=False))
         
         
-        return [id_map[i] for i in top]
+        return [str(id_map[i]) for i in top]
     except Exception as e:
         logger.error(f"Error getting activity recommendations: {e}")
         raise HTTPException(status_code=500, detail="Failed to get activity recommendations")
@@ -206,10 +208,10 @@ async def get_accommodation_ids(interests: List[str], budget: Optional[float]):
         raise HTTPException(status_code=500, detail="ML models not available")
     
     try:
-        vectorizer, item_matrix, id_map = ML_MODELS['acc']
+        vectorizer, item_matrix, id_map, item_matrix_t = ML_MODELS['acc']
         q = " ".join(interests or []) + f" budget {budget or 0}"
         v = vectorizer.transform([q])
-        scores = cosine_similarity(v, item_matrix).flatten()
+        scores = similarity_scores(v, item_matrix, item_matrix_t)
         top = scores.argsort()[::-1][:10]
         
         topk = [
@@ -233,7 +235,7 @@ async def get_accommodation_ids(interests: List[str], budget: Optional[float]):
         logger.info("accomodation rank_topk %s", json.dumps(log_line, ensure_ascii=False))
         
         
-        return [id_map[i] for i in top if scores[i] > 0]
+        return [str(id_map[i]) for i in top if scores[i] > 0]
     except Exception as e:
         logger.error(f"Error getting accommodation recommendations: {e}")
         raise HTTPException(status_code=500, detail="Failed to get accommodation recommendations")
@@ -244,10 +246,10 @@ async def get_transportation_ids(interests: List[str], budget: Optional[float]):
         raise HTTPException(status_code=500, detail="ML models not available")
     
     try:
-        vectorizer, item_matrix, id_map = ML_MODELS['trans']
+        vectorizer, item_matrix, id_map, item_matrix_t = ML_MODELS['trans']
         q = " ".join(interests or []) + f" budget {budget or 0}"
         v = vectorizer.transform([q])
-        scores = cosine_similarity(v, item_matrix).flatten()
+        scores = similarity_scores(v, item_matrix, item_matrix_t)
         top = scores.argsort()[::-1][:10]
         
         topk = [
@@ -271,7 +273,7 @@ async def get_transportation_ids(interests: List[str], budget: Optional[float]):
         logger.info("destination rank_topk %s", json.dumps(log_line, ensure_ascii=False))
         
         
-        return [id_map[i] for i in top if scores[i] > 0]
+        return [str(id_map[i]) for i in top if scores[i] > 0]
     except Exception as e:
         logger.error(f"Error getting transportation recommendations: {e}")
         raise HTTPException(status_code=500, detail="Failed to get transportation recommendations")
@@ -358,24 +360,15 @@ class ItineraryService:
             origin_lat, origin_lon = origin_coords
             dest_lat, dest_lon = dest_coords
             
-            origin_pt = func.ST_SetSRID(
-                func.ST_MakePoint(origin_lon, origin_lat), 4326
-            ).cast(Geography)
-            dest_pt = func.ST_SetSRID(
-                func.ST_MakePoint(dest_lon, dest_lat), 4326
-            ).cast(Geography)
+            origin_pt = geography_point(origin_lon, origin_lat)
+            dest_pt = geography_point(dest_lon, dest_lat)
             
             origin_radius_m = radius_km * 1000
             dest_radius_m = radius_km * 1000
             
-            dep_geom = func.ST_SetSRID(
-                func.ST_MakePoint(Transportation.departure_long, Transportation.departure_lat),
-                4326
-            ).cast(Geography)
-            arr_geom = func.ST_SetSRID(
-                func.ST_MakePoint(Transportation.arrival_long, Transportation.arrival_lat),
-                4326
-            ).cast(Geography)
+            # Same expressions as the GiST indexes on transportations
+            dep_geom = geography_point(Transportation.departure_long, Transportation.departure_lat)
+            arr_geom = geography_point(Transportation.arrival_long, Transportation.arrival_lat)
             
             flight_start = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
             flight_end = end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
@@ -405,35 +398,20 @@ class ItineraryService:
 
         try:
             all_pois = []
+            center = geography_point(center_lon, center_lat)
             
-            # Get destinations
-            geom_dest = func.ST_SetSRID(
-                func.ST_MakePoint(Destination.longitude, Destination.latitude),
-                4326
-            ).cast(Geography)
+            # Get destinations; the point expressions match the GiST indexes
+            geom_dest = geography_point(Destination.longitude, Destination.latitude)
             dest_stmt = (
                 select(Destination.id, Destination.latitude, Destination.longitude)
                 .where(
                     Destination.id.in_(dest_ids),
-                    func.ST_DWithin(geom_dest, func.ST_SetSRID(func.ST_MakePoint(center_lon, center_lat), 4326)
-                                    .cast(Geography), radius_m)
+                    func.ST_DWithin(geom_dest, center, radius_m)
                 )
             )
-            dest_rows = (await self.session.execute(dest_stmt)).all()
-            
-            for _id, lat, lon in dest_rows:
-                all_pois.append(POI(
-                    id=_id, latitude=lat, longitude=lon,
-                    opens=datetime.combine(start_date.date(), TimeOfDay(9, 0), tzinfo=start_date.tzinfo),
-                    closes=datetime.combine(start_date.date(), TimeOfDay(17, 0), tzinfo=start_date.tzinfo),
-                    duration=120, type="destination", price=None,
-                ))
             
             # Get activities
-            geom_act = func.ST_SetSRID(
-                func.ST_MakePoint(Activity.longitude, Activity.latitude),
-                4326
-            ).cast(Geography)
+            geom_act = geography_point(Activity.longitude, Activity.latitude)
             act_stmt = (
                 select(
                     Activity.id,
@@ -445,14 +423,48 @@ class ItineraryService:
                 )
                 .where(
                     Activity.id.in_(act_ids),
-                    func.ST_DWithin(
-                        geom_act,
-                        func.ST_SetSRID(func.ST_MakePoint(center_lon, center_lat), 4326).cast(Geography),
-                        radius_m,
-                    ),
+                    func.ST_DWithin(geom_act, center, radius_m),
+                )
+            )
+
+            # Get accommodations
+            geom_acc = geography_point(Accommodation.longitude, Accommodation.latitude)
+            acc_stmt = (
+                select(Accommodation.id, Accommodation.latitude, 
+                       Accommodation.longitude, Accommodation.price)
+                .where(
+                    Accommodation.rating >= 3.5,
+                    func.ST_DWithin(geom_acc, center, radius_m)
                 )
+                .order_by(Accommodation.rating.desc())
+                .limit(30)  # Increased limit for better selection
             )
-            act_rows = (await self.session.execute(act_stmt)).all()
+
+            # Get transportation
+            trans_stmt = (
+                select(
+                    Transportation.id, Transportation.departure_lat, Transportation.departure_long,
+                    Transportation.arrival_lat, Transportation.arrival_long,
+                    Transportation.departure_time, Transportation.arrival_time,
+                    Transportation.price
+                ).where(Transportation.id.in_(trans_ids))
+                if trans_ids else None
+            )
+
+            # The four lookups are independent, so they run concurrently, each on
+            # its own pooled connection
+            dest_rows, act_rows, acc_rows, trans_rows = await fetch_rows_concurrently(
+                dest_stmt, act_stmt, acc_stmt, trans_stmt
+            )
+            
+            for _id, lat, lon in dest_rows:
+                all_pois.append(POI(
+                    id=_id, latitude=lat, longitude=lon,
+                    opens=datetime.combine(start_date.date(), TimeOfDay(9, 0), tzinfo=start_date.tzinfo),
+                    closes=datetime.combine(start_date.date(), TimeOfDay(17, 0), tzinfo=start_date.tzinfo),
+                    duration=120, type="destination", price=None,
+                ))
+            
             logger.info(f"Recommended activity IDs: {act_ids}")
             logger.info(f"Fetched {len(act_rows)} activity rows: {[row[0] for row in act_rows]}")
             logger.info(f"Activity location filter: center=({center_lat},{center_lon}), radius_m={radius_m}")
@@ -493,23 +505,6 @@ class ItineraryService:
             all_pois = filtered_pois
             logger.info(f"Activities after budget filter: {len([p for p in all_pois if p.type == 'activity'])} (before: {n_before_budget})")
 
-            # Get accommodations
-            geom_acc = func.ST_SetSRID(
-                func.ST_MakePoint(Accommodation.longitude, Accommodation.latitude),
-                4326
-            ).cast(Geography)
-            acc_stmt = (
-                select(Accommodation.id, Accommodation.latitude, 
-                       Accommodation.longitude, Accommodation.price)
-                .where(
-                    Accommodation.rating >= 3.5,
-                    func.ST_DWithin(geom_acc, func.ST_SetSRID(func.ST_MakePoint(center_lon, center_lat), 4326).cast(Geography), radius_m)
-                )
-                .order_by(Accommodation.rating.desc())
-                .limit(30)  # Increased limit for better selection
-            )
-            acc_rows = (await self.session.execute(acc_stmt)).all()
-            
             for _id, lat, lon, price in acc_rows:
                 all_pois.append(POI(
                     id=_id, latitude=lat, longitude=lon,
@@ -519,25 +514,15 @@ class ItineraryService:
                     price=price if price is not None else 0.0,
                 ))
             
-            # Get transportation
-            if trans_ids:
-                trans_stmt = select(
-                    Transportation.id, Transportation.departure_lat, Transportation.departure_long,
-                    Transportation.arrival_lat, Transportation.arrival_long,
-                    Transportation.departure_time, Transportation.arrival_time,
-                    Transportation.price
-                ).where(Transportation.id.in_(trans_ids))
-                
-                trans_rows = (await self.session.execute(trans_stmt)).all()
-                for (_id, dlat, dlon, alat, alon, dt, at, price) in trans_rows:
-                    dur_min = int((at - dt).total_seconds() / 60)
-                    all_pois.append(POI(
-                        id=_id, latitude=dlat, longitude=dlon,
-                        opens=dt.astimezone(start_date.tzinfo), 
-                        closes=at.astimezone(start_date.tzinfo),
-                        duration=dur_min, type="transportation",
-                        price=price if price is not None else 0.0
-                    ))
+            for (_id, dlat, dlon, alat, alon, dt, at, price) in trans_rows:
+                dur_min = int((at - dt).total_seconds() / 60)
+                all_pois.append(POI(
+                    id=_id, latitude=dlat, longitude=dlon,
+                    opens=dt.astimezone(start_date.tzinfo), 
+                    closes=at.astimezone(start_date.tzinfo),
+                    duration=dur_min, type="transportation",
+                    price=price if price is not None else 0.0
+                ))
             
             # Filter by budget
             all_pois = [
@@ -737,12 +722,7 @@ class ItineraryService:
             full_itin = (await self.session.execute(
                 select(Itinerary)
                 .where(Itinerary.id == itin_id)
-                .options(
-                    selectinload(Itinerary.dest_links).selectinload(ItineraryDestination.destination),
-                    selectinload(Itinerary.act_links).selectinload(ItineraryActivity.activity),
-                    selectinload(Itinerary.accom_links).selectinload(ItineraryAccommodation.accommodation),
-                    selectinload(Itinerary.trans_links).selectinload(ItineraryTransportation.transportation),
-                )
+                .options(*ITIN_LOADER_OPTS)
             )).scalar_one()
             
             logger.info(f"Itinerary {itin_id} persisted successfully")
@@ -818,9 +798,6 @@ async def generate_itinerary(
             # Build POI list
             radius_km = parsed.get("radius_km", 20)
             radius_m = radius_km * 1000
-            center_pt = func.ST_SetSRID(
-                func.ST_MakePoint(dest_center_lon, dest_center_lat), 4326
-            ).cast(Geography)
             
             # Adaptive radius: try increasing if too few activities found
             min_activities = 3
@@ -868,6 +845,23 @@ async def generate_itinerary(
             logger.error(f"Unexpected error in itinerary generation: {e}")
             raise HTTPException(status_code=500, detail="Failed to generate itinerary")
 
+@router.get("/compact", response_model=List[ItineraryListItem])
+@limiter.limit("30/minute")
+async def list_itineraries_compact(
+    request: Request,
+    skip: int = Query(0, ge=0, description="Number of itineraries to skip"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of itineraries to return"),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session)
+):
+    """List the current user's itineraries without their data, notes or links"""
+    return [
+        ItineraryListItem(**row._mapping)
+        async for row in get_user_itinerary_list_compact(
+            session, user_id=current_user.id, skip=skip, limit=limit
+        )
+    ]
+
 @router.get("/{itinerary_id}", response_model=ItineraryRead)
 @limiter.limit("60/minute")
 async def read_itinerary(
@@ -995,6 +989,28 @@ async def regenerate_day(
     return ItineraryRead(**itin_dict)
 
 
+@router.get("/{itinerary_id}/bookings")
+@limiter.limit("30/minute")
+async def list_itinerary_bookings(
+    request: Request,
+    itinerary_id: UUID,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_readonly_db_session)
+):
+    """List an itinerary's bookings, newest first."""
+    owner_id = await get_itinerary_owner_id(session, itinerary_id)
+    if owner_id is None:
+        raise HTTPException(status_code=404, detail="Itinerary not found")
+    if owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized to access this itinerary")
+
+    # The body is already a JSON array built by Postgres; pass it through as is
+    body = await get_itinerary_bookings_json(session, itinerary_id, skip=skip, limit=limit)
+    return Response(content=body, media_type="application/json")
+
+
 @router.post("/{itinerary_id}/share-link", response_model=ShareLinkCreateResponse)
 @limiter.limit("5/minute")
 async def create_share_link(
@@ -1004,8 +1020,11 @@ async def create_share_link(
     session: AsyncSession = Depends(get_db_session)
 ):
     """Create a tokenized public share link for an itinerary."""
-    itin = await get_itinerary(session, itinerary_id)
-    if itin.user_id != current_user.id:
+    # Only the owner is needed here, not the itinerary and its links
+    owner_id = await get_itinerary_owner_id(session, itinerary_id)
+    if owner_id is None:
+        raise HTTPException(status_code=404, detail="Itinerary not found")
+    if owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to share this itinerary")
 
     token = uuid4().hex
@@ -1073,11 +1092,16 @@ async def read_shared_itinerary(
 @limiter.limit("30/minute")
 async def list_itineraries(
     request: Request,
+    skip: int = Query(0, ge=0, description="Number of itineraries to skip"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of itineraries to return"),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_db_session)
 ):
-    itineraries = await get_user_itineraries(session, user_id=current_user.id)
-    return itineraries
+    return [
+        itin async for itin in get_user_itineraries(
+            session, user_id=current_user.id, skip=skip, limit=limit
+        )
+    ]
 
 
 @router.patch("/{itinerary_id}", response_model=Itinerary)
@@ -1089,10 +1113,18 @@ async def patch_itinerary_status(
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_db_session)
 ):
-    itin = await get_itinerary(session, itinerary_id)
-    if itin.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized to update this itinerary")
-    return await update_itinerary_status(itinerary_id, payload.status, session)
+    itin = await update_itinerary_status(
+        session, itinerary_id, payload.status, owner_id=current_user.id
+    )
+    if itin is None:
+        # Only a failed update pays for working out why it failed
+        owner_id = await get_itinerary_owner_id(session, itinerary_id)
+        if owner_id is None:
+            raise HTTPException(status_code=404, detail="Itinerary not found")
+        if owner_id != current_user.id:
+            raise HTTPException(status_code=403, detail="Not authorized to update this itinerary")
+        raise HTTPException(status_code=500, detail="Failed to update itinerary status")
+    return itin
 
 @router.delete("/{itinerary_id}", status_code=204)
 @limiter.limit("10/minute")
@@ -1102,10 +1134,14 @@ async def remove_itinerary(
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_db_session)
 ):
-    itin = await get_itinerary(session, itinerary_id)
-    if itin.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized to delete this itinerary")
-    await delete_itinerary(itinerary_id, session)
+    deleted = await soft_delete_itinerary(session, itinerary_id, owner_id=current_user.id)
+    if not deleted:
+        owner_id = await get_itinerary_owner_id(session, itinerary_id)
+        if owner_id is None:
+            raise HTTPException(status_code=404, detail="Itinerary not found")
+        if owner_id != current_user.id:
+            raise HTTPException(status_code=403, detail="Not authorized to delete this itinerary")
+        raise HTTPException(status_code=500, detail="Failed to delete itinerary")
     return Response(status_code=204)
 
 @router.post("/reorder-preview", response_model=ReorderPreviewResponse)
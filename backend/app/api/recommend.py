@@ -1,9 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
-from sklearn.metrics.pairwise import cosine_similarity
-import pickle
-import scipy.sparse
 import re
 import time
 from typing import List, Optional, Dict, Any
@@ -13,6 +10,9 @@ from pydantic import BaseModel, Field, field_validator
 import structlog
 
 from app.db.session import get_db_session
+from app.core.recommender.artifacts import (
+    load_id_map, load_item_matrices, load_vectorizer, similarity_scores
+)
 from app.db.models import Destination, Activity, Accommodation, Transportation
 
 # Set up logging
@@ -87,13 +87,14 @@ class MLModelManager:
         
         for model_type, config in model_configs.items():
             try:
-                vectorizer = pickle.load(open(config['vectorizer_path'], "rb"))
-                matrix = scipy.sparse.load_npz(config['matrix_path'])
-                id_map = pickle.load(open(config['idmap_path'], "rb"))
+                vectorizer = load_vectorizer(config['vectorizer_path'])
+                matrix, matrix_t = load_item_matrices(config['matrix_path'])
+                id_map = load_id_map(config['idmap_path'])
                 
                 self.models[model_type] = {
                     'vectorizer': vectorizer,
                     'matrix': matrix,
+                    'matrix_t': matrix_t,
                     'id_map': id_map
                 }
                 logger.info(f"Successfully loaded {model_type} model")
@@ -113,17 +114,18 @@ class MLModelManager:
             model = self.models[model_type]
             vectorizer = model['vectorizer']
             matrix = model['matrix']
+            matrix_t = model['matrix_t']
             id_map = model['id_map']
             
             # Transform query
             q_vec = vectorizer.transform([query])
             
             # Compute similarities
-            scores = cosine_similarity(q_vec, matrix).flatten()
+            scores = similarity_scores(q_vec, matrix, matrix_t)
             top_idxs = scores.argsort()[::-1][:limit]
             
             # Map to IDs and filter by score
-            top_ids = [id_map[i] for i in top_idxs if scores[i] > 0]
+            top_ids = [str(id_map[i]) for i in top_idxs if scores[i] > 0]
             
             logger.info(f"Generated {len(top_ids)} {model_type} recommendations", extra={
                 'query': query,
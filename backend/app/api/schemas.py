@@ -1,3 +1,4 @@
+import re
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, EmailStr, Field, field_validator
 from uuid import UUID
@@ -7,11 +8,27 @@ from decimal import Decimal
 # Import enums from models
 from app.db.models import UserStatus, ItineraryStatus, BookingStatus, ItemType, BookingItemType
 
+USERNAME_RE = re.compile(r"[a-z0-9_]+")
+
+def normalize_username(v: str) -> str:
+    """Strip and lowercase a username; mirrors the users.check_username_charset constraint"""
+    if not v or not v.strip():
+        raise ValueError("Username cannot be empty")
+    v = v.strip().lower()
+    if not USERNAME_RE.fullmatch(v):
+        raise ValueError("Username can only contain letters, digits and underscores")
+    return v
+
 class UserCreate(BaseModel):
     username: str = Field(..., min_length=3, max_length=50)
     email: EmailStr
     password: str = Field(..., min_length=6, description="Password must be at least 6 characters long")
 
+    @field_validator('username')
+    @classmethod
+    def validate_username(cls, v: str) -> str:
+        return normalize_username(v)
+
 class UserRead(BaseModel):
     id: UUID
     username: str
@@ -27,6 +44,11 @@ class UserRead(BaseModel):
     class Config:
         orm_mode = True
 
+class UserListItem(BaseModel):
+    id: UUID
+    username: str
+    email: EmailStr
+
 class UserUpdate(BaseModel):
     username: Optional[str] = Field(None, min_length=3, max_length=50)
     email: Optional[EmailStr] = None
@@ -35,6 +57,11 @@ class UserUpdate(BaseModel):
     travel_history: Optional[Dict[str, Any]] = None
     profile_data: Optional[Dict[str, Any]] = None
 
+    @field_validator('username')
+    @classmethod
+    def validate_username(cls, v: Optional[str]) -> Optional[str]:
+        return v if v is None else normalize_username(v)
+
 class Token(BaseModel):
     access_token: str
     refresh_token: str
@@ -167,6 +194,15 @@ class DestinationRead(BaseModel):
     class Config:
         orm_mode = True
 
+class DestinationListItem(BaseModel):
+    id: UUID
+    name: str
+    country: Optional[str] = None
+    region: Optional[str] = None
+    latitude: float
+    longitude: float
+    rating: Optional[float] = None
+
 class ActivityRead(BaseModel):
     id: UUID
     name: str
@@ -298,6 +334,16 @@ class ItineraryRead(BaseModel):
         orm_mode = True
 
 
+class ItineraryListItem(BaseModel):
+    id: UUID
+    name: str
+    start_date: datetime
+    end_date: datetime
+    status: ItineraryStatus
+    budget: Optional[Decimal] = None
+    created_at: datetime
+
+
 # ===== BOOKING SCHEMAS =====
 
 class BookingCreate(BaseModel):
@@ -9,14 +9,18 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db_session
+from app.db.session import get_db_session, get_readonly_db_session
+from app.db.models import UserStatus
 from app.db.crud import (
     create_user, get_user_by_id, get_user_by_username, get_user_by_email,
-    get_users
+    get_users, get_user_list_compact, update_user, soft_delete_user
+)
+from app.core.security import (
+    get_password_hash, run_password_hashing, validate_password_strength, get_security_info,
+    SecurityService
 )
-from app.core.security import get_password_hash, validate_password_strength, get_security_info, SecurityService
 from app.api.schemas import (
-    UserCreate, UserRead, UserUpdate, PasswordValidationRequest, 
+    UserCreate, UserRead, UserListItem, UserUpdate, PasswordValidationRequest, 
     PasswordValidationResponse, ChangePasswordRequest, SecurityInfoResponse
 )
 
@@ -31,22 +35,6 @@ async def create_user_endpoint(
 ):
     """Create a new user with password validation"""
     try:
-        # Check if username already exists
-        existing_user = await get_user_by_username(session, payload.username)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already registered"
-            )
-        
-        # Check if email already exists
-        existing_email = await get_user_by_email(session, payload.email)
-        if existing_email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-        
         # Validate password strength
         validation = validate_password_strength(payload.password)
         if not validation["is_valid"]:
@@ -60,9 +48,9 @@ async def create_user_endpoint(
             )
         
         # Hash password
-        hashed = get_password_hash(payload.password)
+        hashed = await run_password_hashing(get_password_hash, payload.password)
         
-        # Create user
+        # Create user (duplicate username/email is rejected atomically)
         user = await create_user(
             session=session,
             username=payload.username,
@@ -91,8 +79,13 @@ async def list_users_endpoint(
 ):
     """Get list of active users with pagination"""
     try:
-        users = await get_users(session, skip=skip, limit=limit)
-        return users
+        return [
+            UserRead(
+                **row._mapping,
+                is_active=row.status == UserStatus.ACTIVE and not row.is_deleted
+            )
+            async for row in get_users(session, skip=skip, limit=limit)
+        ]
     except Exception as e:
         logger.error(f"Error getting users: {e}")
         raise HTTPException(
@@ -101,10 +94,30 @@ async def list_users_endpoint(
         )
 
 
+@router.get("/compact", response_model=List[UserListItem])
+async def list_users_compact_endpoint(
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    session: AsyncSession = Depends(get_db_session)
+):
+    """Get a paginated list of user ids, usernames and emails only"""
+    try:
+        return [
+            UserListItem(**row._mapping)
+            async for row in get_user_list_compact(session, skip=skip, limit=limit)
+        ]
+    except Exception as e:
+        logger.error(f"Error getting compact user list: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve users"
+        )
+
+
 @router.get("/{user_id}", response_model=UserRead)
 async def get_user_endpoint(
     user_id: UUID,
-    session: AsyncSession = Depends(get_db_session)
+    session: AsyncSession = Depends(get_readonly_db_session)
 ):
     """Get user by ID"""
     try:
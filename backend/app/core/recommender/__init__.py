@@ -1,5 +1,7 @@
 # Recommender package exports
 __all__ = [
+    "artifacts",
+    "train_all",
     "train_tfidf_acc",
     "train_tfidf_act", 
     "train_tfidf_dest",
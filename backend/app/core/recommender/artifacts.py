@@ -0,0 +1,68 @@
+"""
+Helpers for reading TF-IDF training artifacts at query time
+Shared by the API modules so every consumer scores items the same way
+"""
+
+import pickle
+from pathlib import Path
+from typing import Any, Optional, Sequence, Tuple, Union
+
+import joblib
+import numpy as np
+from scipy import sparse
+from sklearn.metrics.pairwise import cosine_similarity
+
+def transposed_matrix_path(matrix_path: Union[str, Path]) -> Path:
+    """Path of the pre-transposed copy saved next to an item matrix"""
+    matrix_path = Path(matrix_path)
+    return matrix_path.with_name(f"{matrix_path.stem}_T{matrix_path.suffix}")
+
+def load_vectorizer(vectorizer_path: Union[str, Path]) -> Any:
+    """Load a fitted vectorizer saved with joblib or plain pickle"""
+    return joblib.load(str(vectorizer_path))
+
+def load_transposed_matrix(matrix_path: Union[str, Path]) -> Optional[sparse.csr_matrix]:
+    """Load the pre-transposed item matrix if the trainer produced one"""
+    path = transposed_matrix_path(matrix_path)
+    if not path.exists():
+        return None
+    return sparse.load_npz(str(path)).tocsr()
+
+def load_item_matrices(
+    matrix_path: Union[str, Path]
+) -> Tuple[Optional[sparse.spmatrix], Optional[sparse.csr_matrix]]:
+    """
+    Load the item matrices needed for scoring as (matrix, matrix_t). Only one of
+    them is kept in memory: the untransposed matrix is read only when the
+    trainer did not produce a pre-transposed copy.
+    """
+    matrix_t = load_transposed_matrix(matrix_path)
+    if matrix_t is not None:
+        return None, matrix_t
+    return sparse.load_npz(str(matrix_path)), None
+
+def load_id_map(idmap_path: Union[str, Path]) -> Sequence[str]:
+    """
+    Load the row-to-id map for an item matrix. A numpy array saved next to the
+    pickle path is memory-mapped; otherwise the legacy pickle is loaded.
+    """
+    idmap_path = Path(idmap_path)
+    npy_path = idmap_path.with_suffix(".npy")
+    if npy_path.exists():
+        return np.load(str(npy_path), mmap_mode="r")
+    with open(idmap_path, "rb") as f:
+        return pickle.load(f)
+
+def similarity_scores(
+    query_vec: sparse.spmatrix,
+    matrix: Optional[sparse.spmatrix],
+    matrix_t: Optional[sparse.csr_matrix] = None
+) -> np.ndarray:
+    """
+    Cosine similarity of a transformed query against every item row.
+    With a pre-transposed matrix the product is a plain CSR multiply; both the
+    query and the item rows are already l2-normalized, so it equals the cosine.
+    """
+    if matrix_t is not None:
+        return (query_vec @ matrix_t).toarray().ravel()
+    return cosine_similarity(query_vec, matrix).flatten()
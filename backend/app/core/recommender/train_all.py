@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Concurrent TF-IDF Training for Destinations and Transportation
+Runs both pipelines in one process so the database fetch of one overlaps the
+fitting and saving of the other
+"""
+
+import asyncio
+import logging
+
+from app.db.session import init_db
+from app.core.recommender import train_tfidf_dest, train_tfidf_trans
+
+logger = logging.getLogger(__name__)
+
+async def main() -> bool:
+    """Initialize the database once, then train both models concurrently"""
+    logger.info("🚀 Starting destination and transportation TF-IDF training")
+
+    try:
+        await init_db()
+        logger.info("✅ Database initialized successfully")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize database: {e}")
+        return False
+
+    dest_ok, trans_ok = await asyncio.gather(
+        train_tfidf_dest.train_pipeline(),
+        train_tfidf_trans.train_pipeline(),
+    )
+
+    if not (dest_ok and trans_ok):
+        logger.error(f"❌ Training failed (destinations: {dest_ok}, transportation: {trans_ok})")
+        return False
+
+    logger.info("✅ Destination and transportation TF-IDF training completed successfully")
+    return True
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    exit(0 if success else 1)
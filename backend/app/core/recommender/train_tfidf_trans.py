@@ -10,17 +10,22 @@ import pickle
 import logging
 import time
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, AsyncIterator, Iterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 
+import numpy as np
+import joblib
+from joblib import Parallel, delayed
 from scipy import sparse
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.pipeline import Pipeline
 from sklearn.exceptions import NotFittedError
 from sqlmodel import select
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.db.session import init_db, get_db_session
+from app.core.recommender.artifacts import transposed_matrix_path
 from app.db.models import Transportation
 
 # Configure logging
@@ -33,15 +38,16 @@ logger = logging.getLogger(__name__)
 @dataclass
 class TrainingConfig:
     """Configuration for TF-IDF training"""
-    max_features: int = 100  # Transportation types are shorter
-    min_df: int = 1  # Lower minimum for transportation
-    max_df: float = 0.95  # Maximum document frequency
+    n_features: int = 2 ** 10  # Few distinct transportation terms to hash
     ngram_range: Tuple[int, int] = (1, 2)  # Unigrams and bigrams
     stop_words: str = "english"
     lowercase: bool = True
     strip_accents: str = "unicode"
     min_text_length: int = 3  # Shorter minimum for transportation
     max_text_length: int = 1000  # Shorter maximum for transportation
+    batch_size: int = 1000  # Rows streamed, cleaned and handed to the trainer per batch
+    queue_batches: int = 4  # Cleaned batches buffered between the fetch and the training thread
+    n_jobs: int = 1  # Corpus is too small to be worth worker processes
 
 @asynccontextmanager
 async def performance_timer(operation: str):
@@ -53,6 +59,36 @@ async def performance_timer(operation: str):
         duration = time.time() - start
         logger.info(f"{operation} completed in {duration:.2f}s")
 
+# Postgres text columns cannot contain NUL, so it can safely separate documents
+# when a whole batch is cleaned in a single regex pass
+DOC_SEPARATOR = "\x00"
+
+_ALLOWED_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789-.,!?")
+
+class _CleanTable(dict):
+    """
+    str.translate table that lowercases and maps every character outside
+    _ALLOWED_CHARS to a space in the same pass. Entries are computed on first
+    use, so non-ASCII input is handled without a full Unicode table.
+    """
+    
+    def __missing__(self, codepoint: int) -> str:
+        value = "".join(
+            char if char in _ALLOWED_CHARS else " "
+            for char in chr(codepoint).lower()
+        )
+        self[codepoint] = value
+        return value
+
+_CLEAN_TABLE = _CleanTable()
+_BATCH_CLEAN_TABLE = _CleanTable({ord(DOC_SEPARATOR): DOC_SEPARATOR})
+for _codepoint in range(128):
+    _CLEAN_TABLE[_codepoint]
+    _BATCH_CLEAN_TABLE[_codepoint]
+
+# Compiled once so cleaning skips the re module's pattern cache lookup
+_WS_RE = re.compile(r"\s+")
+
 class TextPreprocessor:
     """Enhanced text preprocessing utility"""
     
@@ -74,16 +110,37 @@ class TextPreprocessor:
             self.stats["empty_documents"] += 1
             return None
         
-        # Convert to string and normalize
-        text = str(text).lower()
-        
-        # Remove special characters but keep important ones
-        text = re.sub(r"[^a-z0-9\s\-\.\,\!\?]", " ", text)
+        # Lowercase and replace special characters in a single pass
+        text = str(text).translate(_CLEAN_TABLE)
         
         # Normalize whitespace
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _WS_RE.sub(" ", text).strip()
         
-        # Validate length
+        return self._validate(text)
+    
+    def clean_batch(self, texts: List[str]) -> List[Optional[str]]:
+        """
+        Clean many documents at once; output matches calling clean() per item.
+        The batch is joined and translated/collapsed once, so the per-call
+        Python overhead is paid per batch instead of per document.
+        """
+        if not texts:
+            return []
+        
+        buffer = DOC_SEPARATOR.join(texts).translate(_BATCH_CLEAN_TABLE)
+        buffer = _WS_RE.sub(" ", buffer)
+        
+        cleaned = []
+        for raw, text in zip(texts, buffer.split(DOC_SEPARATOR)):
+            if not raw:
+                self.stats["empty_documents"] += 1
+                cleaned.append(None)
+            else:
+                cleaned.append(self._validate(text.strip()))
+        return cleaned
+    
+    def _validate(self, text: str) -> Optional[str]:
+        """Apply length limits to a cleaned document and record statistics"""
         if len(text) < self.config.min_text_length:
             self.stats["rejected_short"] += 1
             return None
@@ -106,43 +163,46 @@ class TransportationCorpusBuilder:
         self.config = config
         self.preprocessor = TextPreprocessor(config)
     
-    async def fetch_transportations(self) -> Tuple[List[str], List[str]]:
+    async def fetch_transportations(self) -> AsyncIterator[List[Tuple[str, str]]]:
         """
         Enhanced transportation data fetching with error handling and validation
-        Returns parallel lists of (ids, cleaned_texts).
+        Yields batches of (id, cleaned_text) pairs so the corpus can be streamed
+        into the vectorizer instead of being held as parallel lists.
         """
-        ids, texts = [], []
+        document_count = 0
         
         try:
             async with performance_timer("transportation_data_fetch"):
                 async for session in get_db_session():
-                    # Enhanced query with more fields
-                    result = await session.execute(
+                    # Enhanced query with more fields, streamed from a
+                    # server-side cursor one batch at a time
+                    result = await session.stream(
                         select(
                             Transportation.id,
                             Transportation.type,
                             Transportation.provider,
-                        )
+                        ).execution_options(yield_per=self.config.batch_size)
                     )
                     
-                    for row in result.all():
-                        _id, trans_type, provider = row
-                        
-                        # Build comprehensive text representation
-                        text_parts = []
-                        if trans_type:
-                            text_parts.append(trans_type)
-                        if provider:
-                            text_parts.append(provider)
-                        
-                        raw_text = " ".join(text_parts)
-                        cleaned_text = self.preprocessor.clean(raw_text)
+                    async for chunk in result.partitions():
+                        # Build comprehensive text representations, then clean
+                        # the whole batch in one pass
+                        raw_texts = [
+                            " ".join(part for part in (trans_type, provider) if part)
+                            for _, trans_type, provider in chunk
+                        ]
+                        cleaned_texts = self.preprocessor.clean_batch(raw_texts)
                         
-                        if cleaned_text:
-                            ids.append(str(_id))
-                            texts.append(cleaned_text)
+                        batch = [
+                            (str(row[0]), cleaned_text)
+                            for row, cleaned_text in zip(chunk, cleaned_texts)
+                            if cleaned_text
+                        ]
+                        if batch:
+                            document_count += len(batch)
+                            yield batch
                     
-                    logger.info(f"Fetched {len(ids)} valid transportation documents")
+                    logger.info(f"Fetched {document_count} valid transportation documents")
                     logger.info(f"Preprocessing stats: {self.preprocessor.get_stats()}")
                     
         except SQLAlchemyError as e:
@@ -151,8 +211,6 @@ class TransportationCorpusBuilder:
         except Exception as e:
             logger.error(f"Unexpected error during transportation fetch: {e}")
             raise
-        
-        return ids, texts
 
 class TFIDFTrainer:
     """Enhanced TF-IDF trainer with monitoring and validation"""
@@ -165,37 +223,48 @@ class TFIDFTrainer:
         # Output file paths
         self.vec_pkl = output_dir / "tfidf_vectorizer_trans.pkl"
         self.mat_npz = output_dir / "tfidf_matrix_trans.npz"
-        self.idmap_pkl = output_dir / "item_index_map_trans.pkl"
+        self.mat_t_npz = transposed_matrix_path(self.mat_npz)
+        self.idmap_npy = output_dir / "item_index_map_trans.npy"
         self.metadata_pkl = output_dir / "training_metadata_trans.pkl"
         
         self.vectorizer = None
         self.matrix = None
+        self.ids: List[str] = []
         self.training_stats = {}
     
-    def create_vectorizer(self) -> TfidfVectorizer:
-        """Create TF-IDF vectorizer with configuration"""
-        return TfidfVectorizer(
-            max_features=self.config.max_features,
-            min_df=self.config.min_df,
-            max_df=self.config.max_df,
-            ngram_range=self.config.ngram_range,
-            stop_words=self.config.stop_words,
-            lowercase=self.config.lowercase,
-            strip_accents=self.config.strip_accents
-        )
+    def create_vectorizer(self) -> Pipeline:
+        """
+        Create TF-IDF vectorizer with configuration
+        Terms are hashed into a fixed feature space, so fitting only learns the
+        IDF weights and never builds a vocabulary dict. Counts are emitted as
+        float32 CSR straight from the hashing kernel.
+        """
+        return Pipeline([
+            ("hv", HashingVectorizer(
+                n_features=self.config.n_features,
+                ngram_range=self.config.ngram_range,
+                stop_words=self.config.stop_words,
+                lowercase=self.config.lowercase,
+                strip_accents=self.config.strip_accents,
+                alternate_sign=False,
+                norm=None,
+                dtype=np.float32
+            )),
+            ("tfidf", TfidfTransformer())
+        ])
     
-    def validate_corpus(self, corpus: List[str]) -> bool:
-        """Validate corpus quality"""
-        if not corpus:
+    def validate_corpus(self, doc_lengths: np.ndarray) -> bool:
+        """Validate corpus quality from the lengths of the documents trained on"""
+        if not len(doc_lengths):
             logger.error("Empty corpus provided")
             return False
         
-        avg_length = sum(len(doc) for doc in corpus) / len(corpus)
-        min_length = min(len(doc) for doc in corpus)
-        max_length = max(len(doc) for doc in corpus)
+        avg_length = doc_lengths.mean()
+        min_length = doc_lengths.min()
+        max_length = doc_lengths.max()
         
         logger.info(f"Corpus statistics:")
-        logger.info(f"  - Document count: {len(corpus)}")
+        logger.info(f"  - Document count: {len(doc_lengths)}")
         logger.info(f"  - Average length: {avg_length:.1f} characters")
         logger.info(f"  - Min length: {min_length} characters")
         logger.info(f"  - Max length: {max_length} characters")
@@ -205,28 +274,84 @@ class TFIDFTrainer:
         
         return True
     
-    async def train(self, ids: List[str], corpus: List[str]) -> bool:
-        """Train TF-IDF model with enhanced monitoring"""
+    async def train(self, batches: AsyncIterator[List[Tuple[str, str]]]) -> bool:
+        """
+        Train TF-IDF model with enhanced monitoring
+        Batches of (id, cleaned_text) pairs are handed to the training thread
+        through a bounded queue as they are fetched, so at most
+        ``queue_batches`` cleaned batches wait in memory. The ids are collected
+        into ``self.ids`` in matrix row order.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.queue_batches)
+        
+        async def produce() -> None:
+            # None marks the end of the corpus; a fetch error is passed on so
+            # the training thread raises it instead of waiting forever
+            try:
+                async for batch in batches:
+                    await queue.put(batch)
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(None)
+        
+        producer = asyncio.create_task(produce())
         try:
-            # Validate corpus
-            if not self.validate_corpus(corpus):
-                return False
+            self.ids = []
+            self.matrix = None
+            doc_lengths = []
             
-            # Create and train vectorizer
-            async with performance_timer("tfidf_training"):
+            def shards() -> Iterator[List[str]]:
+                while True:
+                    batch = asyncio.run_coroutine_threadsafe(queue.get(), loop).result()
+                    if batch is None:
+                        return
+                    if isinstance(batch, Exception):
+                        raise batch
+                    batch_ids, texts = zip(*batch)
+                    self.ids.extend(batch_ids)
+                    doc_lengths.append(np.fromiter(map(len, texts), dtype=np.int64, count=len(texts)))
+                    yield list(texts)
+            
+            def fit() -> None:
                 self.vectorizer = self.create_vectorizer()
-                self.matrix = self.vectorizer.fit_transform(corpus)
+                hasher = self.vectorizer.named_steps["hv"]
+                
+                # Hashing is stateless, so each batch can be tokenized in a
+                # separate worker and the results stacked back in order
+                counts = Parallel(n_jobs=self.config.n_jobs)(
+                    delayed(hasher.transform)(texts) for texts in shards()
+                )
+                if not counts:
+                    return
+                counts = sparse.vstack(counts, format="csr")
+                self.matrix = self.vectorizer.named_steps["tfidf"].fit_transform(counts)
+                
+                # float32 is ample for cosine ranking and halves the matrix size;
+                # counts are already float32, so this normally does not copy
+                self.matrix = self.matrix.astype(np.float32, copy=False).tocsr()
+                self.matrix.sort_indices()
+            
+            # Create and train vectorizer off the event loop, so a pipeline
+            # running alongside can keep fetching while this one fits
+            async with performance_timer("tfidf_training"):
+                await asyncio.to_thread(fit)
+            
+            # Validate corpus
+            doc_lengths = np.concatenate(doc_lengths) if doc_lengths else np.empty(0, dtype=np.int64)
+            if not self.validate_corpus(doc_lengths):
+                return False
             
             # Collect training statistics
             self.training_stats = {
-                "document_count": len(corpus),
-                "feature_count": self.vectorizer.get_feature_names_out().shape[0],
+                "document_count": len(self.ids),
+                "feature_count": self.matrix.shape[1],
                 "matrix_shape": self.matrix.shape,
+                "matrix_dtype": str(self.matrix.dtype),
                 "sparsity": 1 - (self.matrix.nnz / (self.matrix.shape[0] * self.matrix.shape[1])),
                 "config": {
-                    "max_features": self.config.max_features,
-                    "min_df": self.config.min_df,
-                    "max_df": self.config.max_df,
+                    "n_features": self.config.n_features,
                     "ngram_range": self.config.ngram_range
                 }
             }
@@ -241,23 +366,31 @@ class TFIDFTrainer:
         except Exception as e:
             logger.error(f"Training failed: {e}")
             return False
+        finally:
+            # Stops the fetch if training failed before draining the queue
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
     
     def save_artifacts(self, ids: List[str]) -> bool:
         """Save all training artifacts with error handling"""
         try:
             # Save vectorizer
             logger.info(f"💾 Saving vectorizer → {self.vec_pkl}")
-            with open(self.vec_pkl, "wb") as f:
-                pickle.dump(self.vectorizer, f)
+            joblib.dump(self.vectorizer, self.vec_pkl, compress=3)
             
             # Save matrix
             logger.info(f"💾 Saving matrix → {self.mat_npz}")
             sparse.save_npz(str(self.mat_npz), self.matrix)
             
+            # Save transposed matrix so queries can multiply without converting
+            logger.info(f"💾 Saving transposed matrix → {self.mat_t_npz}")
+            matrix_t = self.matrix.T.tocsr()
+            matrix_t.sort_indices()
+            sparse.save_npz(str(self.mat_t_npz), matrix_t)
+            
             # Save ID map
-            logger.info(f"💾 Saving ID map → {self.idmap_pkl}")
-            with open(self.idmap_pkl, "wb") as f:
-                pickle.dump(ids, f)
+            logger.info(f"💾 Saving ID map → {self.idmap_npy}")
+            np.save(str(self.idmap_npy), np.asarray(ids, dtype="U36"))
             
             # Save training metadata
             logger.info(f"💾 Saving training metadata → {self.metadata_pkl}")
@@ -274,15 +407,20 @@ class TFIDFTrainer:
         """Validate that saved artifacts can be loaded correctly"""
         try:
             # Test loading vectorizer
-            with open(self.vec_pkl, "rb") as f:
-                loaded_vec = pickle.load(f)
+            loaded_vec = joblib.load(self.vec_pkl)
             
             # Test loading matrix
             loaded_mat = sparse.load_npz(str(self.mat_npz))
+            loaded_mat_t = sparse.load_npz(str(self.mat_t_npz))
+            if loaded_mat_t.shape != loaded_mat.shape[::-1]:
+                logger.error(f"Transposed matrix shape {loaded_mat_t.shape} does not match {loaded_mat.shape}")
+                return False
             
             # Test loading ID map
-            with open(self.idmap_pkl, "rb") as f:
-                loaded_ids = pickle.load(f)
+            loaded_ids = np.load(str(self.idmap_npy), mmap_mode="r")
+            if len(loaded_ids) != loaded_mat.shape[0]:
+                logger.error(f"ID map has {len(loaded_ids)} entries for {loaded_mat.shape[0]} matrix rows")
+                return False
             
             # Test loading metadata
             with open(self.metadata_pkl, "rb") as f:
@@ -295,47 +433,38 @@ class TFIDFTrainer:
             logger.error(f"Artifact validation failed: {e}")
             return False
 
-async def main():
-    """Enhanced main function with comprehensive error handling"""
-    logger.info("🚀 Starting transportation TF-IDF training")
-
-    # Initialize database connection
-    try:
-        await init_db()
-        logger.info("✅ Database initialized successfully")
-    except Exception as e:
-        logger.error(f"❌ Failed to initialize database: {e}")
-        return False
-    
+async def train_pipeline() -> bool:
+    """
+    Fetch, train, save and validate the transportation model
+    Expects the database to be initialized; blocking work runs in threads so
+    this can be gathered with other training pipelines.
+    """
     try:
         # Configuration
         config = TrainingConfig()
         output_dir = Path("/app/models")
         
-        # Build corpus
-        logger.info("⏳ Fetching transportation corpus...")
+        # Fetch and train in one pass; batches go to the trainer as they are
+        # cleaned, so the corpus is never held in full
+        logger.info("⏳ Fetching transportation corpus and training TF-IDF...")
         corpus_builder = TransportationCorpusBuilder(config)
-        ids, corpus = await corpus_builder.fetch_transportations()
-        
-        if not corpus:
-            logger.error("⚠️  No transportation documents found! (Nothing to vectorize.)")
-            return False
-        
-        # Train model
-        logger.info(f"⚙️  Training TF-IDF on {len(corpus)} documents...")
         trainer = TFIDFTrainer(config, output_dir)
         
-        if not await trainer.train(ids, corpus):
-            logger.error("❌ Training failed")
+        if not await trainer.train(corpus_builder.fetch_transportations()):
+            if not trainer.ids:
+                logger.error("⚠️  No transportation documents found! (Nothing to vectorize.)")
+            else:
+                logger.error("❌ Training failed")
             return False
+        logger.info(f"⚙️  Trained TF-IDF on {len(trainer.ids)} documents")
         
         # Save artifacts
-        if not trainer.save_artifacts(ids):
+        if not await asyncio.to_thread(trainer.save_artifacts, trainer.ids):
             logger.error("❌ Failed to save artifacts")
             return False
         
         # Validate saved artifacts
-        if not trainer.validate_saved_artifacts():
+        if not await asyncio.to_thread(trainer.validate_saved_artifacts):
             logger.error("❌ Artifact validation failed")
             return False
         
@@ -346,6 +475,20 @@ async def main():
         logger.error(f"❌ Training process failed: {e}")
         return False
 
+async def main():
+    """Enhanced main function with comprehensive error handling"""
+    logger.info("🚀 Starting transportation TF-IDF training")
+
+    # Initialize database connection
+    try:
+        await init_db()
+        logger.info("✅ Database initialized successfully")
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize database: {e}")
+        return False
+    
+    return await train_pipeline()
+
 if __name__ == "__main__":
     success = asyncio.run(main())
     exit(0 if success else 1)
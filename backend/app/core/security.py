@@ -1,18 +1,32 @@
 import os
+import asyncio
+import hmac
+import hashlib
 import logging
+import math
+import secrets
+import string
+import threading
 import time
-from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Optional, Dict, Any, Tuple, Callable, TypeVar
 from contextlib import asynccontextmanager
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from cachetools import LRUCache, TTLCache
+import jwt
+from jwt import PyJWTError
+import bcrypt
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import VerifyMismatchError
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import BaseModel, Field, field_validator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
+from app.core.settings import Settings
 from app.db.session import get_db_session
 from app.db.models import User
 
@@ -31,11 +45,50 @@ PASSWORD_MIN_LENGTH = 6
 PASSWORD_REQUIRE_UPPERCASE = True
 PASSWORD_REQUIRE_NUMBER = True
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# argon2id for new hashes; legacy bcrypt hashes still verify and get rehashed
+# on the next successful login
+_settings = Settings()
+password_hasher = PasswordHasher(
+    time_cost=_settings.ARGON2_TIME_COST,
+    memory_cost=_settings.ARGON2_MEMORY_COST,  # KiB
+    parallelism=_settings.ARGON2_PARALLELISM,
+    type=Type.ID,
+)
+PASSWORD_HASH_TARGET_MS = _settings.PASSWORD_HASH_TARGET_MS
+# Legacy bcrypt hashes are only ever verified (then replaced), through the
+# compiled bcrypt package; there is no hot bcrypt path worth a custom backend
+BCRYPT_HASH_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# argon2 and bcrypt release the GIL while hashing, so a pool sized to the CPU
+# count lets concurrent logins use every core without blocking the event loop
+_password_hash_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="password-hash",
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-# In-memory token blacklist (use Redis in production)
-token_blacklist = set()
+# Short-lived cache of successful verifications so login retries skip the KDF.
+# Keys are an HMAC under a per-process secret over the password and the full
+# stored hash, so no password material is kept and a hash change misses.
+# Failures are never cached. TTLCache is not thread-safe, hence the lock.
+PASSWORD_VERIFY_CACHE_TTL_SECONDS = int(os.getenv("PASSWORD_VERIFY_CACHE_TTL_SECONDS", "60"))
+_verified_passwords = TTLCache(maxsize=10_000, ttl=PASSWORD_VERIFY_CACHE_TTL_SECONDS)
+_verified_passwords_lock = threading.Lock()
+_verify_cache_secret = secrets.token_bytes(32)
+
+# In-memory token blacklist (use Redis in production), keyed by the token's jti
+# claim. Entries only need to outlive the longest token lifetime, after which
+# the token is rejected as expired anyway. The size is unbounded: a full cache
+# would evict revoked tokens early and make them valid again, so entries only
+# leave once their TTL has passed (expired ones are purged on each insert)
+token_blacklist = TTLCache(
+    maxsize=math.inf,
+    ttl=max(ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_MINUTES) * 60,
+)
+
+# Verified access token payloads, keyed by token, so repeat requests skip the
+# HMAC check; expiry is re-checked on every hit
+_decoded_access_tokens = LRUCache(maxsize=4096)
 
 # Performance timer
 @asynccontextmanager
@@ -48,75 +101,178 @@ async def performance_timer(operation: str):
         duration = time.time() - start
         logger.info(f"{operation} completed in {duration:.2f}s")
 
+PASSWORD_SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
+# Character classes found by PasswordValidator._scan
+_HAS_LOWER = 1
+_HAS_UPPER = 2
+_HAS_DIGIT = 4
+_HAS_SPECIAL = 8
+_HAS_ALPHA = 16
+
+# ASCII character classes, tested as set intersections so ASCII passwords are
+# classified without a per-character Python loop
+_ASCII_CLASSES = (
+    (frozenset(string.ascii_lowercase), _HAS_LOWER | _HAS_ALPHA),
+    (frozenset(string.ascii_uppercase), _HAS_UPPER | _HAS_ALPHA),
+    (frozenset(string.digits), _HAS_DIGIT),
+    (PASSWORD_SPECIAL_CHARS, _HAS_SPECIAL),
+)
+
 class PasswordValidator:
     """Password validation utility"""
     
+    @staticmethod
+    def _scan(password: str) -> int:
+        """Bitmask of the character classes present, built in a single pass"""
+        flags = 0
+        if password.isascii():
+            chars = set(password)
+            for members, flag in _ASCII_CLASSES:
+                if not chars.isdisjoint(members):
+                    flags |= flag
+            return flags
+        
+        for c in password:
+            if c.islower():
+                flags |= _HAS_LOWER | _HAS_ALPHA
+            elif c.isupper():
+                flags |= _HAS_UPPER | _HAS_ALPHA
+            elif c.isdigit():
+                flags |= _HAS_DIGIT
+            elif c in PASSWORD_SPECIAL_CHARS:
+                flags |= _HAS_SPECIAL
+            elif c.isalpha():
+                flags |= _HAS_ALPHA
+        return flags
+    
     @staticmethod
     def validate_password(password: str) -> Dict[str, Any]:
         """Validate password strength and return detailed feedback"""
         errors = []
         warnings = []
+        flags = PasswordValidator._scan(password)
         
         if len(password) < PASSWORD_MIN_LENGTH:
             errors.append(f"Password must be at least {PASSWORD_MIN_LENGTH} characters")
         
-        if PASSWORD_REQUIRE_UPPERCASE and not any(c.isupper() for c in password):
+        if PASSWORD_REQUIRE_UPPERCASE and not flags & _HAS_UPPER:
             errors.append("Password must contain at least one uppercase letter")
         
-        if PASSWORD_REQUIRE_NUMBER and not any(c.isdigit() for c in password):
+        if PASSWORD_REQUIRE_NUMBER and not flags & _HAS_DIGIT:
             errors.append("Password must contain at least one number")
         
         if len(password) < 8:
             warnings.append("Consider using a longer password for better security")
         
-        if not any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
+        if not flags & _HAS_SPECIAL:
             warnings.append("Consider adding special characters for better security")
         
         return {
             "is_valid": len(errors) == 0,
             "errors": errors,
             "warnings": warnings,
-            "strength_score": PasswordValidator._calculate_strength(password)
+            "strength_score": PasswordValidator._calculate_strength(password, flags)
         }
     
     @staticmethod
-    def _calculate_strength(password: str) -> int:
+    def _calculate_strength(password: str, flags: Optional[int] = None) -> int:
         """Calculate password strength score (0-100)"""
+        if flags is None:
+            flags = PasswordValidator._scan(password)
         score = 0
         
         # Length contribution
         score += min(len(password) * 4, 40)
         
         # Character variety
-        if any(c.islower() for c in password):
+        if flags & _HAS_LOWER:
             score += 10
-        if any(c.isupper() for c in password):
+        if flags & _HAS_UPPER:
             score += 10
-        if any(c.isdigit() for c in password):
+        if flags & _HAS_DIGIT:
             score += 10
-        if any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
+        if flags & _HAS_SPECIAL:
             score += 10
         
         # Bonus for mixed case and numbers
-        if any(c.isupper() for c in password) and any(c.islower() for c in password):
+        if flags & _HAS_UPPER and flags & _HAS_LOWER:
             score += 10
-        if any(c.isdigit() for c in password) and any(c.isalpha() for c in password):
+        if flags & _HAS_DIGIT and flags & _HAS_ALPHA:
             score += 10
         
         return min(score, 100)
 
+def _verify_cache_key(plain: str, hashed: str) -> bytes:
+    """Cache key for a (password, stored hash) pair"""
+    return hmac.new(
+        _verify_cache_secret,
+        plain.encode() + b"\x00" + hashed.encode(),
+        hashlib.sha256
+    ).digest()
+
+def _is_verified_cached(key: bytes) -> bool:
+    """Whether a (password, hash) pair verified successfully within the TTL"""
+    with _verified_passwords_lock:
+        return key in _verified_passwords
+
+def _cache_verified(key: bytes) -> None:
+    """Remember a successful verification"""
+    with _verified_passwords_lock:
+        _verified_passwords[key] = True
+
+def _check_password(plain: str, hashed: str) -> bool:
+    """Check a password against an argon2id hash or a legacy bcrypt hash"""
+    if hashed.startswith(BCRYPT_HASH_PREFIXES):
+        return bcrypt.checkpw(plain.encode(), hashed.encode())
+    try:
+        return password_hasher.verify(hashed, plain)
+    except VerifyMismatchError:
+        return False
+
 def verify_password(plain: str, hashed: str) -> bool:
     """Verify a password against its hash"""
     try:
-        return pwd_context.verify(plain, hashed)
+        key = _verify_cache_key(plain, hashed)
+        if _is_verified_cached(key):
+            return True
+        
+        verified = _check_password(plain, hashed)
+        if verified:
+            _cache_verified(key)
+        return verified
     except Exception as e:
         logger.error(f"Password verification error: {e}")
         return False
 
+def verify_and_update_password(plain: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and return a replacement hash if the stored one uses a
+    deprecated scheme (e.g. legacy bcrypt) or outdated parameters.
+    """
+    try:
+        key = _verify_cache_key(plain, hashed)
+        if _is_verified_cached(key):
+            return True, None
+        
+        verified = _check_password(plain, hashed)
+        new_hash = None
+        if verified and (
+            hashed.startswith(BCRYPT_HASH_PREFIXES) or password_hasher.check_needs_rehash(hashed)
+        ):
+            new_hash = password_hasher.hash(plain)
+        # Only cache hashes that are current, so a pending upgrade is retried
+        if verified and not new_hash:
+            _cache_verified(key)
+        return verified, new_hash
+    except Exception as e:
+        logger.error(f"Password verification error: {e}")
+        return False, None
+
 def get_password_hash(password: str) -> str:
     """Generate a secure password hash"""
     try:
-        return pwd_context.hash(password)
+        return password_hasher.hash(password)
     except Exception as e:
         logger.error(f"Password hashing error: {e}")
         raise HTTPException(
@@ -124,12 +280,44 @@ def get_password_hash(password: str) -> str:
             detail="Password processing failed"
         )
 
+def benchmark_password_hashing(iterations: int = 3) -> float:
+    """
+    Time the configured argon2id parameters on this machine and return the
+    mean milliseconds per hash, warning when it exceeds the target
+    """
+    start = time.perf_counter()
+    for _ in range(iterations):
+        password_hasher.hash("benchmark-password")
+    ms_per_hash = (time.perf_counter() - start) * 1000 / iterations
+    
+    params = (
+        f"time_cost={password_hasher.time_cost}, "
+        f"memory_cost={password_hasher.memory_cost}, "
+        f"parallelism={password_hasher.parallelism}"
+    )
+    if ms_per_hash > PASSWORD_HASH_TARGET_MS:
+        logger.warning(
+            f"Password hashing takes {ms_per_hash:.1f} ms ({params}), above the "
+            f"{PASSWORD_HASH_TARGET_MS} ms target; consider lowering ARGON2_TIME_COST"
+        )
+    else:
+        logger.info(f"Password hashing takes {ms_per_hash:.1f} ms ({params})")
+    return ms_per_hash
+
+T = TypeVar("T")
+
+async def run_password_hashing(func: Callable[..., T], *args: Any) -> T:
+    """Run a password hashing/verification call on the hashing thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_hash_pool, func, *args)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token"""
     try:
         to_encode = data.copy()
-        expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-        to_encode.update({"exp": expire, "type": "access"})
+        lifetime = expires_delta.total_seconds() if expires_delta else ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        expire = int(time.time() + lifetime)
+        to_encode.update({"exp": expire, "type": "access", "jti": uuid.uuid4().hex})
         
         token = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
         logger.info("Access token created successfully", extra={
@@ -148,8 +336,9 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None)
     """Create a JWT refresh token"""
     try:
         to_encode = data.copy()
-        expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=REFRESH_TOKEN_EXPIRE_MINUTES))
-        to_encode.update({"exp": expire, "type": "refresh"})
+        lifetime = expires_delta.total_seconds() if expires_delta else REFRESH_TOKEN_EXPIRE_MINUTES * 60
+        expire = int(time.time() + lifetime)
+        to_encode.update({"exp": expire, "type": "refresh", "jti": uuid.uuid4().hex})
         
         token = jwt.encode(to_encode, REFRESH_SECRET_KEY, algorithm=ALGORITHM)
         logger.info("Refresh token created successfully", extra={
@@ -164,17 +353,45 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None)
             detail="Refresh token creation failed"
         )
 
+def decode_access_token(token: str) -> Dict[str, Any]:
+    """Decode and verify an access token, reusing cached payloads until they expire"""
+    payload = _decoded_access_tokens.get(token)
+    if payload is None:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        _decoded_access_tokens[token] = payload
+    elif payload.get("exp") is not None and payload["exp"] <= time.time():
+        _decoded_access_tokens.pop(token, None)
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    return payload
+
+def _unverified_claims(token: str) -> Dict[str, Any]:
+    """
+    Claims of a token without checking its signature or expiry, or an empty
+    dict if it is not a JWT. Callers that trust the token verify it separately.
+    """
+    payload = _decoded_access_tokens.get(token)
+    if payload is None:
+        try:
+            payload = jwt.decode(token, options={"verify_signature": False, "verify_exp": False})
+        except PyJWTError:
+            return {}
+    return payload
+
+def _blacklist_key(token: str) -> str:
+    """Blacklist key for a token: its jti claim, or the raw token for tokens issued without one"""
+    return _unverified_claims(token).get("jti") or token
+
 def blacklist_token(token: str) -> None:
     """Add token to blacklist"""
     try:
-        token_blacklist.add(token)
+        token_blacklist[_blacklist_key(token)] = True
         logger.info("Token added to blacklist")
     except Exception as e:
         logger.error(f"Token blacklisting error: {e}")
 
 def is_token_blacklisted(token: str) -> bool:
     """Check if token is blacklisted"""
-    return token in token_blacklist
+    return _blacklist_key(token) in token_blacklist
 
 async def authenticate_user(
     username_or_email: str, 
@@ -187,23 +404,37 @@ async def authenticate_user(
             # Normalize input
             username_or_email = username_or_email.strip().lower()
             
-            # Find user by username or email
-            user = await session.execute(
-                select(User).where(
-                    (User.username == username_or_email) | (User.email == username_or_email)
-                )
-            )
-            result = user.scalar_one_or_none()
+            # Find user by username or email. Usernames are [a-z0-9_] only, so
+            # "@" means an email; either way it is one unique-index lookup
+            if "@" in username_or_email:
+                stmt = select(User).where(User.email == username_or_email)
+            else:
+                stmt = select(User).where(User.username == username_or_email)
+            
+            result = (await session.execute(stmt)).scalar_one_or_none()
             
             if not result:
                 logger.warning(f"Authentication failed: user not found - {username_or_email}")
                 return None
             
             # Verify password
-            if not verify_password(password, result.password_hash):
+            verified, new_hash = await run_password_hashing(
+                verify_and_update_password, password, result.password_hash
+            )
+            if not verified:
                 logger.warning(f"Authentication failed: invalid password for user - {username_or_email}")
                 return None
             
+            # Transparently migrate legacy bcrypt hashes to argon2id
+            if new_hash:
+                try:
+                    result.password_hash = new_hash
+                    await session.commit()
+                    logger.info(f"Password hash upgraded for user: {result.username}")
+                except Exception as e:
+                    await session.rollback()
+                    logger.warning(f"Password hash upgrade failed for user {result.username}: {e}")
+            
             logger.info(f"User authenticated successfully: {result.username}")
             return result
             
@@ -211,25 +442,26 @@ async def authenticate_user(
             logger.error(f"Authentication error for {username_or_email}: {e}")
             return None
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    session: AsyncSession = Depends(get_db_session),
-) -> User:
-    """Get current user from JWT token with enhanced security"""
-    credentials_exc = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def _user_id_from_access_token(token: str) -> str:
+    """Validate an access token and return its subject, raising 401 otherwise"""
+    credentials_exc = _credentials_exception()
     
     try:
+        # Decode token
+        payload = decode_access_token(token)
+        
         # Check if token is blacklisted
-        if is_token_blacklisted(token):
+        if (payload.get("jti") or token) in token_blacklist:
             logger.warning("Attempted to use blacklisted token")
             raise credentials_exc
         
-        # Decode token
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id: str = payload.get("sub")
         token_type: str = payload.get("type")
         
@@ -237,26 +469,35 @@ async def get_current_user(
             logger.warning("Invalid token payload")
             raise credentials_exc
             
-    except JWTError as e:
+    except PyJWTError as e:
         logger.warning(f"JWT decode error: {e}")
         raise credentials_exc
     except Exception as e:
         logger.error(f"Token validation error: {e}")
         raise credentials_exc
+    
+    return user_id
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    session: AsyncSession = Depends(get_db_session),
+) -> User:
+    """Get current user from JWT token with enhanced security"""
+    user_id = _user_id_from_access_token(token)
 
     # Get user from database
     try:
-        user = await session.get(User, user_id)
+        user = await session.get(User, uuid.UUID(user_id))
         if not user:
             logger.warning(f"User not found for token: {user_id}")
-            raise credentials_exc
+            raise _credentials_exception()
         
         logger.info(f"Current user resolved: {user.username}")
         return user
         
     except Exception as e:
         logger.error(f"Database error during user lookup: {e}")
-        raise credentials_exc
+        raise _credentials_exception()
 
 async def get_current_user_from_refresh_token(
     token: str,
@@ -275,7 +516,7 @@ async def get_current_user_from_refresh_token(
                 detail="Invalid refresh token"
             )
             
-    except JWTError as e:
+    except PyJWTError as e:
         logger.warning(f"Refresh token decode error: {e}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -329,7 +570,7 @@ class SecurityService:
         """Change user password with validation"""
         try:
             # Verify current password
-            if not verify_password(current_password, user.password_hash):
+            if not await run_password_hashing(verify_password, current_password, user.password_hash):
                 logger.warning(f"Password change failed: invalid current password for user {user.username}")
                 return False
             
@@ -340,7 +581,7 @@ class SecurityService:
                 return False
             
             # Hash new password
-            new_hash = get_password_hash(new_password)
+            new_hash = await run_password_hashing(get_password_hash, new_password)
             
             # Update user
             user.password_hash = new_hash
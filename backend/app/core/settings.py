@@ -10,10 +10,16 @@ class Settings(BaseSettings):
     DB_ECHO: bool = False  # Set to True for SQL query logging in development
     
     # Connection Pool Settings
-    DB_POOL_SIZE: int = 10  # Number of connections to maintain in pool
-    DB_MAX_OVERFLOW: int = 20  # Maximum overflow connections beyond pool_size
-    DB_POOL_TIMEOUT: int = 30  # Timeout in seconds to get connection from pool
-    DB_POOL_RECYCLE: int = 3600  # Recycle connections after 1 hour
+    DB_POOL_SIZE: int = 25  # Connections kept per worker process; roughly its in-flight queries
+    DB_MAX_OVERFLOW: int = 25  # Burst connections beyond pool_size, per worker process
+    DB_POOL_TIMEOUT: int = 5  # Seconds to wait for a pooled connection; fail fast under backpressure
+    DB_POOL_RECYCLE: int = 1800  # Recycle connections after 30 minutes
+    WORKERS: int = 4  # Gunicorn worker processes (start scripts), each with its own pool
+    DB_PRE_PING: bool = False  # Ping on every checkout; only worth the round-trip behind failover/HA proxies
+    DB_QUERY_CACHE_SIZE: int = 1200  # Compiled SQL statements kept per engine
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 512  # asyncpg prepared statements kept per connection
+    DB_HEALTH_INTERVAL: int = 10  # Seconds between background SELECT 1 probes
+    DB_RAISE_ON_LAZY_LOAD: bool = False  # Fail fast on unplanned lazy loads (dev/test only)
     
     # API Keys
     google_maps_api_key: str = ""
@@ -68,6 +74,12 @@ class Settings(BaseSettings):
     PASSWORD_REQUIRE_NUMBER: bool = True
     PASSWORD_REQUIRE_SPECIAL: bool = False
     
+    # Password Hashing (argon2id)
+    ARGON2_TIME_COST: int = 2
+    ARGON2_MEMORY_COST: int = 65536  # KiB (64 MB)
+    ARGON2_PARALLELISM: int = 2
+    PASSWORD_HASH_TARGET_MS: int = 250  # Warn at startup if a hash takes longer
+    
     # Security Features
     ENABLE_TOKEN_BLACKLIST: bool = True
     ENABLE_PASSWORD_VALIDATION: bool = True
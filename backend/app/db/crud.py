@@ -2,24 +2,59 @@
 Simplified CRUD operations that work with the existing database schema
 """
 
+import json
 import logging
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime, timezone
 
-from sqlalchemy import select, update, delete, and_, or_, func, desc, asc
+from sqlalchemy import (
+    CHAR, Row, Text, bindparam, case, insert, select, type_coerce, update, delete, and_, or_, func, desc,
+    asc, text
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.types import JSON
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
+from app.db.session import db_manager
 from app.db.models import (
     User, Itinerary, Destination, Activity, Accommodation, Transportation,
-    Review, ItineraryDestination, ItineraryActivity, 
-    ItineraryAccommodation, ItineraryTransportation
+    Review, Booking, ItineraryDestination, ItineraryActivity, 
+    ItineraryAccommodation, ItineraryTransportation,
+    BOOKING_ITEM_TYPE_CODES, BOOKING_STATUS_CODES
 )
 from fastapi import HTTPException, status
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round-trip by the streaming list queries
+STREAM_YIELD_PER = 100
+
+async def _stream_scalars(
+    session: AsyncSession,
+    stmt,
+    params: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[Any]:
+    """Yield ORM objects from a server-side cursor instead of materializing a list"""
+    result = await session.stream_scalars(
+        stmt.execution_options(yield_per=STREAM_YIELD_PER), params
+    )
+    async for item in result:
+        yield item
+
+def _insert_values(obj: Any) -> Dict[str, Any]:
+    """
+    Column values for a Core INSERT. Computed fields are dropped, and unset
+    server-generated columns (the uuid_v7() id) are left to Postgres.
+    """
+    columns = obj.__table__.c
+    return {
+        key: value
+        for key, value in obj.model_dump().items()
+        if key in columns and not (value is None and columns[key].server_default is not None)
+    }
+
 # ===== USER CRUD OPERATIONS =====
 
 async def create_user(
@@ -30,32 +65,52 @@ async def create_user(
     preferences: Optional[Dict[str, Any]] = None,
     travel_history: Optional[Dict[str, Any]] = None
 ) -> User:
-    """Create a new user"""
+    """
+    Create a new user in a single round-trip.
+
+    Uses INSERT ... ON CONFLICT DO NOTHING RETURNING so the uniqueness check on
+    username/email is done atomically by Postgres instead of a SELECT beforehand.
+    Raises 400 if either is already registered.
+    """
     try:
-        user = User(
-            username=username,
-            email=email,
-            password_hash=password_hash,
-            preferences=preferences or {},
-            travel_history=travel_history or {}
+        result = await session.execute(
+            pg_insert(User)
+            .values(
+                username=username,
+                email=email,
+                password_hash=password_hash,
+                preferences=preferences or {},
+                travel_history=travel_history or {}
+            )
+            .on_conflict_do_nothing()
+            .returning(User)
         )
-        session.add(user)
+        user = result.scalar_one_or_none()
+        if user is None:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Username or email already registered"
+            )
         await session.commit()
-        await session.refresh(user)
         logger.info(f"Created user: {username}")
         return user
+    except HTTPException:
+        raise
     except Exception as e:
         await session.rollback()
         logger.error(f"Error creating user: {e}")
         raise
 
+# Single-user lookups are built once; each call only binds its parameter, and
+# the engine's compiled cache hands back the SQL without recompiling
+_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
 async def get_user_by_id(session: AsyncSession, user_id: UUID) -> Optional[User]:
-    """Get user by ID"""
+    """Get user by ID, from the session's identity map when already loaded"""
     try:
-        result = await session.execute(
-            select(User).where(User.id == user_id)
-        )
-        return result.scalar_one_or_none()
+        return await session.get(User, user_id)
     except Exception as e:
         logger.error(f"Error getting user {user_id}: {e}")
         return None
@@ -63,9 +118,7 @@ async def get_user_by_id(session: AsyncSession, user_id: UUID) -> Optional[User]
 async def get_user_by_username(session: AsyncSession, username: str) -> Optional[User]:
     """Get user by username"""
     try:
-        result = await session.execute(
-            select(User).where(User.username == username)
-        )
+        result = await session.execute(_USER_BY_USERNAME, {"username": username})
         return result.scalar_one_or_none()
     except Exception as e:
         logger.error(f"Error getting user by username {username}: {e}")
@@ -74,31 +127,112 @@ async def get_user_by_username(session: AsyncSession, username: str) -> Optional
 async def get_user_by_email(session: AsyncSession, email: str) -> Optional[User]:
     """Get user by email"""
     try:
-        result = await session.execute(
-            select(User).where(User.email == email)
-        )
+        result = await session.execute(_USER_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
     except Exception as e:
         logger.error(f"Error getting user by email {email}: {e}")
         return None
 
+# Columns needed to render a user listing; password_hash and deleted_at are
+# never selected so list endpoints don't pull them over the wire.
+USER_LIST_COLUMNS = (
+    User.id,
+    User.username,
+    User.email,
+    User.status,
+    User.preferences,
+    User.travel_history,
+    User.profile_data,
+    User.created_at,
+    User.updated_at,
+    User.is_deleted,
+)
+
+_USERS_PAGE = (
+    select(*USER_LIST_COLUMNS)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+    .order_by(User.created_at)
+)
+
+_USERS_COMPACT_PAGE = (
+    select(User.id, User.username, User.email)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+    .order_by(User.created_at)
+)
+
 async def get_users(
     session: AsyncSession,
     skip: int = 0,
     limit: int = 100
-) -> List[User]:
-    """Get users with pagination"""
+) -> AsyncIterator[Row]:
+    """Stream users with pagination as column-projected rows (no ORM hydration)"""
     try:
-        result = await session.execute(
-            select(User)
-            .offset(skip)
-            .limit(limit)
-            .order_by(User.created_at)
+        result = await session.stream(
+            _USERS_PAGE.execution_options(yield_per=STREAM_YIELD_PER),
+            {"skip": skip, "limit": limit}
         )
-        return result.scalars().all()
+        async for row in result:
+            yield row
     except Exception as e:
         logger.error(f"Error getting users: {e}")
-        return []
+        raise
+
+async def get_user_list_compact(
+    session: AsyncSession,
+    skip: int = 0,
+    limit: int = 100
+) -> AsyncIterator[Row]:
+    """Stream (id, username, email) rows for listings that need nothing else"""
+    try:
+        result = await session.stream(
+            _USERS_COMPACT_PAGE.execution_options(yield_per=STREAM_YIELD_PER),
+            {"skip": skip, "limit": limit}
+        )
+        async for row in result:
+            yield row
+    except Exception as e:
+        logger.error(f"Error getting compact user list: {e}")
+        raise
+
+async def update_user(
+    session: AsyncSession,
+    user_id: UUID,
+    **kwargs
+) -> Optional[User]:
+    """Update user fields, returning the updated row in the same round-trip"""
+    try:
+        result = await session.execute(
+            update(User)
+            .where(User.id == user_id, User.is_deleted.is_(False))
+            .values(**kwargs)
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
+        user = result.scalar_one_or_none()
+        await session.commit()
+        return user
+    except Exception as e:
+        await session.rollback()
+        logger.error(f"Error updating user {user_id}: {e}")
+        return None
+
+async def soft_delete_user(session: AsyncSession, user_id: UUID) -> bool:
+    """Mark a user deleted with a single UPDATE; returns whether a row was deleted"""
+    try:
+        result = await session.execute(
+            update(User)
+            .where(User.id == user_id, User.is_deleted.is_(False))
+            .values(is_deleted=True, deleted_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        return result.rowcount > 0
+    except Exception as e:
+        await session.rollback()
+        logger.error(f"Error deleting user {user_id}: {e}")
+        return False
 
 # ===== ITINERARY CRUD OPERATIONS =====
 
@@ -111,19 +245,22 @@ async def create_itinerary(
     user_id: UUID,
     status: str = "draft"
 ) -> Itinerary:
-    """Create a new itinerary"""
+    """Create a new itinerary, returning the stored row from the INSERT itself"""
     try:
-        itinerary = Itinerary(
-            name=name,
-            start_date=start_date,
-            end_date=end_date,
-            status=status,
-            data=data,
-            user_id=user_id
+        result = await session.execute(
+            insert(Itinerary)
+            .values(**_insert_values(Itinerary(
+                name=name,
+                start_date=start_date,
+                end_date=end_date,
+                status=status,
+                data=data,
+                user_id=user_id
+            )))
+            .returning(Itinerary)
         )
-        session.add(itinerary)
+        itinerary = result.scalar_one()
         await session.commit()
-        await session.refresh(itinerary)
         logger.info(f"Created itinerary: {name}")
         return itinerary
     except Exception as e:
@@ -131,18 +268,56 @@ async def create_itinerary(
         logger.error(f"Error creating itinerary: {e}")
         raise
 
+# Loader options for reading an itinerary with everything it is rendered with:
+# each link collection arrives in one selectin query that inner-joins its
+# catalog item (the FK is part of the link's primary key, so never NULL),
+# and any other relationship raises instead of lazy loading
+ITIN_LOADER_OPTS = (
+    selectinload(Itinerary.dest_links).joinedload(ItineraryDestination.destination, innerjoin=True),
+    selectinload(Itinerary.act_links).joinedload(ItineraryActivity.activity, innerjoin=True),
+    selectinload(Itinerary.accom_links).joinedload(ItineraryAccommodation.accommodation, innerjoin=True),
+    selectinload(Itinerary.trans_links).joinedload(ItineraryTransportation.transportation, innerjoin=True),
+    raiseload("*"),
+)
+
+# Itinerary reads are built once with bound parameters, like the user lookups
+_ITINERARY_WITH_LINKS = (
+    select(Itinerary)
+    .options(*ITIN_LOADER_OPTS)
+    .where(Itinerary.id == bindparam("itinerary_id"), Itinerary.is_deleted.is_(False))
+)
+_USER_ITINERARIES = (
+    select(Itinerary)
+    .options(raiseload("*"))
+    .where(Itinerary.user_id == bindparam("user_id"), Itinerary.is_deleted.is_(False))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+    .order_by(desc(Itinerary.created_at))
+)
+
+# Columns for itinerary listings; data, tags and notes are left out
+ITINERARY_LIST_COLUMNS = (
+    Itinerary.id,
+    Itinerary.name,
+    Itinerary.start_date,
+    Itinerary.end_date,
+    Itinerary.status,
+    Itinerary.budget,
+    Itinerary.created_at,
+)
+
+_USER_ITINERARY_LIST = (
+    select(*ITINERARY_LIST_COLUMNS)
+    .where(Itinerary.user_id == bindparam("user_id"), Itinerary.is_deleted.is_(False))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+    .order_by(desc(Itinerary.created_at))
+)
+
 async def get_itinerary_by_id(session: AsyncSession, itinerary_id: UUID) -> Optional[Itinerary]:
     """Get itinerary by ID with user relationship"""
     try:
-        result = await session.execute(
-            select(Itinerary)
-            .options(
-                selectinload(Itinerary.dest_links).selectinload(ItineraryDestination.destination),
-                selectinload(Itinerary.act_links).selectinload(ItineraryActivity.activity),
-                selectinload(Itinerary.accom_links).selectinload(ItineraryAccommodation.accommodation),
-                selectinload(Itinerary.trans_links).selectinload(ItineraryTransportation.transportation),
-            ).where(Itinerary.id == itinerary_id)
-        )
+        result = await session.execute(_ITINERARY_WITH_LINKS, {"itinerary_id": itinerary_id})
         itin = result.scalar_one_or_none()
         if not itin:
             raise HTTPException(
@@ -167,133 +342,335 @@ async def get_user_itineraries(
     user_id: UUID,
     skip: int = 0,
     limit: int = 100
-) -> List[Itinerary]:
-    """Get user's itineraries"""
+) -> AsyncIterator[Itinerary]:
+    """Stream user's itineraries"""
     try:
-        result = await session.execute(
-            select(Itinerary)
-            .where(Itinerary.user_id == user_id)
-            .offset(skip)
-            .limit(limit)
-            .order_by(desc(Itinerary.created_at))
-        )
-        return result.scalars().all()
+        async for itinerary in _stream_scalars(
+            session,
+            _USER_ITINERARIES,
+            {"user_id": user_id, "skip": skip, "limit": limit}
+        ):
+            yield itinerary
     except Exception as e:
         logger.error(f"Error getting itineraries for user {user_id}: {e}")
-        return []
+        raise
 
-# Legacy function name for compatibility
-async def get_itineraries(
+async def get_user_itinerary_list_compact(
     session: AsyncSession,
     user_id: UUID,
     skip: int = 0,
     limit: int = 100
-) -> List[Itinerary]:
-    """Legacy function - redirects to get_user_itineraries"""
-    return await get_user_itineraries(session, user_id, skip, limit)
+) -> AsyncIterator[Row]:
+    """Stream a user's itineraries as column-projected rows (no ORM hydration)"""
+    try:
+        result = await session.stream(
+            _USER_ITINERARY_LIST.execution_options(yield_per=STREAM_YIELD_PER),
+            {"user_id": user_id, "skip": skip, "limit": limit}
+        )
+        async for row in result:
+            yield row
+    except Exception as e:
+        logger.error(f"Error getting compact itinerary list for user {user_id}: {e}")
+        raise
+
 
 async def update_itinerary(
     session: AsyncSession,
     itinerary_id: UUID,
     **kwargs
 ) -> Optional[Itinerary]:
-    """Update itinerary fields"""
+    """Update itinerary fields, returning the updated row in the same round-trip"""
     try:
-        await session.execute(
+        result = await session.execute(
             update(Itinerary)
             .where(Itinerary.id == itinerary_id)
             .values(**kwargs)
+            .returning(Itinerary)
+            .execution_options(populate_existing=True)
         )
+        itinerary = result.scalar_one_or_none()
         await session.commit()
-        
-        # Return updated itinerary
-        result = await session.execute(
-            select(Itinerary).where(Itinerary.id == itinerary_id)
-        )
-        return result.scalar_one_or_none()
+        return itinerary
     except Exception as e:
         await session.rollback()
         logger.error(f"Error updating itinerary {itinerary_id}: {e}")
         return None
 
-# Legacy function for compatibility
 async def update_itinerary_status(
     session: AsyncSession,
     itinerary_id: UUID,
-    status: str
+    status: str,
+    owner_id: Optional[UUID] = None
 ) -> Optional[Itinerary]:
-    """Legacy function - update itinerary status"""
-    return await update_itinerary(session, itinerary_id, status=status)
+    """
+    Set an itinerary's status with a single UPDATE ... RETURNING.
+
+    With owner_id, only an itinerary belonging to that user matches, so the
+    ownership check needs no prior SELECT. Returns None when nothing matched.
+    """
+    conditions = [Itinerary.id == itinerary_id, Itinerary.is_deleted.is_(False)]
+    if owner_id is not None:
+        conditions.append(Itinerary.user_id == owner_id)
+    try:
+        result = await session.execute(
+            update(Itinerary)
+            .where(*conditions)
+            .values(status=status)
+            .returning(Itinerary)
+            .execution_options(populate_existing=True)
+        )
+        itinerary = result.scalar_one_or_none()
+        await session.commit()
+        return itinerary
+    except Exception as e:
+        await session.rollback()
+        logger.error(f"Error updating status of itinerary {itinerary_id}: {e}")
+        return None
+
+async def soft_delete_itinerary(
+    session: AsyncSession,
+    itinerary_id: UUID,
+    owner_id: Optional[UUID] = None
+) -> bool:
+    """
+    Mark an itinerary deleted with a single UPDATE, without loading it first.
+
+    Itineraries are soft-deleted since their destination/activity links and
+    bookings reference them. With owner_id, only that user's itinerary
+    matches. Returns whether a row was deleted.
+    """
+    conditions = [Itinerary.id == itinerary_id, Itinerary.is_deleted.is_(False)]
+    if owner_id is not None:
+        conditions.append(Itinerary.user_id == owner_id)
+    try:
+        result = await session.execute(
+            update(Itinerary)
+            .where(*conditions)
+            .values(is_deleted=True, deleted_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        return result.rowcount > 0
+    except Exception as e:
+        await session.rollback()
+        logger.error(f"Error deleting itinerary {itinerary_id}: {e}")
+        return False
+
+_ITINERARY_OWNER = select(Itinerary.user_id).where(
+    Itinerary.id == bindparam("itinerary_id"), Itinerary.is_deleted.is_(False)
+)
+
+async def get_itinerary_owner_id(session: AsyncSession, itinerary_id: UUID) -> Optional[UUID]:
+    """Owner of an itinerary, or None if it does not exist or was deleted"""
+    return await session.scalar(_ITINERARY_OWNER, {"itinerary_id": itinerary_id})
+
+# ===== BOOKING CRUD OPERATIONS =====
+
+def _decoded(column, codes: Dict[Any, str]):
+    """SQL expression turning a CodedEnum column's stored code back into the enum value"""
+    return case(
+        {code: member.value for member, code in codes.items()},
+        value=type_coerce(column, CHAR(1))
+    )
+
+_ITINERARY_BOOKINGS_PAGE = (
+    select(
+        Booking.id,
+        Booking.item_id,
+        _decoded(Booking.item_type, BOOKING_ITEM_TYPE_CODES).label("item_type"),
+        _decoded(Booking.status, BOOKING_STATUS_CODES).label("status"),
+        Booking.booking_date,
+        Booking.booking_details,
+        Booking.total_amount,
+        Booking.currency,
+        Booking.confirmation_number,
+    )
+    .where(Booking.itinerary_id == bindparam("itinerary_id"))
+    .order_by(desc(Booking.booking_date))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+    .subquery("booking")
+)
+
+# Postgres serializes the whole page into one JSON array, so rows are never
+# hydrated or re-encoded in Python. The subquery's ORDER BY only picks the
+# page; json_agg orders the array itself
+_ITINERARY_BOOKINGS_JSON = select(
+    func.coalesce(
+        func.json_agg(aggregate_order_by(
+            _ITINERARY_BOOKINGS_PAGE.table_valued(),
+            desc(_ITINERARY_BOOKINGS_PAGE.c.booking_date)
+        )),
+        text("'[]'::json")
+    ).cast(Text)
+)
+
+async def get_itinerary_bookings_json(
+    session: AsyncSession,
+    itinerary_id: UUID,
+    skip: int = 0,
+    limit: int = 100
+) -> str:
+    """An itinerary's bookings, newest first, as a JSON array string"""
+    return await session.scalar(
+        _ITINERARY_BOOKINGS_JSON,
+        {"itinerary_id": itinerary_id, "skip": skip, "limit": limit}
+    )
 
 # ===== CATALOG CRUD OPERATIONS =====
 
+# Catalog pages are built once; skip/limit are bound per call
+_DESTINATIONS_PAGE = select(Destination).offset(bindparam("skip")).limit(bindparam("limit"))
+_ACTIVITIES_PAGE = select(Activity).offset(bindparam("skip")).limit(bindparam("limit"))
+_ACCOMMODATIONS_PAGE = select(Accommodation).offset(bindparam("skip")).limit(bindparam("limit"))
+_TRANSPORTATIONS_PAGE = select(Transportation).offset(bindparam("skip")).limit(bindparam("limit"))
+
 async def get_destinations(
     session: AsyncSession,
     skip: int = 0,
     limit: int = 100
-) -> List[Destination]:
-    """Get destinations with pagination"""
+) -> AsyncIterator[Destination]:
+    """Stream destinations with pagination"""
     try:
-        result = await session.execute(
-            select(Destination)
-            .offset(skip)
-            .limit(limit)
-        )
-        return result.scalars().all()
+        async for item in _stream_scalars(
+            session, _DESTINATIONS_PAGE, {"skip": skip, "limit": limit}
+        ):
+            yield item
     except Exception as e:
         logger.error(f"Error getting destinations: {e}")
-        return []
+        raise
 
-async def get_activities(
+# Columns for destination listings; description, images and
+# climate_data are left out so rows skip their decode
+DESTINATION_LIST_COLUMNS = (
+    Destination.id,
+    Destination.name,
+    Destination.country,
+    Destination.region,
+    Destination.latitude,
+    Destination.longitude,
+    Destination.rating,
+)
+
+_DESTINATION_LIST_PAGE = (
+    select(*DESTINATION_LIST_COLUMNS)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
+async def get_destination_list_compact(
     session: AsyncSession,
     skip: int = 0,
     limit: int = 100
-) -> List[Activity]:
-    """Get activities with pagination"""
+) -> AsyncIterator[Row]:
+    """Stream destinations as column-projected rows (no ORM hydration)"""
     try:
-        result = await session.execute(
-            select(Activity)
-            .offset(skip)
-            .limit(limit)
+        result = await session.stream(
+            _DESTINATION_LIST_PAGE.execution_options(yield_per=STREAM_YIELD_PER),
+            {"skip": skip, "limit": limit}
         )
-        return result.scalars().all()
+        async for row in result:
+            yield row
+    except Exception as e:
+        logger.error(f"Error getting compact destination list: {e}")
+        raise
+
+async def get_activities(
+    session: AsyncSession,
+    skip: int = 0,
+    limit: int = 100
+) -> AsyncIterator[Activity]:
+    """Stream activities with pagination"""
+    try:
+        async for item in _stream_scalars(
+            session, _ACTIVITIES_PAGE, {"skip": skip, "limit": limit}
+        ):
+            yield item
     except Exception as e:
         logger.error(f"Error getting activities: {e}")
-        return []
+        raise
 
 async def get_accommodations(
     session: AsyncSession,
     skip: int = 0,
     limit: int = 100
-) -> List[Accommodation]:
-    """Get accommodations with pagination"""
+) -> AsyncIterator[Accommodation]:
+    """Stream accommodations with pagination"""
     try:
-        result = await session.execute(
-            select(Accommodation)
-            .offset(skip)
-            .limit(limit)
-        )
-        return result.scalars().all()
+        async for item in _stream_scalars(
+            session, _ACCOMMODATIONS_PAGE, {"skip": skip, "limit": limit}
+        ):
+            yield item
     except Exception as e:
         logger.error(f"Error getting accommodations: {e}")
-        return []
+        raise
 
 async def get_transportations(
     session: AsyncSession,
     skip: int = 0,
     limit: int = 100
-) -> List[Transportation]:
-    """Get transportations with pagination"""
+) -> AsyncIterator[Transportation]:
+    """Stream transportations with pagination"""
     try:
-        result = await session.execute(
-            select(Transportation)
-            .offset(skip)
-            .limit(limit)
-        )
-        return result.scalars().all()
+        async for item in _stream_scalars(
+            session, _TRANSPORTATIONS_PAGE, {"skip": skip, "limit": limit}
+        ):
+            yield item
     except Exception as e:
         logger.error(f"Error getting transportations: {e}")
-        return []
+        raise
+
+def _copy_value(column, value: Any) -> Any:
+    """A model attribute as asyncpg's binary COPY expects it for this column"""
+    if value is None and column.default is not None:
+        # Python-side column defaults (is_deleted=False, ...) are normally applied
+        # by the INSERT statement, which COPY bypasses
+        default = column.default
+        value = default.arg(None) if default.is_callable else default.arg
+    if value is not None and isinstance(column.type, JSON):
+        return json.dumps(value)
+    return value
+
+async def copy_catalog_rows(session: AsyncSession, model: Any, objects: List[Any]) -> int:
+    """
+    Bulk load catalog rows with binary COPY into a temporary staging table, then
+    move them over with INSERT ... SELECT ... ON CONFLICT (id) DO NOTHING.
+
+    Skips the ORM unit of work and the per-row INSERT; rows whose id already
+    exists are left alone. Runs in the caller's transaction without committing.
+    Returns the number of rows inserted.
+    """
+    if not objects:
+        return 0
+    table = model.__table__
+    # Generated columns are never written; server defaults fill columns left unset
+    columns = [
+        column for column in table.columns
+        if column.computed is None and not (
+            column.server_default is not None
+            and all(getattr(obj, column.key) is None for obj in objects)
+        )
+    ]
+    names = [column.name for column in columns]
+    records = [
+        tuple(_copy_value(column, getattr(obj, column.key)) for column in columns)
+        for obj in objects
+    ]
+    staging = f"_copy_{table.name}"
+    column_list = ", ".join(f'"{name}"' for name in names)
+
+    connection = await session.connection()
+    await connection.exec_driver_sql(f"DROP TABLE IF EXISTS {staging}")
+    await connection.exec_driver_sql(
+        f"CREATE TEMP TABLE {staging} (LIKE {table.name} INCLUDING DEFAULTS) ON COMMIT DROP"
+    )
+    await db_manager.bulk_insert(staging, names, records, connection=connection)
+    result = await connection.exec_driver_sql(
+        f"INSERT INTO {table.name} ({column_list}) "
+        f"SELECT {column_list} FROM {staging} ON CONFLICT (id) DO NOTHING"
+    )
+    logger.info(f"Copied {result.rowcount} of {len(objects)} rows into {table.name}")
+    return result.rowcount
 
 # ===== REVIEW CRUD OPERATIONS =====
 
@@ -304,17 +681,20 @@ async def create_review(
     user_id: UUID,
     text: Optional[str] = None
 ) -> Review:
-    """Create a new review"""
+    """Create a new review, returning the stored row from the INSERT itself"""
     try:
-        review = Review(
-            rating=rating,
-            text=text,
-            item_id=item_id,
-            user_id=user_id
+        result = await session.execute(
+            insert(Review)
+            .values(**_insert_values(Review(
+                rating=rating,
+                text=text,
+                item_id=item_id,
+                user_id=user_id
+            )))
+            .returning(Review)
         )
-        session.add(review)
+        review = result.scalar_one()
         await session.commit()
-        await session.refresh(review)
         logger.info(f"Created review for item: {item_id}")
         return review
     except Exception as e:
@@ -322,44 +702,86 @@ async def create_review(
         logger.error(f"Error creating review: {e}")
         raise
 
+_ITEM_REVIEWS = (
+    select(Review)
+    .where(Review.item_id == bindparam("item_id"))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
 async def get_item_reviews(
     session: AsyncSession,
     item_id: str,
     skip: int = 0,
     limit: int = 100
-) -> List[Review]:
-    """Get reviews for an item"""
+) -> AsyncIterator[Review]:
+    """Stream reviews for an item"""
     try:
-        result = await session.execute(
-            select(Review)
-            .where(Review.item_id == item_id)
-            .offset(skip)
-            .limit(limit)
-        )
-        return result.scalars().all()
+        async for review in _stream_scalars(
+            session, _ITEM_REVIEWS, {"item_id": item_id, "skip": skip, "limit": limit}
+        ):
+            yield review
     except Exception as e:
         logger.error(f"Error getting reviews for item {item_id}: {e}")
-        return []
+        raise
 
 # ===== CATALOG STATS =====
 
+_CATALOG_COUNTS = select(
+    select(func.count(Destination.id)).scalar_subquery().label("destinations"),
+    select(func.count(Activity.id)).scalar_subquery().label("activities"),
+    select(func.count(Accommodation.id)).scalar_subquery().label("accommodations"),
+    select(func.count(Transportation.id)).scalar_subquery().label("transportations"),
+)
+
+async def count_catalog_items(session: AsyncSession) -> Dict[str, int]:
+    """
+    Count the items in each catalog table in a single round-trip.
+
+    Each count is a scalar subquery of one SELECT, so Postgres runs all four in
+    one statement instead of the caller awaiting four queries in turn. This
+    also beats fanning four queries out with asyncio.gather: an AsyncSession
+    runs one statement at a time, so that would need four pooled connections
+    to save the same round-trips.
+    """
+    counts = (await session.execute(_CATALOG_COUNTS)).one()
+    return {name: value or 0 for name, value in counts._mapping.items()}
+
+CATALOG_TABLES = {
+    "destinations": Destination.__tablename__,
+    "activities": Activity.__tablename__,
+    "accommodations": Accommodation.__tablename__,
+    "transportations": Transportation.__tablename__,
+}
+
+async def estimate_catalog_items(session: AsyncSession) -> Dict[str, int]:
+    """
+    Approximate catalog table counts from the Postgres planner statistics.
+
+    Reads pg_class.reltuples, which costs a catalog lookup per table instead of
+    a full scan, and is as fresh as the last VACUUM/ANALYZE. Falls back to exact
+    counts on other databases or when any table has never been analyzed.
+    """
+    if session.bind.dialect.name != "postgresql":
+        return await count_catalog_items(session)
+    
+    result = await session.execute(
+        text(
+            "SELECT relname, reltuples::bigint FROM pg_class "
+            "WHERE relkind = 'r' AND pg_table_is_visible(oid) AND relname = ANY(:names)"
+        ),
+        {"names": list(CATALOG_TABLES.values())}
+    )
+    estimates = dict(result.all())
+    if any(estimates.get(table, -1) < 0 for table in CATALOG_TABLES.values()):
+        return await count_catalog_items(session)
+    return {name: estimates[table] for name, table in CATALOG_TABLES.items()}
+
 async def get_catalog_stats(session: AsyncSession) -> Dict[str, int]:
     """Get catalog statistics"""
     try:
-        # Count items in each table
-        destinations_count = await session.scalar(select(func.count(Destination.id)))
-        activities_count = await session.scalar(select(func.count(Activity.id)))
-        accommodations_count = await session.scalar(select(func.count(Accommodation.id)))
-        transportations_count = await session.scalar(select(func.count(Transportation.id)))
-        
-        return {
-            "destinations": destinations_count or 0,
-            "activities": activities_count or 0,
-            "accommodations": accommodations_count or 0,
-            "transportations": transportations_count or 0,
-            "total": (destinations_count or 0) + (activities_count or 0) + 
-                    (accommodations_count or 0) + (transportations_count or 0)
-        }
+        counts = await count_catalog_items(session)
+        return {**counts, "total": sum(counts.values())}
     except Exception as e:
         logger.error(f"Error getting catalog stats: {e}")
         return {
@@ -368,4 +790,4 @@ async def get_catalog_stats(session: AsyncSession) -> Dict[str, int]:
             "accommodations": 0,
             "transportations": 0,
             "total": 0
-        }
\ No newline at end of file
+        }
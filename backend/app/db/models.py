@@ -1,17 +1,76 @@
-import uuid
 from datetime import datetime, timezone
 from enum import Enum
 from typing import List, Optional, Dict, Any
 from decimal import Decimal
+from functools import partial
 import re
 
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column, DateTime, Index, CheckConstraint, Boolean
-from sqlalchemy.dialects.postgresql import JSON, ENUM as PG_ENUM, UUID as PG_UUID
+from sqlalchemy import (
+    ARRAY, CHAR, Column, Computed, DateTime, Float, Index, Integer, CheckConstraint, Boolean, Text, func,
+    text as sa_text
+)
+from sqlalchemy.dialects.postgresql import JSON, JSONB, UUID as PG_UUID
+from sqlalchemy import DDL, event
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.orm import declared_attr, Mapped
+from geoalchemy2 import Geography
 from pydantic import field_validator, computed_field
 from uuid import UUID as PyUUID
 
+# Primary keys are time-ordered UUIDv7s generated in Postgres: a 48-bit
+# millisecond timestamp overwrites the first six bytes of a random v4 UUID and
+# the version nibble is set to 7, so new rows append to the right-most leaf of
+# each primary key index instead of splitting random pages
+UUID_V7_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION uuid_v7() RETURNS uuid
+LANGUAGE sql VOLATILE AS $$
+    SELECT encode(
+        set_bit(set_bit(
+            overlay(uuid_send(gen_random_uuid())
+                placing substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                FROM 1 FOR 6),
+            52, 1), 53, 1),
+        'hex')::uuid
+$$
+""")
+event.listen(SQLModel.metadata, "before_create", UUID_V7_FUNCTION)
+
+# Shared default for every timestamp column and field
+_utcnow = partial(datetime.now, timezone.utc)
+
+# Compiled once at import; the image validators run for every catalog row the loaders write
+_PHOTOREF_RE = re.compile(r'photoreference=([^&\s]+)')
+_APIKEY_RE = re.compile(r'&key=[^&\s]*')
+
+def normalize_image_refs(images: Optional[List[str]]) -> Optional[List[str]]:
+    """
+    Normalize stored image references to extract photoreference tokens only.
+    If a full Google Place Photo URL is provided, extract the photoreference parameter.
+    If the URL contains an API key, strip it.
+    Store only the photoreference token; signed URLs are built at response time.
+    """
+    if not images:
+        return images
+
+    normalized = []
+    append = normalized.append
+    search = _PHOTOREF_RE.search
+    strip_key = _APIKEY_RE.sub
+    for img in images:
+        if not img:
+            continue
+        # Try to extract photoreference from full Google Place Photo URL
+        match = search(img)
+        if match:
+            # Store only the photoreference token
+            append(match.group(1))
+        else:
+            # If it's already a token or some other URL, store as-is but strip API key
+            append(strip_key('', img))
+
+    return normalized if normalized else None
+
 # Enums
 class ItemType(str, Enum):
     DESTINATION = "DESTINATION"
@@ -43,6 +102,69 @@ class UserStatus(str, Enum):
     INACTIVE = "inactive"
     SUSPENDED = "suspended"
 
+# One-letter storage codes for the enums above. Append new members with a
+# fresh letter and widen the matching CHECK constraint; never reuse a code.
+ITEM_TYPE_CODES = {
+    ItemType.DESTINATION: "D",
+    ItemType.ACTIVITY: "A",
+    ItemType.ACCOMMODATION: "H",
+    ItemType.TRANSPORTATION: "T",
+}
+BOOKING_ITEM_TYPE_CODES = {
+    BookingItemType.DESTINATION: "D",
+    BookingItemType.ACTIVITY: "A",
+    BookingItemType.ACCOMMODATION: "H",
+    BookingItemType.TRANSPORTATION: "T",
+}
+ITINERARY_STATUS_CODES = {
+    ItineraryStatus.DRAFT: "D",
+    ItineraryStatus.GENERATED: "G",
+    ItineraryStatus.BOOKED: "B",
+    ItineraryStatus.CANCELLED: "X",
+    ItineraryStatus.COMPLETED: "C",
+}
+BOOKING_STATUS_CODES = {
+    BookingStatus.PENDING: "P",
+    BookingStatus.CONFIRMED: "F",
+    BookingStatus.CANCELLED: "X",
+    BookingStatus.COMPLETED: "C",
+}
+USER_STATUS_CODES = {
+    UserStatus.ACTIVE: "A",
+    UserStatus.INACTIVE: "I",
+    UserStatus.SUSPENDED: "S",
+}
+
+class CodedEnum(TypeDecorator):
+    """
+    Stores a str Enum as a CHAR(1) code and hands the Enum member back to the
+    application, so queries keep comparing against ItineraryStatus.BOOKED etc.
+    """
+    impl = CHAR
+    cache_ok = True
+
+    def __init__(self, enum_class: type, codes: Dict[Any, str]):
+        super().__init__(1)
+        self.enum_class = enum_class
+        self.codes = tuple(codes.items())
+        self._to_code = dict(self.codes)
+        self._to_member = {code: member for member, code in self.codes}
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[str]:
+        if value is None:
+            return None
+        return self._to_code[self.enum_class(value)]
+
+    def process_result_value(self, value: Optional[str], dialect: Any) -> Any:
+        if value is None:
+            return None
+        return self._to_member[value]
+
+def codes_check(column: str, codes: Dict[Any, str], name: str) -> CheckConstraint:
+    """CHECK constraint limiting a CodedEnum column to its known codes"""
+    allowed = ", ".join(f"'{code}'" for code in codes.values())
+    return CheckConstraint(f"{column} IN ({allowed})", name=name)
+
 # Base model with common fields (for new tables only)
 class BaseModel(SQLModel):
     """Base model with common audit fields for new tables"""
@@ -56,7 +178,7 @@ class AuditMixin:
         return Column(
             DateTime(timezone=True),
             nullable=False,
-            default=lambda: datetime.now(timezone.utc),
+            server_default=func.now(),
         )
 
     @declared_attr
@@ -64,8 +186,10 @@ class AuditMixin:
         return Column(
             DateTime(timezone=True),
             nullable=False,
-            default=lambda: datetime.now(timezone.utc),
-            onupdate=lambda: datetime.now(timezone.utc),
+            server_default=func.now(),
+            # Set in the UPDATE itself; a trigger would expire the attribute
+            # after every flush and need a refetch under asyncio
+            onupdate=_utcnow,
         )
 
     @declared_attr
@@ -82,15 +206,23 @@ class User(AuditMixin, BaseModel, table=True):
     
     # Add indexes for better performance
     __table_args__ = (
-        Index('idx_users_username', 'username'),
-        Index('idx_users_email', 'email'),
+        # username and email lookups use the unique indexes from unique=True
         Index('idx_users_status', 'status'),
         Index('idx_users_created_at', 'created_at'),
         CheckConstraint('length(username) >= 3', name='check_username_length'),
+        CheckConstraint("username ~ '^[a-z0-9_]+$'", name='check_username_charset'),
         CheckConstraint('length(email) > 0', name='check_email_not_empty'),
+        codes_check('status', USER_STATUS_CODES, 'check_user_status'),
     )
 
-    id: PyUUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: Optional[PyUUID] = Field(
+        default=None,
+        sa_column=Column(
+            PG_UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa_text("uuid_v7()")
+        )
+    )
     username: str = Field(
         index=True, 
         unique=True, 
@@ -113,25 +245,25 @@ class User(AuditMixin, BaseModel, table=True):
     status: UserStatus = Field(
         default=UserStatus.ACTIVE,
         sa_column=Column(
-            PG_ENUM(UserStatus, name="userstatus"),
+            CodedEnum(UserStatus, USER_STATUS_CODES),
             nullable=False,
-            server_default=UserStatus.ACTIVE.value
+            server_default=USER_STATUS_CODES[UserStatus.ACTIVE]
         ),
         description="User account status"
     )
     preferences: Optional[Dict[str, Any]] = Field(
         default=None, 
-        sa_column=Column(JSON, nullable=True),
+        sa_column=Column(JSONB, nullable=True),
         description="User preferences and settings"
     )
     travel_history: Optional[Dict[str, Any]] = Field(
         default=None, 
-        sa_column=Column(JSON, nullable=True),
+        sa_column=Column(JSONB, nullable=True),
         description="User's travel history and statistics"
     )
     profile_data: Optional[Dict[str, Any]] = Field(
         default=None,
-        sa_column=Column(JSON, nullable=True),
+        sa_column=Column(JSONB, nullable=True),
         description="Additional profile information"
     )
 
@@ -144,11 +276,11 @@ class User(AuditMixin, BaseModel, table=True):
     @field_validator('username')
     @classmethod
     def validate_username(cls, v: str) -> str:
-        if not v or len(v.strip()) < 3:
+        # The character set is enforced by check_username_charset
+        v = v.strip() if v else v
+        if not v or len(v) < 3:
             raise ValueError('Username must be at least 3 characters')
-        if not v.isalnum() and '_' not in v:
-            raise ValueError('Username can only contain alphanumeric characters and underscores')
-        return v.strip().lower()
+        return v.lower()
 
     @field_validator('email')
     @classmethod
@@ -168,15 +300,39 @@ class Itinerary(AuditMixin, BaseModel, table=True):
     __tablename__ = "itineraries"
     
     __table_args__ = (
-        Index('idx_itineraries_user_id', 'user_id'),
-        Index('idx_itineraries_status', 'status'),
-        Index('idx_itineraries_dates', 'start_date', 'end_date'),
+        # user_id leads every composite, so none of them needs a separate
+        # user_id index; equality columns first, the range column last. The
+        # per-user indexes are partial on live rows: every itinerary read
+        # filters is_deleted IS false, so tombstones never need an entry.
+        Index(
+            'idx_itineraries_user_status', 'user_id', 'status',
+            postgresql_where=sa_text('is_deleted IS false')
+        ),
+        Index(
+            'idx_itineraries_user_start_end', 'user_id', 'start_date', 'end_date',
+            postgresql_where=sa_text('is_deleted IS false')
+        ),
+        # Also covers the compact listing's columns (ITINERARY_LIST_COLUMNS in
+        # crud) so that page is served by an index-only scan
+        Index(
+            'idx_itineraries_user_created_at', 'user_id', 'created_at',
+            postgresql_where=sa_text('is_deleted IS false'),
+            postgresql_include=['id', 'name', 'start_date', 'end_date', 'status', 'budget']
+        ),
         Index('idx_itineraries_created_at', 'created_at'),
         CheckConstraint('start_date < end_date', name='check_valid_date_range'),
         CheckConstraint('length(name) > 0', name='check_name_not_empty'),
+        codes_check('status', ITINERARY_STATUS_CODES, 'check_itinerary_status'),
     )
 
-    id: PyUUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: Optional[PyUUID] = Field(
+        default=None,
+        sa_column=Column(
+            PG_UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa_text("uuid_v7()")
+        )
+    )
     name: str = Field(
         max_length=200,
         description="Itinerary name"
@@ -189,13 +345,22 @@ class Itinerary(AuditMixin, BaseModel, table=True):
         sa_column=Column(DateTime(timezone=True)),
         description="Trip end date"
     )
+    # Generated by Postgres on write; None on an object that has not been flushed
+    duration_days: Optional[int] = Field(
+        default=None,
+        sa_column=Column(
+            Integer,
+            Computed("CAST(EXTRACT(DAY FROM end_date - start_date) AS integer)", persisted=True)
+        ),
+        description="Trip duration in days"
+    )
     status: ItineraryStatus = Field(
         default=ItineraryStatus.DRAFT,
-        sa_column=Column(PG_ENUM(ItineraryStatus, name="itinerarystatus")),
+        sa_column=Column(CodedEnum(ItineraryStatus, ITINERARY_STATUS_CODES)),
         description="Current itinerary status"
     )
     data: Dict[str, Any] = Field(
-        sa_column=Column(JSON, nullable=False),
+        sa_column=Column(JSONB, nullable=False),
         description="Raw parsed parameters (locations, dates, interests, budget)"
     )
     user_id: PyUUID = Field(
@@ -216,7 +381,7 @@ class Itinerary(AuditMixin, BaseModel, table=True):
     )
     tags: Optional[List[str]] = Field(
         default=None,
-        sa_column=Column(JSON, nullable=True),
+        sa_column=Column(ARRAY(Text), nullable=True),
         description="Tags for categorizing itineraries"
     )
 
@@ -232,9 +397,10 @@ class Itinerary(AuditMixin, BaseModel, table=True):
     @field_validator('name')
     @classmethod
     def validate_name(cls, v: str) -> str:
-        if not v or len(v.strip()) == 0:
+        v = v.strip() if v else v
+        if not v:
             raise ValueError('Itinerary name cannot be empty')
-        return v.strip()
+        return v
 
     @field_validator('start_date', 'end_date')
     @classmethod
@@ -243,14 +409,6 @@ class Itinerary(AuditMixin, BaseModel, table=True):
             raise ValueError('Dates cannot be in the past')
         return v
 
-    @computed_field
-    @property
-    def duration_days(self) -> int:
-        """Calculate trip duration in days"""
-        if self.start_date and self.end_date:
-            return (self.end_date - self.start_date).days
-        return 0
-
     @computed_field
     @property
     def is_active(self) -> bool:
@@ -271,7 +429,14 @@ class Destination(AuditMixin, BaseModel, table=True):
         CheckConstraint('rating IS NULL OR (rating >= 0 AND rating <= 10)', name='check_valid_rating'),
     )
 
-    id: PyUUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: Optional[PyUUID] = Field(
+        default=None,
+        sa_column=Column(
+            PG_UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa_text("uuid_v7()")
+        )
+    )
     name: str = Field(
         max_length=200,
         description="Destination name"
@@ -285,7 +450,7 @@ class Destination(AuditMixin, BaseModel, table=True):
     longitude: float = Field(description="Longitude coordinate")
     images: Optional[List[str]] = Field(
         default=None,
-        sa_column=Column(JSON, nullable=True),
+        sa_column=Column(ARRAY(Text), nullable=True),
         description="List of image URLs"
     )
     rating: Optional[float] = Field(
@@ -330,9 +495,10 @@ class Destination(AuditMixin, BaseModel, table=True):
     @field_validator('name')
     @classmethod
     def validate_name(cls, v: str) -> str:
-        if not v or len(v.strip()) == 0:
+        v = v.strip() if v else v
+        if not v:
             raise ValueError('Destination name cannot be empty')
-        return v.strip()
+        return v
 
     @field_validator('latitude', 'longitude')
     @classmethod
@@ -346,38 +512,15 @@ class Destination(AuditMixin, BaseModel, table=True):
     @field_validator('images', mode='before')
     @classmethod
     def normalize_images(cls, v: Optional[List[str]]) -> Optional[List[str]]:
-        """
-        Normalize stored image references to extract photoreference tokens only.
-        If a full Google Place Photo URL is provided, extract the photoreference parameter.
-        If the URL contains an API key, strip it.
-        Store only the photoreference token; signed URLs are built at response time.
-        """
-        if not v:
-            return v
-        
-        normalized = []
-        for img in v:
-            if not img:
-                continue
-            # Try to extract photoreference from full Google Place Photo URL
-            match = re.search(r'photoreference=([^&\s]+)', img)
-            if match:
-                # Store only the photoreference token
-                normalized.append(match.group(1))
-            else:
-                # If it's already a token or some other URL, store as-is but strip API key
-                # Remove any &key=... parameter
-                img_clean = re.sub(r'&key=[^&\s]*', '', img)
-                normalized.append(img_clean)
-        
-        return normalized if normalized else None
+        """Store photoreference tokens only; see normalize_image_refs"""
+        return normalize_image_refs(v)
 
 
 class ItineraryDestination(SQLModel, table=True):
     __tablename__ = "itinerary_destinations"
     
     __table_args__ = (
-        Index('idx_itinerary_destinations_itinerary', 'itinerary_id'),
+        # itinerary_id lookups use the (itinerary_id, ...) primary key
         Index('idx_itinerary_destinations_destination', 'destination_id'),
         Index('idx_itinerary_destinations_order', 'order'),
         CheckConstraint('"order" >= 0', name='check_valid_order'),
@@ -401,7 +544,10 @@ class ItineraryDestination(SQLModel, table=True):
 
     # Relationships
     itinerary: Itinerary = Relationship(back_populates="dest_links")
-    destination: Destination = Relationship(back_populates="dest_links")
+    destination: Destination = Relationship(
+        back_populates="dest_links",
+        sa_relationship_kwargs={"lazy": "joined", "innerjoin": True}
+    )
 
 
 class Activity(BaseModel, table=True):
@@ -419,7 +565,14 @@ class Activity(BaseModel, table=True):
         CheckConstraint('rating IS NULL OR (rating >= 0 AND rating <= 5)', name='check_valid_rating'),
     )
 
-    id: PyUUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: Optional[PyUUID] = Field(
+        default=None,
+        sa_column=Column(
+            PG_UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa_text("uuid_v7()")
+        )
+    )
     name: str = Field(
         max_length=200,
         description="Activity name"
@@ -433,7 +586,7 @@ class Activity(BaseModel, table=True):
     longitude: float = Field(description="Longitude coordinate")
     images: Optional[List[str]] = Field(
         default=None,
-        sa_column=Column(JSON, nullable=True),
+        sa_column=Column(ARRAY(Text), nullable=True),
         description="List of image URLs"
     )
     price: Optional[Decimal] = Field(
@@ -487,45 +640,23 @@ class Activity(BaseModel, table=True):
     @field_validator('name')
     @classmethod
     def validate_name(cls, v: str) -> str:
-        if not v or len(v.strip()) == 0:
+        v = v.strip() if v else v
+        if not v:
             raise ValueError('Activity name cannot be empty')
-        return v.strip()
+        return v
     
     @field_validator('images', mode='before')
     @classmethod
     def normalize_images(cls, v: Optional[List[str]]) -> Optional[List[str]]:
-        """
-        Normalize stored image references to extract photoreference tokens only.
-        If a full Google Place Photo URL is provided, extract the photoreference parameter.
-        If the URL contains an API key, strip it.
-        Store only the photoreference token; signed URLs are built at response time.
-        """
-        if not v:
-            return v
-        
-        normalized = []
-        for img in v:
-            if not img:
-                continue
-            # Try to extract photoreference from full Google Place Photo URL
-            match = re.search(r'photoreference=([^&\s]+)', img)
-            if match:
-                # Store only the photoreference token
-                normalized.append(match.group(1))
-            else:
-                # If it's already a token or some other URL, store as-is but strip API key
-                # Remove any &key=... parameter
-                img_clean = re.sub(r'&key=[^&\s]*', '', img)
-                normalized.append(img_clean)
-        
-        return normalized if normalized else None
+        """Store photoreference tokens only; see normalize_image_refs"""
+        return normalize_image_refs(v)
 
 
 class ItineraryActivity(SQLModel, table=True):
     __tablename__ = "itinerary_activities"
     
     __table_args__ = (
-        Index('idx_itinerary_activities_itinerary', 'itinerary_id'),
+        # itinerary_id lookups use the (itinerary_id, ...) primary key
         Index('idx_itinerary_activities_activity', 'activity_id'),
         Index('idx_itinerary_activities_order', 'order'),
         CheckConstraint('"order" >= 0', name='check_valid_order'),
@@ -554,7 +685,10 @@ class ItineraryActivity(SQLModel, table=True):
 
     # Relationships
     itinerary: Itinerary = Relationship(back_populates="act_links")
-    activity: Activity = Relationship(back_populates="act_links")
+    activity: Activity = Relationship(
+        back_populates="act_links",
+        sa_relationship_kwargs={"lazy": "joined", "innerjoin": True}
+    )
 
 
 class Accommodation(AuditMixin, BaseModel, table=True):
@@ -566,13 +700,22 @@ class Accommodation(AuditMixin, BaseModel, table=True):
         Index('idx_accommodations_price', 'price'),
         Index('idx_accommodations_rating', 'rating'),
         Index('idx_accommodations_type', 'type'),
+        # text[] GIN index for amenity filters (amenities @> ARRAY['wifi'])
+        Index('idx_accommodations_amenities_gin', 'amenities', postgresql_using='gin'),
         CheckConstraint('latitude BETWEEN -90 AND 90', name='check_valid_latitude'),
         CheckConstraint('longitude BETWEEN -180 AND 180', name='check_valid_longitude'),
         CheckConstraint('price IS NULL OR price >= 0', name='check_valid_price'),
         CheckConstraint('rating IS NULL OR (rating >= 0 AND rating <= 5)', name='check_valid_rating'),
     )
 
-    id: PyUUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: Optional[PyUUID] = Field(
+        default=None,
+        sa_column=Column(
+            PG_UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa_text("uuid_v7()")
+        )
+    )
     name: str = Field(
         max_length=200,
         description="Accommodation name"
@@ -586,7 +729,7 @@ class Accommodation(AuditMixin, BaseModel, table=True):
     longitude: float = Field(description="Longitude coordinate")
     images: Optional[List[str]] = Field(
         default=None,
-        sa_column=Column(JSON, nullable=True),
+        sa_column=Column(ARRAY(Text), nullable=True),
         description="List of image URLs"
     )
     price: Optional[Decimal] = Field(
@@ -602,7 +745,7 @@ class Accommodation(AuditMixin, BaseModel, table=True):
     )
     amenities: Optional[List[str]] = Field(
         default=None,
-        sa_column=Column(JSON, nullable=True),
+        sa_column=Column(ARRAY(Text), nullable=True),
         description="List of available amenities"
     )
     
@@ -646,45 +789,23 @@ class Accommodation(AuditMixin, BaseModel, table=True):
     @field_validator('name')
     @classmethod
     def validate_name(cls, v: str) -> str:
-        if not v or len(v.strip()) == 0:
+        v = v.strip() if v else v
+        if not v:
             raise ValueError('Accommodation name cannot be empty')
-        return v.strip()
+        return v
     
     @field_validator('images', mode='before')
     @classmethod
     def normalize_images(cls, v: Optional[List[str]]) -> Optional[List[str]]:
-        """
-        Normalize stored image references to extract photoreference tokens only.
-        If a full Google Place Photo URL is provided, extract the photoreference parameter.
-        If the URL contains an API key, strip it.
-        Store only the photoreference token; signed URLs are built at response time.
-        """
-        if not v:
-            return v
-        
-        normalized = []
-        for img in v:
-            if not img:
-                continue
-            # Try to extract photoreference from full Google Place Photo URL
-            match = re.search(r'photoreference=([^&\s]+)', img)
-            if match:
-                # Store only the photoreference token
-                normalized.append(match.group(1))
-            else:
-                # If it's already a token or some other URL, store as-is but strip API key
-                # Remove any &key=... parameter
-                img_clean = re.sub(r'&key=[^&\s]*', '', img)
-                normalized.append(img_clean)
-        
-        return normalized if normalized else None
+        """Store photoreference tokens only; see normalize_image_refs"""
+        return normalize_image_refs(v)
 
 
 class ItineraryAccommodation(SQLModel, table=True):
     __tablename__ = "itinerary_accommodations"
     
     __table_args__ = (
-        Index('idx_itinerary_accommodations_itinerary', 'itinerary_id'),
+        # itinerary_id lookups use the (itinerary_id, ...) primary key
         Index('idx_itinerary_accommodations_accommodation', 'accommodation_id'),
         Index('idx_itinerary_accommodations_order', 'order'),
         CheckConstraint('"order" >= 0', name='check_valid_order'),
@@ -718,7 +839,10 @@ class ItineraryAccommodation(SQLModel, table=True):
 
     # Relationships
     itinerary: Itinerary = Relationship(back_populates="accom_links")
-    accommodation: Accommodation = Relationship(back_populates="accom_links")
+    accommodation: Accommodation = Relationship(
+        back_populates="accom_links",
+        sa_relationship_kwargs={"lazy": "joined", "innerjoin": True}
+    )
 
 
 class Transportation(BaseModel, table=True):
@@ -737,7 +861,14 @@ class Transportation(BaseModel, table=True):
         CheckConstraint('departure_time < arrival_time', name='check_valid_time_range'),
     )
 
-    id: PyUUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: Optional[PyUUID] = Field(
+        default=None,
+        sa_column=Column(
+            PG_UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa_text("uuid_v7()")
+        )
+    )
     type: str = Field(
         max_length=100,
         description="Transportation type (flight, train, bus, car, etc.)"
@@ -754,6 +885,18 @@ class Transportation(BaseModel, table=True):
         sa_column=Column(DateTime(timezone=True)),
         description="Arrival time"
     )
+    # Generated by Postgres on write; None on an object that has not been flushed
+    duration_hours: Optional[float] = Field(
+        default=None,
+        sa_column=Column(
+            Float,
+            Computed(
+                "CAST(EXTRACT(EPOCH FROM arrival_time - departure_time) / 3600 AS double precision)",
+                persisted=True
+            )
+        ),
+        description="Journey duration in hours"
+    )
     price: Optional[Decimal] = Field(
         default=None,
         ge=0,
@@ -794,25 +937,17 @@ class Transportation(BaseModel, table=True):
     @field_validator('type')
     @classmethod
     def validate_type(cls, v: str) -> str:
-        if not v or len(v.strip()) == 0:
+        v = v.strip() if v else v
+        if not v:
             raise ValueError('Transportation type cannot be empty')
-        return v.strip().lower()
-
-    @computed_field
-    @property
-    def duration_hours(self) -> Optional[float]:
-        """Calculate journey duration in hours"""
-        if self.departure_time and self.arrival_time:
-            duration = self.arrival_time - self.departure_time
-            return duration.total_seconds() / 3600
-        return None
+        return v.lower()
 
 
 class ItineraryTransportation(SQLModel, table=True):
     __tablename__ = "itinerary_transportations"
     
     __table_args__ = (
-        Index('idx_itinerary_transportations_itinerary', 'itinerary_id'),
+        # itinerary_id lookups use the (itinerary_id, ...) primary key
         Index('idx_itinerary_transportations_transportation', 'transportation_id'),
         Index('idx_itinerary_transportations_order', 'order'),
         CheckConstraint('"order" >= 0', name='check_valid_order'),
@@ -836,21 +971,33 @@ class ItineraryTransportation(SQLModel, table=True):
 
     # Relationships
     itinerary: Itinerary = Relationship(back_populates="trans_links")
-    transportation: Transportation = Relationship(back_populates="trans_links")
+    transportation: Transportation = Relationship(
+        back_populates="trans_links",
+        sa_relationship_kwargs={"lazy": "joined", "innerjoin": True}
+    )
 
 
 class Booking(BaseModel, table=True):
     __tablename__ = "bookings"
     
     __table_args__ = (
-        Index('idx_bookings_user_id', 'user_id'),
+        # "My bookings, newest first, optionally by status"; a backward scan
+        # gives the descending booking_date order
+        Index('idx_bookings_user_date_status', 'user_id', 'booking_date', 'status'),
         Index('idx_bookings_itinerary_id', 'itinerary_id'),
-        Index('idx_bookings_status', 'status'),
-        Index('idx_bookings_booking_date', 'booking_date'),
         Index('idx_bookings_item', 'item_id', 'item_type'),
+        codes_check('item_type', BOOKING_ITEM_TYPE_CODES, 'check_booking_item_type'),
+        codes_check('status', BOOKING_STATUS_CODES, 'check_booking_status'),
     )
 
-    id: PyUUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: Optional[PyUUID] = Field(
+        default=None,
+        sa_column=Column(
+            PG_UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa_text("uuid_v7()")
+        )
+    )
     user_id: PyUUID = Field(
         foreign_key="users.id",
         nullable=False,
@@ -866,11 +1013,11 @@ class Booking(BaseModel, table=True):
         description="ID of the booked item"
     )
     item_type: BookingItemType = Field(
-        sa_column=Column(PG_ENUM(BookingItemType, name="bookingitemtype")),
+        sa_column=Column(CodedEnum(BookingItemType, BOOKING_ITEM_TYPE_CODES)),
         description="Type of booked item"
     )
     booking_date: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=_utcnow,
         sa_column=Column(DateTime(timezone=True), nullable=False),
         description="When the booking was made"
     )
@@ -880,7 +1027,7 @@ class Booking(BaseModel, table=True):
     )
     status: BookingStatus = Field(
         default=BookingStatus.PENDING,
-        sa_column=Column(PG_ENUM(BookingStatus, name="bookingstatus")),
+        sa_column=Column(CodedEnum(BookingStatus, BOOKING_STATUS_CODES)),
         description="Current booking status"
     )
     
@@ -914,9 +1061,10 @@ class Booking(BaseModel, table=True):
     @field_validator('item_id')
     @classmethod
     def validate_item_id(cls, v: str) -> str:
-        if not v or len(v.strip()) == 0:
+        v = v.strip() if v else v
+        if not v:
             raise ValueError('Item ID cannot be empty')
-        return v.strip()
+        return v
 
 
 class Review(BaseModel, table=True):
@@ -928,9 +1076,17 @@ class Review(BaseModel, table=True):
         Index('idx_reviews_rating', 'rating'),
         Index('idx_reviews_review_date', 'review_date'),
         CheckConstraint('rating >= 1 AND rating <= 5', name='check_valid_rating'),
+        codes_check('item_type', ITEM_TYPE_CODES, 'check_review_item_type'),
     )
 
-    id: PyUUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: Optional[PyUUID] = Field(
+        default=None,
+        sa_column=Column(
+            PG_UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa_text("uuid_v7()")
+        )
+    )
     user_id: PyUUID = Field(
         foreign_key="users.id",
         nullable=False,
@@ -941,7 +1097,7 @@ class Review(BaseModel, table=True):
         description="ID of the reviewed item"
     )
     item_type: ItemType = Field(
-        sa_column=Column(PG_ENUM(ItemType, name="itemtype")),
+        sa_column=Column(CodedEnum(ItemType, ITEM_TYPE_CODES)),
         description="Type of reviewed item"
     )
     rating: int = Field(
@@ -955,13 +1111,13 @@ class Review(BaseModel, table=True):
         description="Review text content"
     )
     review_date: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=_utcnow,
         sa_column=Column(DateTime(timezone=True), nullable=False),
         description="When the review was written"
     )
     images: Optional[List[str]] = Field(
         default=None,
-        sa_column=Column(JSON, nullable=True),
+        sa_column=Column(ARRAY(Text), nullable=True),
         description="List of image URLs"
     )
     
@@ -988,13 +1144,57 @@ class Review(BaseModel, table=True):
     @field_validator('item_id')
     @classmethod
     def validate_item_id(cls, v: str) -> str:
-        if not v or len(v.strip()) == 0:
+        v = v.strip() if v else v
+        if not v:
             raise ValueError('Item ID cannot be empty')
-        return v.strip()
+        return v
 
     @field_validator('review_text')
     @classmethod
     def validate_review_text(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and len(v.strip()) == 0:
-            return None
-        return v
+        # Whitespace-only text is stored as NULL; other text is kept as written
+        return v if v is None or v.strip() else None
+
+
+# ===== SPATIAL INDEXES =====
+
+def geography_point(longitude, latitude):
+    """
+    WGS84 geography point for a longitude/latitude pair. The radius queries
+    and the GiST indexes below share this expression, which is what lets
+    Postgres answer ST_DWithin from the index instead of a sequential scan.
+    It renders as geography(ST_SetSRID(ST_MakePoint(lon, lat), 4326)), the
+    same text as the migration's index expression: the geography() conversion
+    carries no typmod, unlike a CAST to the Geography column type, and the SRID
+    is inlined rather than bound so prepared statements still match the index.
+    """
+    return func.geography(
+        func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), sa_text("4326")),
+        type_=Geography
+    )
+
+Index(
+    'idx_destinations_location_gist',
+    geography_point(Destination.longitude, Destination.latitude),
+    postgresql_using='gist'
+)
+Index(
+    'idx_activities_location_gist',
+    geography_point(Activity.longitude, Activity.latitude),
+    postgresql_using='gist'
+)
+Index(
+    'idx_accommodations_location_gist',
+    geography_point(Accommodation.longitude, Accommodation.latitude),
+    postgresql_using='gist'
+)
+Index(
+    'idx_transportations_departure_gist',
+    geography_point(Transportation.departure_long, Transportation.departure_lat),
+    postgresql_using='gist'
+)
+Index(
+    'idx_transportations_arrival_gist',
+    geography_point(Transportation.arrival_long, Transportation.arrival_lat),
+    postgresql_using='gist'
+)
@@ -2,17 +2,18 @@
 Enhanced database session management with connection pooling, health checks, and monitoring
 """
 
+import asyncio
 import logging
 import time
-from typing import AsyncGenerator, Optional, Dict, Any
+from typing import AsyncGenerator, Optional, Dict, Any, Iterable, List, Sequence
 from urllib.parse import urlparse
 
 from sqlmodel import SQLModel, text
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-from sqlalchemy.pool import QueuePool
 from sqlalchemy.exc import SQLAlchemyError, DisconnectionError
-from sqlalchemy import event
+from sqlalchemy import Row, column, event, insert, table
+from sqlalchemy.orm import ORMExecuteState, Session, raiseload
 
 from app.core.settings import Settings
 from contextlib import asynccontextmanager
@@ -20,6 +21,21 @@ from contextlib import asynccontextmanager
 # Configure logging
 logger = logging.getLogger(__name__)
 
+def raise_on_lazy_load(orm_execute_state: ORMExecuteState) -> None:
+    """
+    do_orm_execute hook that adds raiseload("*", sql_only=True) to top-level
+    ORM SELECTs, so a relationship that was not eager-loaded raises instead of
+    issuing one query per row. Explicit loader options on a path still win.
+    """
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            raiseload("*", sql_only=True)
+        )
+
 class DatabaseManager:
     """Enhanced database manager with connection pooling and health monitoring"""
     
@@ -27,6 +43,7 @@ class DatabaseManager:
         self.settings = Settings()
         self.engine: Optional[AsyncEngine] = None
         self.async_session: Optional[async_sessionmaker] = None
+        self.readonly_session: Optional[async_sessionmaker] = None
         self._connection_stats = {
             "total_connections": 0,
             "active_connections": 0,
@@ -34,6 +51,10 @@ class DatabaseManager:
             "last_health_check": None,
             "health_status": "unknown"
         }
+        # Latest probe result, refreshed by _health_loop so health checks
+        # don't each take a pool slot and a round-trip
+        self._cached_health: Optional[Dict[str, Any]] = None
+        self._health_task: Optional[asyncio.Task] = None
         
     def _prepare_database_url(self) -> str:
         """Prepare and validate database URL"""
@@ -51,11 +72,10 @@ class DatabaseManager:
             logger.error(f"Invalid database URL: {e}")
             raise
         
-        # Convert PostgreSQL URL for async support
-        if database_url.startswith("postgresql://"):
-            async_database_url = database_url.replace(
-                "postgresql://", "postgresql+asyncpg://", 1
-            )
+        # Convert PostgreSQL URL for async support; a sync driver here would
+        # push every query through a threadpool, so always pin asyncpg
+        if parsed.scheme in ("postgres", "postgresql", "postgresql+psycopg2"):
+            async_database_url = "postgresql+asyncpg://" + database_url.split("://", 1)[1]
         elif database_url.startswith("sqlite://"):
             # For SQLite, use aiosqlite
             async_database_url = database_url.replace(
@@ -76,20 +96,32 @@ class DatabaseManager:
             "url": database_url,
             "echo": self.settings.DB_ECHO,
             "future": True,
-            "pool_pre_ping": True,  # Validate connections before use
+            # Off by default: a ping costs a round-trip on every checkout, and
+            # pool_recycle plus TCP keepalives already retire stale connections
+            "pool_pre_ping": self.settings.DB_PRE_PING,
             "pool_recycle": self.settings.DB_POOL_RECYCLE,  # Recycle connections
+            "query_cache_size": self.settings.DB_QUERY_CACHE_SIZE,  # Reuse compiled SQL
         }
         
         # Add connection pooling for PostgreSQL
         if "postgresql" in database_url:
             engine_config.update({
-                # "poolclass": QueuePool,
                 "pool_size": self.settings.DB_POOL_SIZE,
                 "max_overflow": self.settings.DB_MAX_OVERFLOW,
                 "pool_timeout": self.settings.DB_POOL_TIMEOUT,
                 "pool_reset_on_return": "commit",
-                "pool_recycle": self.settings.DB_POOL_RECYCLE,
             })
+            if "+asyncpg" in database_url:
+                engine_config["connect_args"] = {
+                    "timeout": 10,  # Connect timeout in seconds
+                    # Each connection keeps this many server-side prepared
+                    # statements, so repeated queries skip parse and plan; the
+                    # default of 100 is smaller than the app's set of queries
+                    "prepared_statement_cache_size": self.settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+                    # Server-side keepalives notice dead peers and keep idle
+                    # pooled connections alive through NAT and load balancers
+                    "server_settings": {"tcp_keepalives_idle": "60"},
+                }
         
         # Create engine
         engine = create_async_engine(**engine_config)
@@ -97,7 +129,10 @@ class DatabaseManager:
         # Add event listeners for monitoring
         self._setup_event_listeners(engine)
         
-        logger.info(f"Database engine created with pool_size={self.settings.DB_POOL_SIZE}")
+        logger.info(
+            f"Database engine created with pool_size={self.settings.DB_POOL_SIZE}, "
+            f"max_overflow={self.settings.DB_MAX_OVERFLOW}"
+        )
         return engine
     
     def _setup_event_listeners(self, engine: AsyncEngine) -> None:
@@ -133,9 +168,26 @@ class DatabaseManager:
                 autoflush=True,
                 autocommit=False,
             )
+            # Read-only sessions run in AUTOCOMMIT, so a pure read costs no
+            # BEGIN/COMMIT round-trips; the pool restores the isolation level
+            # when the connection is returned
+            self.readonly_session = async_sessionmaker(
+                self.engine.execution_options(isolation_level="AUTOCOMMIT"),
+                class_=AsyncSession,
+                expire_on_commit=False,
+                autoflush=False,
+            )
             
-            # Test initial connection
-            await self.health_check()
+            if self.settings.DB_RAISE_ON_LAZY_LOAD and not event.contains(
+                Session, "do_orm_execute", raise_on_lazy_load
+            ):
+                event.listen(Session, "do_orm_execute", raise_on_lazy_load)
+                logger.warning("Lazy loads will raise (DB_RAISE_ON_LAZY_LOAD is set)")
+            
+            # Test initial connection, then keep the result fresh in the background
+            self._cached_health = await self._probe_health()
+            self._health_task = asyncio.create_task(self._health_loop())
+            await self._check_connection_budget()
             logger.info("Database manager initialized successfully")
             
         except Exception as e:
@@ -143,8 +195,12 @@ class DatabaseManager:
             raise
     
     @asynccontextmanager
-    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
-        """Get database session with enhanced error handling"""
+    async def get_session(self, readonly: bool = False) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Get database session with enhanced error handling.
+        A session holds one connection and runs one query at a time; queries
+        awaited together with asyncio.gather need a session each.
+        """
         if not self.async_session:
             raise RuntimeError("Database manager not initialized")
         
@@ -152,7 +208,7 @@ class DatabaseManager:
         session = None
         
         try:
-            session = self.async_session()
+            session = self.readonly_session() if readonly else self.async_session()
             
             # Log session creation time
             creation_time = time.time() - start_time
@@ -204,7 +260,62 @@ class DatabaseManager:
                 logger.warning("Transaction rolled back due to error")
                 raise
     
-    async def health_check(self) -> Dict[str, Any]:
+    async def _check_connection_budget(self) -> None:
+        """Warn when every worker's full pool would use over 80% of max_connections"""
+        if not self.engine or "postgresql" not in str(self.engine.url):
+            return
+        budget = self.settings.WORKERS * (self.settings.DB_POOL_SIZE + self.settings.DB_MAX_OVERFLOW)
+        try:
+            async with self.engine.connect() as conn:
+                max_connections = int((await conn.execute(text("SHOW max_connections"))).scalar())
+        except Exception as e:
+            logger.warning(f"Could not read max_connections: {e}")
+            return
+        if budget > max_connections * 0.8:
+            logger.warning(
+                f"{self.settings.WORKERS} workers x (pool_size {self.settings.DB_POOL_SIZE} + "
+                f"max_overflow {self.settings.DB_MAX_OVERFLOW}) = {budget} connections, "
+                f"over 80% of the server's max_connections={max_connections}"
+            )
+    
+    async def _health_loop(self) -> None:
+        """Probe the database every DB_HEALTH_INTERVAL seconds and cache the result"""
+        while True:
+            await asyncio.sleep(self.settings.DB_HEALTH_INTERVAL)
+            self._cached_health = await self._probe_health()
+    
+    async def health_check(self, include_pool_stats: bool = False) -> Dict[str, Any]:
+        """
+        Database health, served from the background probe while it is fresh.
+        Falls back to a live probe before initialize() or if the loop has
+        missed a couple of intervals. Pool counters take the pool's lock, so
+        they are only read when include_pool_stats is set.
+        """
+        cached = self._cached_health
+        if not cached or time.time() - cached["timestamp"] >= 2 * self.settings.DB_HEALTH_INTERVAL:
+            cached = self._cached_health = await self._probe_health()
+        
+        if not include_pool_stats:
+            return cached
+        health_info = {**cached, "checks": dict(cached["checks"])}
+        pool_stats = self.get_pool_stats()
+        if pool_stats:
+            health_info["checks"]["connection_pool"] = {"status": "pass", **pool_stats}
+        return health_info
+    
+    def get_pool_stats(self) -> Optional[Dict[str, Any]]:
+        """Current QueuePool counters (PostgreSQL only); each read takes the pool lock"""
+        if not self.engine or "postgresql" not in str(self.engine.url):
+            return None
+        pool = self.engine.pool
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        }
+    
+    async def _probe_health(self) -> Dict[str, Any]:
         """Comprehensive database health check"""
         health_info = {
             "status": "healthy",
@@ -226,18 +337,6 @@ class DatabaseManager:
                 "response_time": f"{connection_time:.3f}s"
             }
             
-            # Check connection pool status (PostgreSQL only)
-            if self.engine and "postgresql" in str(self.engine.url):
-                pool = self.engine.pool
-                health_info["checks"]["connection_pool"] = {
-                    "status": "pass",
-                    "size": pool.size(),
-                    "checked_in": pool.checkedin(),
-                    "checked_out": pool.checkedout(),
-                    "overflow": pool.overflow(),
-                    "invalidated": getattr(pool, "invalidated", None)
-                }
-            
             # Update health status
             self._connection_stats["last_health_check"] = time.time()
             self._connection_stats["health_status"] = "healthy"
@@ -269,28 +368,110 @@ class DatabaseManager:
             logger.error(f"Failed to create database tables: {e}")
             raise
     
+    async def bulk_insert(
+        self,
+        table_name: str,
+        columns: Sequence[str],
+        rows: Iterable[tuple],
+        connection: Optional[AsyncConnection] = None
+    ) -> int:
+        """
+        Load rows into a table in one round-trip: binary COPY on asyncpg, an
+        executemany INSERT on other drivers (aiosqlite in tests).
+        Values go in as-is, so no Python-side column defaults are applied and
+        conflicts fail the whole load. rows is held in memory by the driver;
+        callers should batch it into chunks of about 10k rows.
+        Runs in its own transaction unless a connection is passed, in which case
+        the caller's transaction is used and nothing is committed.
+        Returns the number of rows written.
+        """
+        if connection is not None:
+            return await self._load_rows(connection, table_name, columns, rows)
+        if not self.engine:
+            raise RuntimeError("Database engine not initialized")
+        
+        async with self.engine.begin() as conn:
+            return await self._load_rows(conn, table_name, columns, rows)
+    
+    async def _load_rows(
+        self,
+        conn: AsyncConnection,
+        table_name: str,
+        columns: Sequence[str],
+        rows: Iterable[tuple]
+    ) -> int:
+        if conn.dialect.driver == "asyncpg":
+            raw = await conn.get_raw_connection()
+            status = await raw.driver_connection.copy_records_to_table(
+                table_name, records=rows, columns=list(columns)
+            )
+            count = int(status.split()[-1])  # "COPY <n>"
+        else:
+            params = [dict(zip(columns, row)) for row in rows]
+            if not params:
+                return 0
+            target = table(table_name, *(column(name) for name in columns))
+            await conn.execute(insert(target), params)
+            count = len(params)
+        
+        logger.info(f"Bulk inserted {count} rows into {table_name}")
+        return count
+    
     async def close(self) -> None:
         """Cleanup database connections"""
+        if self._health_task:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+            self._cached_health = None
         if self.engine:
             logger.info("Closing database connections...")
             await self.engine.dispose()
             self.engine = None
             self.async_session = None
+            self.readonly_session = None
             logger.info("Database connections closed")
     
     def get_connection_stats(self) -> Dict[str, Any]:
         """Get current connection statistics"""
         return self._connection_stats.copy()
 
-# Global database manager instance
+# Global database manager instance; the only engine the app creates
 db_manager = DatabaseManager()
 
+# Session context manager on the shared pool, for scripts outside FastAPI
+get_session = db_manager.get_session
+
 # Backward compatibility functions
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Get database session (backward compatibility)"""
     async with db_manager.get_session() as session:
         yield session
 
+async def get_readonly_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get an autocommit session for endpoints that only read.
+    asyncpg cursors need a transaction, so streamed queries must keep get_db_session.
+    """
+    async with db_manager.get_session(readonly=True) as session:
+        yield session
+
+async def fetch_rows_concurrently(*statements) -> List[List[Row]]:
+    """
+    Run independent read statements concurrently, each in its own readonly
+    session, returning their rows in order. A None statement yields no rows.
+    """
+    async def fetch(statement) -> List[Row]:
+        if statement is None:
+            return []
+        async with db_manager.get_session(readonly=True) as session:
+            return (await session.execute(statement)).all()
+
+    return list(await asyncio.gather(*(fetch(statement) for statement in statements)))
+
 async def init_db() -> None:
     """Initialize database (backward compatibility)"""
     if not db_manager.engine:
@@ -303,9 +484,9 @@ def get_engine() -> Optional[AsyncEngine]:
     return db_manager.engine
 
 # Health check function
-async def database_health_check() -> Dict[str, Any]:
+async def database_health_check(include_pool_stats: bool = False) -> Dict[str, Any]:
     """Check database health"""
-    return await db_manager.health_check()
+    return await db_manager.health_check(include_pool_stats=include_pool_stats)
 
 # Connection stats function
 def get_database_stats() -> Dict[str, Any]:
@@ -6,11 +6,12 @@ from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
-from sqlalchemy import create_engine, text
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
-from app.db.session import init_db, get_session
-from app.api import users, itinerary, auth, nlp, recommend
+from app.db.session import db_manager
+from app.api import users, itinerary, auth, nlp, recommend, security, catalog, database
+from app.core.security import benchmark_password_hashing, run_password_hashing
 import structlog
 
 # ============================================================================
@@ -76,6 +77,9 @@ async def lifespan(app: FastAPI):
         raise
         # Don't raise here to allow app to start in degraded mode
     
+    # Measure the password hashing cost on this host so slow logins show up in the logs
+    await run_password_hashing(benchmark_password_hashing)
+    
     yield
     
     # Shutdown
@@ -91,7 +95,8 @@ app = FastAPI(
     title="The Calm Route API",
     description="AI-powered travel itinerary generation service",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add rate limiter to app state
@@ -183,15 +188,12 @@ app.include_router(database.router, prefix=f"{prefix}/database", tags=["database
 
 
 
-# Database connectivity test
-DB_URL = os.getenv("DB_URL", "postgresql://postgres:password@db:5432/traveldb")
-engine = create_engine(DB_URL, echo=False, future=True)
-
+# Database connectivity test, on the shared asyncpg pool
 @app.get("/test-db")
-def test_db():
+async def test_db():
     try:
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        async with db_manager.get_session() as session:
+            await session.execute(text("SELECT 1"))
         return {"db_status": "connected"}
     except SQLAlchemyError as e:
         logger.error(f"Database connection failed: {e}")
@@ -200,14 +202,8 @@ def test_db():
 @app.get("/health")
 async def health_check_detailed():
     """Detailed health check endpoint"""
-    try:
-        # Test database connection
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-        db_status = "healthy"
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        db_status = "unhealthy"
+    # Cached result of the background SELECT 1 probe; no pool slot per call
+    db_status = (await db_manager.health_check())["status"]
     
     # Check ML models availability
     try:
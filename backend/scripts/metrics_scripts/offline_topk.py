@@ -1,27 +1,27 @@
 # scripts/offline_topk.py
-import pickle, numpy as np
+import joblib, numpy as np
 import scipy.sparse as sp
 
 VEC = "models/tfidf_vectorizer_dest.pkl"
 MAT = "models/tfidf_matrix_dest.npz"
-IDM = "models/item_index_map_dest.pkl"
+IDM = "models/item_index_map_dest.npy"
 
 query = "Paris sightseeing and local cuisine"
 limit = 10
 
 
-vectorizer = pickle.load(open(VEC, "rb"))
+vectorizer = joblib.load(VEC)
 M = sp.load_npz(MAT)           # shape: [num_items, num_terms], CSR
-id_map = pickle.load(open(IDM, "rb"))  # dict or list: row_index -> item_id
+id_map = np.load(IDM, mmap_mode="r")  # array: row_index -> item_id
 
-# map matrix row index to item id robustly (supports dict or list)
+# map matrix row index to item id robustly (supports dict, list or array)
 def idx_to_item(i: int):
     i = int(i)
     if isinstance(id_map, dict):
         return id_map.get(i, i)
-    if isinstance(id_map, list):
+    if isinstance(id_map, (list, np.ndarray)):
         try:
-            return id_map[i]
+            return str(id_map[i])
         except Exception:
             return i
     # fallback
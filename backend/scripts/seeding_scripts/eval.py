@@ -146,9 +146,11 @@ class TFIDFRanker(BaseRanker):
     def __init__(self, domain: str = "act"):
         import pickle
         try:
+            import joblib
+            import numpy as np
             import scipy.sparse as sp
         except Exception as e:
-            raise RuntimeError("TF-IDF ranker requires SciPy (scipy.sparse). Please install scipy.") from e
+            raise RuntimeError("TF-IDF ranker requires joblib, NumPy and SciPy. Please install scikit-learn.") from e
         domain_map = {
             "dest": ("tfidf_vectorizer_dest.pkl", "tfidf_matrix_dest.npz", "item_index_map_dest.pkl"),
             "act": ("tfidf_vectorizer_act.pkl", "tfidf_matrix_act.npz", "item_index_map_act.pkl"),
@@ -156,20 +158,24 @@ class TFIDFRanker(BaseRanker):
             "trans": ("tfidf_vectorizer_trans.pkl", "tfidf_matrix_trans.npz", "item_index_map_trans.pkl"),
         }
         vec_file, mat_file, map_file = domain_map[domain]
-        self.vectorizer = pickle.load(open(MODELS_DIR / vec_file, "rb"))
+        # joblib.load reads both joblib dumps and the plain pickles older trainers write
+        self.vectorizer = joblib.load(MODELS_DIR / vec_file)
         self.M = sp.load_npz(MODELS_DIR / mat_file)  # CSR [num_items, num_terms]
-        self.id_map = pickle.load(open(MODELS_DIR / map_file, "rb"))
+        npy_map_file = MODELS_DIR / Path(map_file).with_suffix(".npy")
+        if npy_map_file.exists():
+            self.id_map = np.load(npy_map_file, mmap_mode="r")
+        else:
+            self.id_map = pickle.load(open(MODELS_DIR / map_file, "rb"))
 
     def _idx_to_id(self, i: int) -> str:
         i = int(i)
         if isinstance(self.id_map, dict):
             return str(self.id_map.get(i, i))
-        if isinstance(self.id_map, list):
-            try:
-                return str(self.id_map[i])
-            except Exception:
-                return str(i)
-        return str(i)
+        # list or numpy array
+        try:
+            return str(self.id_map[i])
+        except Exception:
+            return str(i)
 
     def rank(self, prompt_text: str, candidates: List[Candidate]) -> List[str]:
         # The TF-IDF artifacts are already item-level; ignore candidates' text and return IDs from the model space
@@ -19,6 +19,7 @@ from dataclasses import dataclass
 from sqlmodel import SQLModel
 from sqlalchemy.exc import SQLAlchemyError
 from app.db.session import init_db, get_engine, get_db_session
+from app.db.crud import copy_catalog_rows
 from app.db.models import (
     Destination,
     Activity,
@@ -183,6 +184,7 @@ class CatalogSeeder:
         logger.info("🌍 Seeding destinations...")
         
         try:
+            rows = []
             dest_file = BASE_DIR / "destination.csv"
             with open(dest_file, newline="", encoding="utf-8") as f:
                 reader = csv.DictReader(f)
@@ -209,13 +211,7 @@ class CatalogSeeder:
                         if not self.validator.validate_coordinates(lat, lon, row_id):
                             continue
                         
-                        # Check for duplicates
                         dest_id = UUID(row_id)
-                        exists = await session.get(Destination, dest_id)
-                        if exists:
-                            self.seeding_stats["destinations"]["errors"] += 1
-                            logger.debug(f"Destination {row.get('name')} already exists")
-                            continue
                         
                         # Parse additional fields
                         images = self.validator.parse_json_array(row.get("images", ""), "images", row_id)
@@ -247,15 +243,19 @@ class CatalogSeeder:
                             popularity_score=popularity_score,
                         )
                         
-                        session.add(destination)
-                        self.seeding_stats["destinations"]["added"] += 1
-                        logger.debug(f"Added destination: {row.get('name')}")
+                        rows.append(destination)
                         
                     except Exception as e:
                         self.seeding_stats["destinations"]["errors"] += 1
                         logger.error(f"Error processing destination row {row_id}: {e}")
                         continue
             
+            # One COPY per category; ids that were already seeded are skipped
+            added = await copy_catalog_rows(session, Destination, rows)
+            self.seeding_stats["destinations"]["added"] += added
+            self.seeding_stats["destinations"]["errors"] += len(rows) - added
+            logger.debug(f"Added {added} destinations")
+            
             return True
             
         except Exception as e:
@@ -267,6 +267,7 @@ class CatalogSeeder:
         logger.info("🎯 Seeding activities...")
         
         try:
+            rows = []
             act_file = BASE_DIR / "activities.csv"
             with open(act_file, newline="", encoding="utf-8") as f:
                 reader = csv.DictReader(f)
@@ -293,13 +294,7 @@ class CatalogSeeder:
                         if not self.validator.validate_coordinates(lat, lon, row_id):
                             continue
                         
-                        # Check for duplicates
                         act_id = UUID(row_id)
-                        exists = await session.get(Activity, act_id)
-                        if exists:
-                            self.seeding_stats["activities"]["errors"] += 1
-                            logger.debug(f"Activity {row.get('name')} already exists")
-                            continue
                         
                         # Parse additional fields
                         images = self.validator.parse_json_array(row.get("images", ""), "images", row_id)
@@ -332,15 +327,19 @@ class CatalogSeeder:
                             accessibility_info=row.get("accessibility_info") or None,
                         )
                         
-                        session.add(activity)
-                        self.seeding_stats["activities"]["added"] += 1
-                        logger.debug(f"Added activity: {row.get('name')}")
+                        rows.append(activity)
                         
                     except Exception as e:
                         self.seeding_stats["activities"]["errors"] += 1
                         logger.error(f"Error processing activity row {row_id}: {e}")
                         continue
             
+            # One COPY per category; ids that were already seeded are skipped
+            added = await copy_catalog_rows(session, Activity, rows)
+            self.seeding_stats["activities"]["added"] += added
+            self.seeding_stats["activities"]["errors"] += len(rows) - added
+            logger.debug(f"Added {added} activities")
+            
             return True
             
         except Exception as e:
@@ -352,6 +351,7 @@ class CatalogSeeder:
         logger.info("🏨 Seeding accommodations...")
         
         try:
+            rows = []
             acc_file = BASE_DIR / "accomodation.csv"
             with open(acc_file, newline="", encoding="utf-8") as f:
                 reader = csv.DictReader(f)
@@ -378,13 +378,7 @@ class CatalogSeeder:
                         if not self.validator.validate_coordinates(lat, lon, row_id):
                             continue
                         
-                        # Check for duplicates
                         acc_id = UUID(row_id)
-                        exists = await session.get(Accommodation, acc_id)
-                        if exists:
-                            self.seeding_stats["accommodations"]["errors"] += 1
-                            logger.debug(f"Accommodation {row.get('name')} already exists")
-                            continue
                         
                         # Parse additional fields
                         images = self.validator.parse_json_array(row.get("images", ""), "images", row_id)
@@ -433,15 +427,19 @@ class CatalogSeeder:
                             contact_info=contact_info,
                         )
                         
-                        session.add(accommodation)
-                        self.seeding_stats["accommodations"]["added"] += 1
-                        logger.debug(f"Added accommodation: {row.get('name')}")
+                        rows.append(accommodation)
                         
                     except Exception as e:
                         self.seeding_stats["accommodations"]["errors"] += 1
                         logger.error(f"Error processing accommodation row {row_id}: {e}")
                         continue
             
+            # One COPY per category; ids that were already seeded are skipped
+            added = await copy_catalog_rows(session, Accommodation, rows)
+            self.seeding_stats["accommodations"]["added"] += added
+            self.seeding_stats["accommodations"]["errors"] += len(rows) - added
+            logger.debug(f"Added {added} accommodations")
+            
             return True
             
         except Exception as e:
@@ -453,6 +451,7 @@ class CatalogSeeder:
         logger.info("🚗 Seeding transportations...")
         
         try:
+            rows = []
             trans_file = BASE_DIR / "transport.csv"
             with open(trans_file, newline="", encoding="utf-8") as f:
                 reader = csv.DictReader(f)
@@ -485,13 +484,7 @@ class CatalogSeeder:
                         ]):
                             continue
                         
-                        # Check for duplicates
                         tr_id = UUID(row_id)
-                        exists = await session.get(Transportation, tr_id)
-                        if exists:
-                            self.seeding_stats["transportations"]["errors"] += 1
-                            logger.debug(f"Transportation {row_id} already exists")
-                            continue
                         
                         # Parse datetime fields
                         try:
@@ -540,15 +533,19 @@ class CatalogSeeder:
                             capacity=capacity,
                         )
                         
-                        session.add(transportation)
-                        self.seeding_stats["transportations"]["added"] += 1
-                        logger.debug(f"Added transportation: {row_id}")
+                        rows.append(transportation)
                         
                     except Exception as e:
                         self.seeding_stats["transportations"]["errors"] += 1
                         logger.error(f"Error processing transportation row {row_id}: {e}")
                         continue
             
+            # One COPY per category; ids that were already seeded are skipped
+            added = await copy_catalog_rows(session, Transportation, rows)
+            self.seeding_stats["transportations"]["added"] += added
+            self.seeding_stats["transportations"]["errors"] += len(rows) - added
+            logger.debug(f"Added {added} transportations")
+            
             return True
             
         except Exception as e:
@@ -72,24 +72,19 @@ class TrainingPipeline:
                 ]
             ),
             TrainingJob(
-                name="destinations",
-                script_path="app/core/recommender/train_tfidf_dest.py",
-                description="TF-IDF model for destination recommendations",
+                name="destinations_transportation",
+                script_path="app/core/recommender/train_all.py",
+                description="TF-IDF models for destination and transportation recommendations, trained concurrently",
                 expected_files=[
                     "tfidf_vectorizer_dest.pkl",
                     "tfidf_matrix_dest.npz",
-                    "item_index_map_dest.pkl",
-                    "training_metadata_dest.pkl"
-                ]
-            ),
-            TrainingJob(
-                name="transportation",
-                script_path="app/core/recommender/train_tfidf_trans.py",
-                description="TF-IDF model for transportation recommendations",
-                expected_files=[
+                    "tfidf_matrix_dest_T.npz",
+                    "item_index_map_dest.npy",
+                    "training_metadata_dest.pkl",
                     "tfidf_vectorizer_trans.pkl",
                     "tfidf_matrix_trans.npz",
-                    "item_index_map_trans.pkl",
+                    "tfidf_matrix_trans_T.npz",
+                    "item_index_map_trans.npy",
                     "training_metadata_trans.pkl"
                 ]
             )
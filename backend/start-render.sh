@@ -132,20 +132,22 @@ if [ ! -f "/app/models/tfidf_vectorizer_dest.pkl" ]; then
     echo "📦 ML models not found - building now (this takes ~5 minutes on first run)..."
     python -c "
 import sys
+import asyncio
 sys.path.insert(0, '/app')
-try:
-    from app.core.recommender.train_tfidf_dest import main as train_dest
+
+async def train_models():
+    from app.core.recommender.train_all import main as train_dest_trans
     from app.core.recommender.train_tfidf_act import main as train_act
     from app.core.recommender.train_tfidf_acc import main as train_acc
-    from app.core.recommender.train_tfidf_trans import main as train_trans
-    print('Training destination model...')
-    train_dest()
+    print('Training destination and transportation models...')
+    await train_dest_trans()
     print('Training activity model...')
-    train_act()
+    await train_act()
     print('Training accommodation model...')
-    train_acc()
-    print('Training transportation model...')
-    train_trans()
+    await train_acc()
+
+try:
+    asyncio.run(train_models())
     print('✅ ML models built successfully!')
 except Exception as e:
     print(f'⚠️  Model training failed: {e}')
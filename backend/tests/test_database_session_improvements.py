@@ -115,7 +115,7 @@ def test_engine_configuration():
             call_args = mock_create_engine.call_args[1]
             
             assert call_args['echo'] is True
-            assert call_args['pool_pre_ping'] is True
+            assert call_args['pool_pre_ping'] is False  # opt-in via DB_PRE_PING
             assert call_args['pool_recycle'] == 1800
             assert 'poolclass' in call_args
             assert call_args['pool_size'] == 5
@@ -388,6 +388,87 @@ def test_backward_compatibility():
         assert engine == 'mock_engine'
         print("✅ get_engine returns manager engine")
 
+def test_raise_on_lazy_load_hook():
+    """Test that the lazy-load guard turns an N+1 access into an error"""
+    try:
+        from sqlalchemy import ForeignKey, create_engine, event, select
+        from sqlalchemy.orm import (
+            DeclarativeBase, Mapped, Session, mapped_column, relationship, selectinload
+        )
+        from app.db.session import raise_on_lazy_load
+    except ImportError:
+        pytest.skip("Database components not available")
+
+    print("\n=== Testing Lazy Load Guard ===")
+
+    class Base(DeclarativeBase):
+        pass
+
+    class Parent(Base):
+        __tablename__ = "parents"
+        id: Mapped[int] = mapped_column(primary_key=True)
+        children = relationship("Child", back_populates="parent")
+
+    class Child(Base):
+        __tablename__ = "children"
+        id: Mapped[int] = mapped_column(primary_key=True)
+        parent_id: Mapped[int] = mapped_column(ForeignKey("parents.id"))
+        parent = relationship("Parent", back_populates="children")
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Parent(id=1), Child(id=1, parent_id=1), Child(id=2, parent_id=1)])
+        session.commit()
+
+    event.listen(Session, "do_orm_execute", raise_on_lazy_load)
+    try:
+        # Eager-loaded paths, and parents already in the identity map, still load
+        with Session(engine) as session:
+            parent = session.execute(
+                select(Parent).options(selectinload(Parent.children))
+            ).scalar_one()
+            assert [child.parent.id for child in parent.children] == [1, 1]
+        print("✅ Eager-loaded relationships are unaffected")
+
+        # A relationship nobody asked for raises instead of querying per row
+        with Session(engine) as session:
+            parent = session.execute(select(Parent)).scalar_one()
+            with pytest.raises(Exception):
+                parent.children
+        print("✅ Unplanned lazy load raises")
+    finally:
+        event.remove(Session, "do_orm_execute", raise_on_lazy_load)
+
+@pytest.mark.asyncio
+async def test_bulk_insert_on_caller_connection():
+    """Test that bulk_insert COPYs through a connection the caller passes in"""
+    if not DATABASE_AVAILABLE:
+        pytest.skip("Database components not available")
+    
+    print("\n=== Testing Bulk Insert On A Caller Connection ===")
+    
+    manager = DatabaseManager()
+    raw = Mock()
+    raw.driver_connection.copy_records_to_table = AsyncMock(return_value="COPY 2")
+    connection = Mock()
+    connection.dialect.driver = "asyncpg"
+    connection.get_raw_connection = AsyncMock(return_value=raw)
+    rows = [(1, "a"), (2, "b")]
+    
+    # No engine is needed; the caller's connection and transaction are used
+    count = await manager.bulk_insert("_copy_destinations", ["id", "name"], rows, connection=connection)
+    
+    assert count == 2
+    raw.driver_connection.copy_records_to_table.assert_awaited_once_with(
+        "_copy_destinations", records=rows, columns=["id", "name"]
+    )
+    print("✅ Rows are copied on the caller's connection")
+    
+    with pytest.raises(RuntimeError):
+        await manager.bulk_insert("destinations", ["id"], rows)
+    print("✅ Without a connection an initialized engine is required")
+
 def run_database_improvements_demo():
     """Run a comprehensive database improvements demo"""
     print("\n" + "="*60)
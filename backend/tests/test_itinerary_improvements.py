@@ -108,6 +108,73 @@ class TestItineraryImprovements:
         assert hasattr(service, 'create_itinerary_schedule')
         assert hasattr(service, 'persist_itinerary')
     
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("owner, expected_status", [
+        ("missing", 404),
+        ("other", 403),
+        ("self", 500),
+    ])
+    async def test_owner_scoped_write_errors(self, owner, expected_status):
+        """Failed PATCH/DELETE writes map to 404, 403 or 500 by the row's owner."""
+        from uuid import uuid4
+        from fastapi import HTTPException
+        from app.api import itinerary
+        from app.api.schemas import ItineraryUpdate
+        from app.db.models import ItineraryStatus
+        
+        current_user = Mock(id=uuid4())
+        owner_id = {"missing": None, "other": uuid4(), "self": current_user.id}[owner]
+        itinerary_id = uuid4()
+        session = AsyncMock()
+        
+        with patch.object(itinerary, "update_itinerary_status", AsyncMock(return_value=None)) as update, \
+             patch.object(itinerary, "soft_delete_itinerary", AsyncMock(return_value=False)) as delete, \
+             patch.object(itinerary, "get_itinerary_owner_id", AsyncMock(return_value=owner_id)):
+            # __wrapped__ skips the rate limiter, which needs a real request
+            with pytest.raises(HTTPException) as patch_error:
+                await itinerary.patch_itinerary_status.__wrapped__(
+                    Mock(), itinerary_id, ItineraryUpdate(status=ItineraryStatus.BOOKED),
+                    current_user=current_user, session=session
+                )
+            with pytest.raises(HTTPException) as delete_error:
+                await itinerary.remove_itinerary.__wrapped__(
+                    Mock(), itinerary_id, current_user=current_user, session=session
+                )
+        
+        assert patch_error.value.status_code == expected_status
+        assert delete_error.value.status_code == expected_status
+        # The write itself is scoped to the caller
+        update.assert_awaited_once_with(
+            session, itinerary_id, ItineraryStatus.BOOKED, owner_id=current_user.id
+        )
+        delete.assert_awaited_once_with(session, itinerary_id, owner_id=current_user.id)
+    
+    @pytest.mark.asyncio
+    async def test_owner_scoped_write_success(self):
+        """Successful PATCH/DELETE writes never look up the owner."""
+        from uuid import uuid4
+        from app.api import itinerary
+        from app.api.schemas import ItineraryUpdate
+        from app.db.models import ItineraryStatus
+        
+        current_user = Mock(id=uuid4())
+        updated = Mock()
+        
+        with patch.object(itinerary, "update_itinerary_status", AsyncMock(return_value=updated)), \
+             patch.object(itinerary, "soft_delete_itinerary", AsyncMock(return_value=True)), \
+             patch.object(itinerary, "get_itinerary_owner_id", AsyncMock()) as owner_lookup:
+            result = await itinerary.patch_itinerary_status.__wrapped__(
+                Mock(), uuid4(), ItineraryUpdate(status=ItineraryStatus.BOOKED),
+                current_user=current_user, session=AsyncMock()
+            )
+            response = await itinerary.remove_itinerary.__wrapped__(
+                Mock(), uuid4(), current_user=current_user, session=AsyncMock()
+            )
+        
+        assert result is updated
+        assert response.status_code == 204
+        owner_lookup.assert_not_awaited()
+    
     def test_logging_configuration(self):
         """Test that logging is properly configured."""
         import logging
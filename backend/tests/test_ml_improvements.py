@@ -6,6 +6,7 @@ Demonstrates and tests the enhanced ML training features
 import pytest
 import asyncio
 import pickle
+import re
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 from datetime import datetime
@@ -51,13 +52,15 @@ def test_training_config():
     
     # Test destination config
     dest_config = DestinationTrainingConfig()
-    print(f"Destination config: max_features={dest_config.max_features}")
-    assert dest_config.max_features == 5000
+    print(f"Destination config: n_features={dest_config.n_features}")
+    assert dest_config.n_features == 2 ** 14
+    assert not hasattr(dest_config, "max_features")
     
     # Test transportation config
     trans_config = TransportationTrainingConfig()
-    print(f"Transportation config: max_features={trans_config.max_features}")
-    assert trans_config.max_features == 100
+    print(f"Transportation config: n_features={trans_config.n_features}")
+    assert trans_config.n_features == 2 ** 10
+    assert not hasattr(trans_config, "max_features")
 
 def test_text_preprocessor():
     """Test enhanced text preprocessing"""
@@ -91,6 +94,43 @@ def test_text_preprocessor():
     assert "rejected_short" in stats
     assert "rejected_long" in stats
 
+def _reference_clean(text, config):
+    """The regex cleaner the translate-table cleaners replaced"""
+    text = re.sub(r"[^a-z0-9\s\-\.\,\!\?]", " ", str(text).lower())
+    text = re.sub(r"\s+", " ", text).strip()
+    if not config.min_text_length <= len(text) <= config.max_text_length:
+        return None
+    return text
+
+def test_clean_batch_matches_reference_cleaner():
+    """clean() and clean_batch() give the old regex cleaner's output and stats"""
+    if not ML_IMPROVEMENTS_AVAILABLE:
+        pytest.skip("ML improvements not available")
+    from app.core.recommender import train_tfidf_dest, train_tfidf_trans
+    
+    print("\n=== Testing Batch Cleaning ===")
+    
+    texts = [
+        "Paris, France!  The City of Light?",
+        "CAFÉ déjà-vu\tin\nSÃO Paulo",
+        "",
+        "İstanbul Straße \u2014 5 \u212aelvin\u00a0bridge",
+        "bus",
+        "  ...Tabs\t\tand---dots...  ",
+        "日本 東京 tokyo tower",
+        "x" * 10001,
+    ]
+    for module in (train_tfidf_dest, train_tfidf_trans):
+        config = module.TrainingConfig()
+        expected = [_reference_clean(text, config) if text else None for text in texts]
+        
+        single = module.TextPreprocessor(config)
+        batch = module.TextPreprocessor(config)
+        assert [single.clean(text) for text in texts] == expected
+        assert batch.clean_batch(texts) == expected
+        assert batch.get_stats() == single.get_stats()
+        print(f"✅ {module.__name__} cleaners match the regex cleaner")
+
 def test_corpus_builder_structure():
     """Test corpus builder class structure"""
     if not ML_IMPROVEMENTS_AVAILABLE:
@@ -146,6 +186,41 @@ def test_tfidf_trainer_structure():
     print(f"Vectorizer created: {type(vectorizer)}")
     assert vectorizer is not None
 
+@pytest.mark.asyncio
+async def test_streaming_trainer_consumes_batches_as_fetched(tmp_path):
+    """Hashing trainers read batches from an async fetch through a bounded queue"""
+    if not ML_IMPROVEMENTS_AVAILABLE:
+        pytest.skip("ML improvements not available")
+    from app.core.recommender import train_tfidf_dest
+    
+    print("\n=== Testing Streaming Trainer ===")
+    
+    config = DestinationTrainingConfig(n_jobs=1, queue_batches=1)
+    trainer = train_tfidf_dest.TFIDFTrainer(config, tmp_path)
+    
+    async def batches():
+        for start in range(0, 9, 3):
+            yield [(f"id-{i}", f"coastal town number {i} with beaches") for i in range(start, start + 3)]
+    
+    assert await trainer.train(batches())
+    assert trainer.ids == [f"id-{i}" for i in range(9)]
+    assert trainer.matrix.shape == (9, config.n_features)
+    print("✅ Batches streamed into the trainer in row order")
+    
+    async def failing():
+        yield [("id-0", "coastal town with beaches")]
+        raise RuntimeError("connection lost")
+    
+    assert not await trainer.train(failing())
+    
+    async def empty():
+        return
+        yield
+    
+    assert not await trainer.train(empty())
+    assert trainer.ids == []
+    print("✅ Fetch errors and empty corpora fail training")
+
 def test_corpus_validation():
     """Test corpus validation logic"""
     if not ML_IMPROVEMENTS_AVAILABLE:
@@ -4,8 +4,9 @@ Demonstrates and tests the enhanced models with validation, constraints, and new
 """
 
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 from pydantic import ValidationError
 
@@ -88,7 +89,8 @@ def test_itinerary_model_improvements():
     print(f"✅ Valid itinerary created: {itinerary.name}")
     assert itinerary.name == "Paris Adventure"
     assert itinerary.status == ItineraryStatus.DRAFT
-    assert itinerary.duration_days == 7
+    # Generated by Postgres on insert, so unset on an unsaved object
+    assert itinerary.duration_days is None
     assert itinerary.is_active is True
     
     # Test date validation
@@ -114,6 +116,98 @@ def test_itinerary_model_improvements():
         )
     print("✅ Name validation working")
 
+def test_itinerary_insert_values():
+    """Core INSERT values carry table columns only, leaving generated ones to Postgres"""
+    if not MODELS_AVAILABLE:
+        pytest.skip("Models not available")
+    from sqlalchemy import insert
+    from sqlalchemy.dialects import postgresql
+    from app.db.crud import _insert_values
+    
+    start_date = datetime.now(timezone.utc) + timedelta(days=1)
+    itinerary = Itinerary(
+        name="Paris Adventure",
+        start_date=start_date,
+        end_date=start_date + timedelta(days=7),
+        data={},
+        user_id=uuid4()
+    )
+    values = _insert_values(itinerary)
+    # is_active is a computed field, duration_days a generated column and id a
+    # server default
+    assert not {"is_active", "duration_days", "id"} & values.keys()
+    assert values["name"] == "Paris Adventure"
+    
+    sql = str(insert(Itinerary).values(**values).compile(dialect=postgresql.dialect()))
+    assert "is_active" not in sql
+    assert "duration_days" not in sql
+    print("✅ Itinerary INSERT values compile without computed fields")
+
+@pytest.mark.asyncio
+async def test_create_user_conflict():
+    """create_user inserts with ON CONFLICT DO NOTHING and maps a skipped row to 400"""
+    if not MODELS_AVAILABLE:
+        pytest.skip("Models not available")
+    from fastapi import HTTPException
+    from sqlalchemy.dialects import postgresql
+    from app.db.crud import create_user
+    
+    session = AsyncMock()
+    session.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=None))
+    
+    with pytest.raises(HTTPException) as exc_info:
+        await create_user(session, "taken", "taken@example.com", "hash")
+    
+    assert exc_info.value.status_code == 400
+    session.rollback.assert_awaited_once()
+    session.commit.assert_not_awaited()
+    
+    stmt = session.execute.await_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT DO NOTHING" in sql
+    assert "RETURNING" in sql
+    print("✅ Duplicate username/email returns 400 without a pre-check SELECT")
+    
+    user = User(username="fresh", email="fresh@example.com", password_hash="hash")
+    session = AsyncMock()
+    session.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=user))
+    assert await create_user(session, "fresh", "fresh@example.com", "hash") is user
+    session.commit.assert_awaited_once()
+    session.rollback.assert_not_awaited()
+    print("✅ New user is committed in the same round-trip")
+
+def test_itinerary_bookings_json_order():
+    """The bookings JSON array is ordered inside json_agg, not by the subquery"""
+    if not MODELS_AVAILABLE:
+        pytest.skip("Models not available")
+    from sqlalchemy.dialects import postgresql
+    from app.db.crud import _ITINERARY_BOOKINGS_JSON
+    
+    sql = str(_ITINERARY_BOOKINGS_JSON.compile(dialect=postgresql.dialect()))
+    assert "json_agg(booking ORDER BY booking.booking_date DESC)" in sql
+    print("✅ Bookings are aggregated newest first")
+
+def test_generated_duration_columns():
+    """duration_days / duration_hours are stored generated columns in the DDL"""
+    if not MODELS_AVAILABLE:
+        pytest.skip("Models not available")
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateTable
+    
+    dialect = postgresql.dialect()
+    itineraries = str(CreateTable(Itinerary.__table__).compile(dialect=dialect))
+    assert (
+        "duration_days INTEGER GENERATED ALWAYS AS "
+        "(CAST(EXTRACT(DAY FROM end_date - start_date) AS integer)) STORED"
+    ) in itineraries
+    
+    transportations = str(CreateTable(Transportation.__table__).compile(dialect=dialect))
+    assert (
+        "duration_hours FLOAT GENERATED ALWAYS AS "
+        "(CAST(EXTRACT(EPOCH FROM arrival_time - departure_time) / 3600 AS double precision)) STORED"
+    ) in transportations
+    print("✅ Generated duration columns compile to stored expressions")
+
 def test_destination_model_improvements():
     """Test Destination model improvements"""
     if not MODELS_AVAILABLE:
@@ -271,11 +365,8 @@ def test_transportation_model_improvements():
     assert transportation.type == "flight"
     assert transportation.price == Decimal("500.00")
     assert transportation.provider == "Air France"
-    assert transportation.duration_hours == 2.0
-    
-    # Test duration calculation
-    assert transportation.duration_hours == 2.0
-    print("✅ Duration calculation working")
+    # Generated by Postgres on insert, so unset on an unsaved object
+    assert transportation.duration_hours is None
     
     # Test type validation
     with pytest.raises(ValidationError):
@@ -489,6 +580,29 @@ def test_constraints_and_indexes():
         assert hasattr(model, '__table_args__')
         print(f"✅ {model.__name__} has table constraints")
 
+def test_geography_index_matches_queries():
+    """Radius queries and the GiST indexes use the same geography expression"""
+    if not MODELS_AVAILABLE:
+        pytest.skip("Models not available")
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex
+    from app.db.models import geography_point
+    
+    dialect = postgresql.dialect()
+    index = next(
+        index for index in Destination.__table__.indexes
+        if index.name == "idx_destinations_location_gist"
+    )
+    # Same text as migration 0a6d2e9b7c31 builds the index with
+    assert "geography(ST_SetSRID(ST_MakePoint(longitude, latitude), 4326))" in str(
+        CreateIndex(index).compile(dialect=dialect)
+    )
+    query = geography_point(Destination.longitude, Destination.latitude)
+    assert str(query.compile(dialect=dialect)) == (
+        "geography(ST_SetSRID(ST_MakePoint(destinations.longitude, destinations.latitude), 4326))"
+    )
+    print("✅ Geography index expression matches the query expression")
+
 def test_enum_improvements():
     """Test enum improvements"""
     if not MODELS_AVAILABLE:
@@ -558,7 +672,7 @@ def run_models_demo():
     print("\n🚀 NEW FEATURES:")
     print("• BaseModel with audit fields (created_at, updated_at, is_deleted)")
     print("• Status enums for better state management")
-    print("• Computed fields (duration_days, is_active, duration_hours)")
+    print("• Computed fields (is_active)")
     print("• Enhanced junction tables with notes and scheduling")
     print("• Comprehensive validation for all data types")
     print("• Database constraints for data integrity")
@@ -172,7 +172,8 @@ def test_itinerary_management_workflow():
     # Test itinerary validation
     assert itinerary.name == "Paris Adventure 2024"
     assert itinerary.status == ItineraryStatus.DRAFT
-    assert itinerary.duration_days == 7
+    # Generated by Postgres on insert, so unset on an unsaved object
+    assert itinerary.duration_days is None
     assert itinerary.budget == Decimal("2500.00")
     assert "romantic" in itinerary.tags
     assert itinerary.is_active is True
@@ -190,7 +191,6 @@ def test_itinerary_management_workflow():
     print("✅ Itinerary update functionality working")
     
     # Test computed fields
-    assert itinerary.duration_days == 7
     assert itinerary.is_active is True
     print("✅ Computed fields working")
 
@@ -309,7 +309,8 @@ def test_catalog_management_workflow():
     assert destination.rating >= 0 and destination.rating <= 5
     assert activity.price >= 0
     assert accommodation.star_rating >= 1 and accommodation.star_rating <= 5
-    assert transportation.duration_hours == 2.0
+    # Generated by Postgres on insert, so unset on an unsaved object
+    assert transportation.duration_hours is None
     print("✅ All catalog items validation working")
 
 def test_booking_management_workflow():
@@ -554,6 +555,24 @@ def test_junction_tables_workflow():
     assert trans_link.passenger_count > 0
     print("✅ Junction tables validation working")
 
+def test_username_schema_normalization():
+    """UserCreate/UserUpdate usernames match users.check_username_charset"""
+    if not MODELS_AVAILABLE:
+        pytest.skip("Models not available")
+    
+    print("\n=== Testing Username Normalization ===")
+    
+    user = UserCreate(username="  JohnDoe_1 ", email="john@example.com", password="Secret123")
+    assert user.username == "johndoe_1"
+    with pytest.raises(ValueError):
+        UserCreate(username="john.doe", email="john@example.com", password="Secret123")
+    
+    assert UserUpdate(email="john@example.com").username is None
+    assert UserUpdate(username="Jane_Doe").username == "jane_doe"
+    with pytest.raises(ValueError):
+        UserUpdate(username="jane doe")
+    print("✅ Usernames are normalized before they reach the CHECK constraint")
+
 def run_integration_demo():
     """Run a comprehensive integration demo"""
     print("\n" + "="*60)
@@ -3,10 +3,14 @@ Test file for security improvements
 Demonstrates and tests the enhanced security features
 """
 
+import math
 import pytest
 import asyncio
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime, timedelta
+from uuid import uuid4
+
+from fastapi import HTTPException
 
 # Import security functions
 from app.core.security import (
@@ -17,7 +21,9 @@ from app.core.security import (
     create_access_token,
     create_refresh_token,
     blacklist_token,
-    is_token_blacklisted
+    is_token_blacklisted,
+    token_blacklist,
+    _user_id_from_access_token,
 )
 
 def test_password_validation():
@@ -130,6 +136,88 @@ async def test_security_service():
     assert result is True
     assert is_token_blacklisted(test_token)
 
+@pytest.mark.asyncio
+async def test_logged_out_token_is_rejected():
+    """A token revoked by /auth/logout no longer authenticates"""
+    from app.api.auth import logout
+    
+    user_id = str(uuid4())
+    token = create_access_token({"sub": user_id})
+    assert _user_id_from_access_token(token) == user_id
+    
+    current_user = Mock(username="testuser", id=user_id)
+    await logout(request=Mock(client=None), current_user=current_user, token=token)
+    
+    with pytest.raises(HTTPException) as exc_info:
+        _user_id_from_access_token(token)
+    assert exc_info.value.status_code == 401
+    # Revoked tokens must never be evicted before they expire
+    assert token_blacklist.maxsize == math.inf
+
+@pytest.mark.asyncio
+async def test_current_user_is_read_per_request():
+    """Every request resolves the user with one primary key lookup"""
+    from app.core.security import get_current_user
+    from app.db.models import User
+    
+    user_id = uuid4()
+    user = User(id=user_id, username="testuser", email="test@example.com", password_hash="hash")
+    token = create_access_token({"sub": str(user_id)})
+    session = AsyncMock()
+    session.get.return_value = user
+    
+    assert await get_current_user(token=token, session=session) is user
+    assert await get_current_user(token=token, session=session) is user
+    assert session.get.await_count == 2
+    assert session.get.await_args.args == (User, user_id)
+    
+    # A user deleted since the token was issued no longer authenticates
+    session.get.return_value = None
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user(token=token, session=session)
+    assert exc_info.value.status_code == 401
+    print("✅ Current user is looked up by primary key on every request")
+
+@pytest.mark.asyncio
+async def test_bcrypt_hash_upgraded_on_login():
+    """A legacy bcrypt hash verifies once and is replaced with argon2id"""
+    import bcrypt
+    from app.core.security import authenticate_user, verify_and_update_password
+    from app.db.models import User
+    
+    legacy_hash = bcrypt.hashpw(b"Secret123!", bcrypt.gensalt(rounds=4)).decode()
+    user = User(id=uuid4(), username="legacy", email="legacy@example.com", password_hash=legacy_hash)
+    session = AsyncMock()
+    session.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=user))
+    
+    assert await authenticate_user("legacy", "Secret123!", session) is user
+    assert user.password_hash.startswith("$argon2id$")
+    session.commit.assert_awaited_once()
+    print("✅ bcrypt hash replaced with argon2id on login")
+    
+    # The upgraded hash is current, so the next login writes nothing
+    assert verify_and_update_password("Secret123!", user.password_hash) == (True, None)
+    assert verify_and_update_password("wrong", legacy_hash) == (False, None)
+    print("✅ Upgraded hash verifies without another rehash")
+
+@pytest.mark.asyncio
+async def test_login_lookup_uses_one_unique_key():
+    """Logins look up either the email or the username, never both"""
+    from sqlalchemy.dialects import postgresql
+    from app.core.security import authenticate_user
+    
+    session = AsyncMock()
+    session.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=None))
+    
+    assert await authenticate_user(" Jane@Example.com ", "Secret123!", session) is None
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "users.email =" in sql and "users.username =" not in sql
+    
+    assert await authenticate_user("jane_doe", "Secret123!", session) is None
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "users.username =" in sql and "users.email =" not in sql
+    print("✅ Login lookup hits a single unique index")
+
 def test_token_type_validation():
     """Test token type validation in JWT tokens"""
     print("\n=== Testing Token Type Validation ===")